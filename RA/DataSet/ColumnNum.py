@@ -1,7 +1,7 @@
 import math
 import pandas as pd
 from typing import List, Any
-from RA.DataSet.ColumnType import *
+from RA.DataSet.enum_column_type import *
 
 
 class ColumnNum:
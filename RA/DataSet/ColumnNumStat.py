@@ -1,22 +1,39 @@
 from prettytable import PrettyTable
-from RA.DataSet.ColumnType import *
+from RA.DataSet.enum_column_type import *
+from RA.DataSet.column_type_inference import *
 from RA.DataSet.ColumnNumStatExt import *
 
 
 class ColumnNumStat:
     def __init__(self,
                  column_name: str,
-                 values: list,
+                 values: pd.Series or np.ndarray or list,
                  extended: bool,
-                 categorical: float = 0.15) -> None:
+                 categorical: float = 0.15,
+                 column_type: ColumnType = None,
+                 bins: int = None) -> None:
+        """
+        This method init a class work
+        :param column_name: The name of DataSet column
+        :param values: Values from column
+        :param extended: Param switched between simple or extended statistics
+        :param categorical: The share of unique values, below which the column is considered categorical
+        :param column_type: The type of column, which was already learned by DataSet (None - learn it here)
+        :param bins: The count of bins of extended values distribution (None - choose automatically)
+        """
         self.__column_name = column_name
         self.__is_extended = extended
-        self.__count = len(values)  # Указываем явно, потому что этот класс не должен хранить все значения с колонки
-        self.__count_unique = len(list(set(values)))
-        self.__field_type = self.__get_column_type(values=values)
+        self.__categorical = categorical
+        self.__bins = bins
+        self.__values = None  # Reference to the column, only while order statistics are waiting to be recalculated
+        self.__field_type = column_type if column_type is not None else infer_column_type(values=values)
+        values = get_numerical_array(values=values)
+        kernel = get_numerical_kernel(values=values)
+        self.__count = kernel["count"]  # Указываем явно, потому что этот класс не должен хранить все значения с колонки
+        self.__count_unique = kernel["unique_count"]
         self.__field_dtype = "variable" if self.__count_unique >= self.__count * categorical else "categorical"
-        self.__nan_count = ColumnNumStat.__get_nan_count(values=values)
-        self.__num_stat = NumericalIndicators(values=values, extended=extended)
+        self.__nan_count = kernel["nan_count"]
+        self.__num_stat = NumericalIndicators(values=values, extended=extended, kernel=kernel, bins=bins)
 
     def __str__(self):
         table = PrettyTable()
@@ -43,6 +60,13 @@ class ColumnNumStat:
             table.add_row(["Coefficient of Variation", self.get_coef_of_variation()])
         return str(table)
 
+    def __getstate__(self) -> dict:
+        """
+        This method recalculates the stale order statistics before pickling, so the column is not pickled
+        """
+        self.__actualize()
+        return self.__dict__
+
     def __len__(self) -> int:
         """
         This method returns the len[count] of values in this column
@@ -70,6 +94,8 @@ class ColumnNumStat:
         """
         This method returns the real type of column
         """
+        if self.__field_dtype is None:
+            self.__actualize()
         return self.__field_dtype
 
     @property
@@ -84,8 +110,18 @@ class ColumnNumStat:
         """
         This method returns count of unique values in this column
         """
+        if self.__count_unique is None:
+            self.__actualize()
         return self.__count_unique
 
+    @property
+    def is_unique_exact(self) -> bool:
+        """
+        This method returns True, if the count of unique values is exact
+        (it is always exact for numerical columns, because it is counted by the sorted values)
+        """
+        return True
+
     @property
     def nan_count(self) -> int:
         """
@@ -98,18 +134,23 @@ class ColumnNumStat:
         return self.__is_extended
 
     def get_num_stat(self) -> NumericalIndicators:
+        self.__actualize()
         return self.__num_stat
 
     def min(self) -> int or float:
         """
         This method return minimal value of column
         """
+        if self.__num_stat.get_min() is None:
+            self.__actualize()
         return self.__num_stat.get_min()
 
     def max(self) -> int or float:
         """
         This method return maximal value of column
         """
+        if self.__num_stat.get_max() is None:
+            self.__actualize()
         return self.__num_stat.get_max()
 
     def mean(self) -> int or float:
@@ -122,8 +163,72 @@ class ColumnNumStat:
         """
         This method return maximal value of column
         """
+        if self.__num_stat.get_median() is None:
+            self.__actualize()
         return self.__num_stat.get_median()
 
+    def var(self) -> float:
+        """
+        This method return variance of column
+        """
+        return self.__num_stat.get_variance()
+
+    def update(self,
+               values: pd.Series or np.ndarray,
+               added: pd.Series or np.ndarray or list = None,
+               removed: pd.Series or np.ndarray or list = None,
+               column_type: ColumnType = None) -> None:
+        """
+        This method updates statistics after the change of column rows in O(changed rows).
+        Count, NaN count, mean, variance, min and max are updated at once,
+        order statistics (unique count, median, extended statistics) are recalculated at the first request
+        :param values: All values of column after the change (the reference is kept only until the recalculation)
+        :param added: Values, which were added to the column
+        :param removed: Values, which were removed from the column
+        :param column_type: The new type of column (None - the type has not changed)
+        """
+        added = get_numerical_array(values=added) if added is not None else None
+        removed = get_numerical_array(values=removed) if removed is not None else None
+        for block, sign in [(added, 1), (removed, -1)]:
+            if block is not None:
+                self.__count += sign * len(block)
+                if block.dtype.kind == "f":
+                    self.__nan_count += sign * int(np.count_nonzero(np.isnan(block)))
+        if column_type is not None:
+            self.__field_type = column_type
+        self.__num_stat.update(added=added, removed=removed)
+        self.__count_unique = None
+        self.__field_dtype = None
+        self.__values = values
+
+    def __actualize(self) -> None:
+        """
+        This method recalculates order statistics, which could not be updated by the changed rows only
+        """
+        if self.__values is None:
+            return
+        values = get_numerical_array(values=self.__values)
+        self.__values = None
+        kernel = get_numerical_kernel(values=values)
+        self.__count = kernel["count"]
+        self.__nan_count = kernel["nan_count"]
+        self.__count_unique = kernel["unique_count"]
+        self.__field_dtype = "variable" if self.__count_unique >= self.__count * self.__categorical else "categorical"
+        self.__num_stat = NumericalIndicators(values=values, extended=self.__is_extended, kernel=kernel,
+                                              bins=self.__bins)
+
+    def bind_values(self, values: pd.Series or np.ndarray or None) -> None:
+        """
+        This method binds the column values to statistics, which were calculated in other process or were loaded,
+        so the extended indicators, which were not requested yet, can be calculated. If the statistics were updated
+        by the changed rows only (for example, in the appended segments), the order statistics are recalculated
+        by these values at the first request
+        :param values: Values from column (None - release the reference to values)
+        """
+        if values is None or self.__count_unique is None:  # Order statistics are reset by 'update'
+            self.__values = values
+        self.__num_stat.bind_values(values=values)
+
     def get_values_distribution(self) -> Dict[float or int, float]:
         """
         This method returns the percentage of values in the column
@@ -178,37 +283,15 @@ class ColumnNumStat:
                             f"To get statistical values, use 'get_column_statinfo' with the 'extended' parameter")
         return self.__num_stat.get_values_distribution().get_coef_of_variation()
 
-    def get_Z_score(self) -> float:
+    def get_Z_score(self) -> np.ndarray:
         """
-        This method return mathematical sigma
+        This method return the Z-score of each value (it is calculated at each request and is not stored)
         """
         if not self.get_num_stat().get_is_extended():
             raise Exception(f"Statistics have not been calculated for column '{self.__column_name}' yet! "
                             f"To get statistical values, use 'get_column_statinfo' with the 'extended' parameter")
         return self.__num_stat.get_values_distribution().get_Z_score()
 
-    def __get_column_type(self, values: list) -> ColumnType:
-        """
-        This method learns the column type
-        """
-        types = []
-        for i in range(len(values)):
-            column_type = type(values[i]).__name__
-            if column_type == 'bool':
-                types.append(ColumnType.BOOLEAN)
-            elif column_type == 'int':
-                types.append(ColumnType.INTEGER)
-            elif column_type == 'float':
-                types.append(ColumnType.FLOAT)
-            elif column_type == 'str':
-                types.append(ColumnType.STRING)
-        if len(list(set(types))) == 1:
-            return types[0]
-        else:
-            if len(types) == 2 and ColumnType.STRING in list(set(types)):
-                return ColumnType.STRING
-            return ColumnType.OBJECT
-
     # def get_from_json(self, data: dict, values: dict) -> None:
     #     """
     #     This method load DataSet indicators from json
@@ -266,15 +349,4 @@ class ColumnNumStat:
     #     else:
     #         raise Exception("The values were not loaded!")
 
-    @staticmethod
-    def __get_nan_count(values: list) -> int:
-        """
-        This method calculate count of NaN values
-        """
-        nan_cnt = 0
-        for value in values:
-            if pd.isna(value):
-                nan_cnt += 1
-        return nan_cnt
-
 
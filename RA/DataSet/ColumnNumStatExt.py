@@ -7,14 +7,19 @@ from prettytable import PrettyTable
 
 
 class NumericalStatistics:
+    MAX_DISTRIBUTION_SIZE = 1000  # Above this count of unique float values, the distribution is binned
+    DISTRIBUTION_BINS = 100  # Default count of bins of the binned distribution
+
     def __init__(self):
+        self.__values = None  # Reference to the column values, until all stored indicators are calculated
+        self.__is_values_filled = False  # NaN values of the bound values are already replaced by 0
+        self.__bins = None
         self.__math_mode = None
         self.__math_expectation = None
         self.__math_dispersion = None
         self.__math_sigma = None
         self.__math_distribution = None
         self.__coef_of_variation = None
-        self.__z_score = None
         self.__is_numerical_statistics = False
 
     def __str__(self):
@@ -34,12 +39,23 @@ class NumericalStatistics:
             table.add_row(["Moda + 3 * sigma", self.get_math_expectation() + 3 * self.get_math_sigma()])
         return str(table)
 
+    def __getstate__(self) -> dict:
+        """
+        This method drops the reference to values before pickling, so the pickled statistics do not contain the column
+        (use 'bind_values' after unpickling to calculate the indicators, which were not requested yet)
+        """
+        state = self.__dict__.copy()
+        state["_NumericalStatistics__values"] = None
+        return state
+
     def get_distribution(self) -> Dict[int or float, float]:
         """
         This method return mathematical distribution dict
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__math_distribution is None:
+            self.__calculate_frequencies()
         return self.__math_distribution
 
     def get_math_mode(self) -> int or float:
@@ -48,6 +64,8 @@ class NumericalStatistics:
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__math_mode is None:
+            self.__calculate_frequencies()
         return self.__math_mode
 
     def get_math_expectation(self) -> int or float:
@@ -56,6 +74,9 @@ class NumericalStatistics:
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__math_expectation is None:
+            self.__math_expectation = float(np.mean(self.__get_values()))
+            self.__release_values()
         return self.__math_expectation
 
     def get_math_dispersion(self) -> float:
@@ -64,6 +85,8 @@ class NumericalStatistics:
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__math_dispersion is None:
+            self.__math_dispersion = self.get_math_sigma() ** 2
         return self.__math_dispersion
 
     def get_math_sigma(self) -> float:
@@ -72,6 +95,9 @@ class NumericalStatistics:
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__math_sigma is None:
+            self.__math_sigma = np.std(self.__get_values())
+            self.__release_values()
         return self.__math_sigma
 
     def get_coef_of_variation(self) -> float:
@@ -80,15 +106,19 @@ class NumericalStatistics:
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__coef_of_variation is None:
+            self.__coef_of_variation = self.get_math_sigma() / self.get_math_expectation() * 100
         return self.__coef_of_variation
 
-    def get_Z_score(self) -> float:
+    def get_Z_score(self) -> np.ndarray:
         """
-        This method return the Z-score
+        This method return the Z-score of each value (it is calculated at each request and is not stored,
+        because it is as large as the column). The values are released, when all stored indicators are calculated,
+        so after that they must be bound again by 'bind_values'
         """
         if not self.__is_numerical_statistics:
             raise Exception("The data has not been loaded yet!")
-        return self.__z_score
+        return stats.zscore(self.__get_values())
 
     def get_is_normal_distribution(self) -> bool:
         """
@@ -117,45 +147,96 @@ class NumericalStatistics:
         """
         if not self.__is_numerical_statistics:
             raise Exception("The values were not loaded!")
-        return {"Math mode": float(self.__math_mode),
-                "Math expectation": float(self.__math_expectation),
-                "Math dispersion": float(self.__math_dispersion),
-                "Math sigma": float(self.__math_sigma),
-                "Moda - 3 * sigma": float(self.__math_expectation - 3 * self.__math_sigma),
-                "Moda - 2 * sigma": float(self.__math_expectation - 2 * self.__math_sigma),
-                "Moda - 1 * sigma": float(self.__math_expectation - 1 * self.__math_sigma),
-                "Moda + 1 * sigma": float(self.__math_expectation + 1 * self.__math_sigma),
-                "Moda + 2 * sigma": float(self.__math_expectation + 2 * self.__math_sigma),
-                "Moda + 3 * sigma": float(self.__math_expectation + 3 * self.__math_sigma)}
-
-    def set_values(self, values: List[int or float]) -> None:
-        """
-        This method calculated extended satatistisc params
-        :param values:
+        math_expectation = self.get_math_expectation()
+        math_sigma = self.get_math_sigma()
+        return {"Math mode": float(self.get_math_mode()),
+                "Math expectation": float(math_expectation),
+                "Math dispersion": float(self.get_math_dispersion()),
+                "Math sigma": float(math_sigma),
+                "Moda - 3 * sigma": float(math_expectation - 3 * math_sigma),
+                "Moda - 2 * sigma": float(math_expectation - 2 * math_sigma),
+                "Moda - 1 * sigma": float(math_expectation - 1 * math_sigma),
+                "Moda + 1 * sigma": float(math_expectation + 1 * math_sigma),
+                "Moda + 2 * sigma": float(math_expectation + 2 * math_sigma),
+                "Moda + 3 * sigma": float(math_expectation + 3 * math_sigma)}
+
+    def set_values(self, values: np.ndarray or List[int or float], bins: int = None) -> None:
+        """
+        This method sets values for extended satatistisc params.
+        Each indicator is calculated at the first request and then is stored
+        :param values: Values from column (NaN values are counted as 0)
+        :param bins: The count of bins of values distribution
+        (None - exact distribution for integers and for floats with not too many unique values)
         """
         if not self.__is_numerical_statistics:
             if values is not None:
-                self.__math_distribution = self.__get_values_distribution(values)
-                self.__math_mode = stats.mode(values)[0][0]
-                self.__math_expectation = self.__get_math_expectation(self.__math_distribution)
-                self.__math_sigma = np.std(values)
-                self.__math_dispersion = self.__math_sigma ** 2
-                self.__coef_of_variation = np.std(values) / np.mean(values) * 100
-                self.__z_score = stats.zscore(values)
+                self.__bins = bins
+                self.bind_values(values=values)
                 self.__is_numerical_statistics = True
 
+    def bind_values(self, values: np.ndarray or List[int or float] or None) -> None:
+        """
+        This method binds the column values, from which the not yet requested indicators are calculated,
+        without resetting already calculated indicators (for example, after unpickling)
+        :param values: Values from column (None - release the reference to values)
+        """
+        self.__values = np.asarray(values) if values is not None else None
+        self.__is_values_filled = False
+
+    def __get_values(self) -> np.ndarray:
+        """
+        This method returns the bound values, where NaN values are replaced by 0.
+        The values are filled once and the filled copy is kept instead of the bound values
+        """
+        if self.__values is None:
+            raise Exception("The values of column are not bound, so the indicator can not be calculated! "
+                            "Use 'bind_values' to bind them.")
+        if not self.__is_values_filled:
+            if self.__values.dtype.kind == "f":
+                is_nan = np.isnan(self.__values)
+                if is_nan.any():
+                    self.__values = np.where(is_nan, 0, self.__values)
+            self.__is_values_filled = True
+        return self.__values
+
+    def __release_values(self) -> None:
+        """
+        This method releases the reference to values, when all stored indicators are calculated,
+        so the cached statistics do not keep the column
+        """
+        if self.__math_distribution is not None and self.__math_expectation is not None and \
+                self.__math_sigma is not None:
+            self.__values = None
+
+    def __calculate_frequencies(self) -> None:
+        """
+        This method calculates the distribution and the mode by the one counting of unique values
+        """
+        values = self.__get_values()
+        uniques, counts = np.unique(values, return_counts=True)
+        self.__math_mode = uniques[np.argmax(counts)]
+        bins = self.__bins
+        if bins is None and values.dtype.kind == "f" and len(uniques) > NumericalStatistics.MAX_DISTRIBUTION_SIZE:
+            bins = NumericalStatistics.DISTRIBUTION_BINS
+        if bins is None:
+            self.__math_distribution = dict(zip(uniques.tolist(), (counts / len(values)).tolist()))
+        else:
+            self.__math_distribution = NumericalStatistics.__get_binned_distribution(values, bins)
+        self.__release_values()
+
     @staticmethod
-    def __get_values_distribution(values: list) -> Dict[bool or int or float or bool, float]:
+    def __get_binned_distribution(values: np.ndarray, bins: int) -> Dict[float, float]:
         """
-        This method calculates the frequency of list values as a percentage
+        This method calculates the frequency of values in 'bins' equal intervals as a percentage.
+        The keys of result are the centers of intervals
+        :param values: Values from column
+        :param bins: The count of intervals
         """
-        math_rasp = {}
-        for value in values:
-            if value in list(math_rasp):
-                math_rasp[value] += (1 / len(values))
-            else:
-                math_rasp[value] = (1 / len(values))
-        return math_rasp
+        if bins <= 0:
+            raise Exception("The count of 'bins' should be large, then 0!")
+        counts, edges = np.histogram(values, bins=bins)
+        centers = (edges[:-1] + edges[1:]) / 2
+        return dict(zip(centers.tolist(), (counts / len(values)).tolist()))
 
     @staticmethod
     def __get_math_dispersion(math_rasp_dict: dict) -> int or float:
@@ -206,25 +287,36 @@ class NumericalStatistics:
 
 
 class NumericalIndicators:
-    def __init__(self, values: List[int or float], extended: bool) -> None:
+    def __init__(self,
+                 values: np.ndarray or List[int or float],
+                 extended: bool,
+                 kernel: Dict[str, int or float] = None,
+                 bins: int = None) -> None:
         """
         This method init work of class
         :param values: Values from column
         :param extended: Param switched brtween simple or extended statistics
-        """
-        values = [val if not math.isnan(val) else 0 for val in values]
-        self.__min = min(values)
-        self.__mean = np.mean(values)
-        self.__median = np.median(values)
-        self.__max = max(values)
+        :param kernel: Already calculated result of 'get_numerical_kernel' for these values
+        :param bins: The count of bins of values distribution (None - choose automatically)
+        """
+        values = get_numerical_array(values=values)
+        if kernel is None:
+            kernel = get_numerical_kernel(values=values)
+        self.__min = kernel["min"]
+        self.__mean = kernel["mean"]
+        self.__median = kernel["median"]
+        self.__max = kernel["max"]
+        self.__count = kernel["count"]
+        self.__m2 = kernel["m2"]  # Sum of squared deviations from the mean (for the running variance)
         self.__normal_distribution = None
         self.__is_extended = extended
         if extended:
             # It is easier and clearer for us to recalculate basic statistics than to pile up incomprehensible code
             # To download advanced statistics from a json file, you can calculate "basic statistics",
             # because it's not long.
+            # Only the reference to values is kept here, each extended indicator is calculated at the first request
             self.__values_distribution = NumericalStatistics()
-            self.__values_distribution.set_values(values=values)
+            self.__values_distribution.set_values(values=values, bins=bins)
             self.__is_values_distribution = True  # Отвечает за наличие данных в классе NormalDistribution
 
     def __str__(self) -> str:
@@ -264,13 +356,92 @@ class NumericalIndicators:
         """
         return self.__median
 
+    def get_variance(self) -> float:
+        """
+        This method return variance of column
+        """
+        return self.__m2 / self.__count if self.__count > 0 else float('nan')
+
     def get_is_extended(self) -> bool:
         return self.__is_extended
 
+    def update(self, added: np.ndarray = None, removed: np.ndarray = None) -> None:
+        """
+        This method updates the running indicators (count, mean, variance, min, max) by the changed values only.
+        Median and extended statistics can not be updated this way, so they are reset to None
+        :param added: Values, which were added to the column
+        :param removed: Values, which were removed from the column
+        """
+        for block, is_added in [(added, True), (removed, False)]:
+            if block is None or len(block) == 0:
+                continue
+            if block.dtype.kind == "f":
+                block = np.where(np.isnan(block), 0, block)  # As before, NaN values are counted as 0
+            block_count = len(block)
+            block_mean = np.mean(block)
+            block_m2 = float(np.sum((block - block_mean) ** 2))
+            if is_added:
+                self.__add_block(block_count, block_mean, block_m2)
+                if self.__min is not None:
+                    self.__min = min(self.__min, np.min(block))
+                if self.__max is not None:
+                    self.__max = max(self.__max, np.max(block))
+            else:
+                self.__remove_block(block_count, block_mean, block_m2)
+                if self.__min is not None and np.min(block) <= self.__min:
+                    self.__min = None
+                if self.__max is not None and np.max(block) >= self.__max:
+                    self.__max = None
+        self.__median = None
+        if self.__is_extended:
+            self.__values_distribution = None
+            self.__is_values_distribution = False
+
+    def __add_block(self, count: int, mean: float, m2: float) -> None:
+        """
+        This method merges the indicators of added block into running mean and variance (Chan-Welford method)
+        :param count: Count of values in block
+        :param mean: Mean of values in block
+        :param m2: Sum of squared deviations from the mean in block
+        """
+        if self.__count == 0:
+            self.__count, self.__mean, self.__m2 = count, mean, m2
+            return
+        total = self.__count + count
+        delta = mean - self.__mean
+        self.__mean = self.__mean + delta * count / total
+        self.__m2 = self.__m2 + m2 + delta ** 2 * self.__count * count / total
+        self.__count = total
+
+    def __remove_block(self, count: int, mean: float, m2: float) -> None:
+        """
+        This method excludes the indicators of removed block from running mean and variance
+        :param count: Count of values in block
+        :param mean: Mean of values in block
+        :param m2: Sum of squared deviations from the mean in block
+        """
+        rest = self.__count - count
+        if rest <= 0:
+            self.__count, self.__mean, self.__m2 = 0, float('nan'), 0.0
+            return
+        rest_mean = (self.__count * self.__mean - count * mean) / rest
+        delta = mean - rest_mean
+        self.__m2 = max(self.__m2 - m2 - delta ** 2 * rest * count / self.__count, 0.0)
+        self.__mean = rest_mean
+        self.__count = rest
+
     def get_values_distribution(self) -> NumericalStatistics:
         if self.__is_extended:
             return self.__values_distribution
 
+    def bind_values(self, values: np.ndarray or List[int or float] or None) -> None:
+        """
+        This method binds the column values to the extended statistics, which were not requested yet
+        :param values: Values from column (None - release the reference to values)
+        """
+        if self.__is_extended and self.__values_distribution is not None:
+            self.__values_distribution.bind_values(values=get_numerical_array(values) if values is not None else None)
+
     def get_from_json(self, data: dict) -> None:
         """
         This method load NumericalIndicators indicators from json
@@ -301,3 +472,70 @@ class NumericalIndicators:
             data['Normal distribution'] = self.__values_distribution.to_json()
         return data
 
+
+def get_numerical_array(values: pd.Series or np.ndarray or List[int or float]) -> np.ndarray:
+    """
+    This method returns the underlying ndarray of column values (without a copy, if it is possible)
+    :param values: Values from column
+    """
+    if isinstance(values, pd.Series):
+        if pd.api.types.is_extension_array_dtype(values.dtype):
+            return values.to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values.to_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind not in "iuf":
+        values = values.astype(np.float64)
+    return values
+
+
+def get_numerical_kernel(values: np.ndarray) -> Dict[str, int or float]:
+    """
+    This method calculates count, NaN count, unique count, min, max, mean, median and sum of squared deviations
+    of column values by the one sorting of them. As before, NaN values are counted as 0 in all but counts
+    :param values: The ndarray of column values
+    """
+    count = len(values)
+    if values.dtype.kind == "f":
+        valid = values[~np.isnan(values)]  # The boolean indexing already makes a copy, so we can sort it in place
+        valid.sort()
+    else:
+        valid = np.sort(values)
+    nan_count = count - len(valid)
+    kernel = {"count": count,
+              "nan_count": nan_count,
+              "m2": 0.0,
+              "unique_count": int(np.count_nonzero(valid[1:] != valid[:-1])) + int(len(valid) > 0) + int(nan_count > 0),
+              "min": float('nan'),
+              "max": float('nan'),
+              "mean": float('nan'),
+              "median": float('nan')}
+    if count == 0:
+        return kernel
+    if len(valid) == 0:
+        kernel["min"] = kernel["max"] = kernel["mean"] = kernel["median"] = 0
+        return kernel
+    kernel["min"] = min(valid[0], 0) if nan_count > 0 else valid[0]
+    kernel["max"] = max(valid[-1], 0) if nan_count > 0 else valid[-1]
+    kernel["mean"] = np.sum(valid, dtype=np.float64) / count
+    deviations = valid - kernel["mean"]
+    kernel["m2"] = float(np.dot(deviations, deviations)) + nan_count * kernel["mean"] ** 2
+    zero_index = int(np.searchsorted(valid, 0)) if nan_count > 0 else len(valid)
+    middle = [__get_filled_sorted_value(valid, zero_index, nan_count, position)
+              for position in sorted({(count - 1) // 2, count // 2})]
+    kernel["median"] = np.mean(middle)
+    return kernel
+
+
+def __get_filled_sorted_value(valid: np.ndarray, zero_index: int, nan_count: int, position: int) -> int or float:
+    """
+    This method returns the value at 'position' of sorted values, where NaN values were replaced by 0
+    :param valid: Sorted values without NaN
+    :param zero_index: The position of the replaced zeros in sorted values
+    :param nan_count: Count of NaN values (replaced zeros)
+    :param position: Position in sorted values
+    """
+    if position < zero_index:
+        return valid[position]
+    if position < zero_index + nan_count:
+        return 0
+    return valid[position - nan_count]
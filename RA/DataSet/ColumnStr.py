@@ -1,6 +1,6 @@
 import pandas as pd
 from typing import List, Any
-from RA.DataSet.ColumnType import *
+from RA.DataSet.enum_column_type import *
 
 
 class ColumnStr:
@@ -1,22 +1,47 @@
 from prettytable import PrettyTable
-from RA.DataSet.ColumnType import *
+from RA.DataSet.enum_column_type import *
+from RA.DataSet.column_type_inference import *
 from RA.DataSet.ColumnStrStatExt import *
+from RA.DataSet.HyperLogLog import *
 
 
 class ColumnStrStat():
     def __init__(self,
                  column_name: str,
-                 values: list,
+                 values: pd.Series or list,
                  extended: bool,
-                 categorical: float = 0.15) -> None:
+                 categorical: float = 0.15,
+                 column_type: ColumnType = None,
+                 unique_threshold: int = None,
+                 unique_error: float = 0.01,
+                 letters_sample_size: int = None) -> None:
+        """
+        This method init a class work
+        :param column_name: The name of DataSet column
+        :param values: Values from column
+        :param extended: Param switched between simple or extended statistics
+        :param categorical: The share of unique values, below which the column is considered categorical
+        :param column_type: The type of column, which was already learned by DataSet (None - learn it here)
+        :param unique_threshold: The count of values, above which the unique values are counted approximately
+        (by HyperLogLog) instead of the exact set of values (None - always exact)
+        :param unique_error: Relative standard error of the approximate count of unique values
+        :param letters_sample_size: The number of random values, by which the letter frequencies are estimated
+        (None - count letters of all values)
+        """
         self.__column_name = column_name
         self.__is_extended = extended
+        self.__categorical = categorical
+        self.__unique_threshold = unique_threshold
+        self.__unique_error = unique_error
+        self.__unique_sketch = None  # HyperLogLog counter, if the unique values are counted approximately
+        self.__letters_sample_size = letters_sample_size
+        self.__values = None  # Reference to the column, only while order statistics are waiting to be recalculated
         self.__count = len(values)  # Указываем явно, потому что этот класс не должен хранить все значения с колонки
-        self.__count_unique = len(list(set(values)))
-        self.__field_type = self.__get_column_type(values=values)
+        self.__count_unique = self.__get_unique_count(values=values)
+        self.__field_type = column_type if column_type is not None else infer_column_type(values=values)
         self.__field_dtype = "variable" if self.__count_unique >= self.__count * categorical else "categorical"
         self.__nan_count = self.__get_nan_count(values=values)
-        self.__str_stat = StringIndicators(values=values, extended=extended)
+        self.__str_stat = StringIndicators(values=values, extended=extended, letters_sample_size=letters_sample_size)
 
     def __str__(self):
         table = PrettyTable()
@@ -32,10 +57,17 @@ class ColumnStrStat():
         table.add_row(["Min val", self.min()])
         table.add_row(["Max val", self.max()])
 
-        if self.get_str_stat().get_letter_counter().get_distribution():
+        if self.get_str_stat().is_extended:
             table.add_row(["Normal Distribution", "".join(len("Normal Distribution") * [" "])])
         return str(table)
 
+    def __getstate__(self) -> dict:
+        """
+        This method recalculates the stale order statistics before pickling, so the column is not pickled
+        """
+        self.__actualize()
+        return self.__dict__
+
     def __len__(self) -> int:
         """
         This method returns the len[count] of values in this column
@@ -63,6 +95,8 @@ class ColumnStrStat():
         """
         This method returns the real type of column
         """
+        if self.__field_dtype is None:
+            self.__actualize()
         return self.__field_dtype
 
     @property
@@ -77,8 +111,19 @@ class ColumnStrStat():
         """
         This method returns count of unique values in this column
         """
+        if self.__count_unique is None:
+            self.__actualize()
         return self.__count_unique
 
+    @property
+    def is_unique_exact(self) -> bool:
+        """
+        This method returns True, if the count of unique values is exact, and False, if it is estimated
+        """
+        if self.__count_unique is None:
+            self.__actualize()
+        return self.__unique_sketch is None
+
     @property
     def nan_count(self) -> int:
         """
@@ -91,43 +136,113 @@ class ColumnStrStat():
         return self.__is_extended
 
     def get_str_stat(self) -> StringIndicators:
+        self.__actualize()
         return self.__str_stat
 
     def min(self) -> int or float or bool:
         """
         This method return minimal str len in column
         """
-        return self.__str_stat.get_min()
+        if self.__str_stat.min() is None:
+            self.__actualize()
+        return self.__str_stat.min()
 
     def min_value(self) -> int or float or bool:
         """
         This method return minimal value of column
         """
-        return self.__str_stat.get_min_value()
+        if self.__str_stat.min_value() is None:
+            self.__actualize()
+        return self.__str_stat.min_value()
 
     def max(self) -> int or float or bool:
         """
         This method return maximal str len of column
         """
-        return self.__str_stat.get_max()
+        if self.__str_stat.max() is None:
+            self.__actualize()
+        return self.__str_stat.max()
 
     def max_value(self) -> int or float or bool:
         """
         This method return maximal value of column
         """
-        return self.__str_stat.get_max_value()
+        if self.__str_stat.max_value() is None:
+            self.__actualize()
+        return self.__str_stat.max_value()
 
     def mean(self) -> int or float:
         """
         This method return maximal value of column
         """
-        return self.__str_stat.get_mean()
+        return self.__str_stat.mean()
+
+    def update(self,
+               values: pd.Series or list,
+               added: pd.Series or list = None,
+               removed: pd.Series or list = None,
+               column_type: ColumnType = None) -> None:
+        """
+        This method updates statistics after the change of column rows in O(changed rows).
+        Count, NaN count, min, max and mean string length are updated at once (and the approximate unique count,
+        if only new rows were added), order statistics (unique count, extended statistics) are recalculated
+        at the first request
+        :param values: All values of column after the change (the reference is kept only until the recalculation)
+        :param added: Values, which were added to the column
+        :param removed: Values, which were removed from the column
+        :param column_type: The new type of column (None - the type has not changed)
+        """
+        for block, sign in [(added, 1), (removed, -1)]:
+            if block is not None:
+                self.__count += sign * len(block)
+                self.__nan_count += sign * int(pd.isna(pd.Series(block, dtype=object)).sum())
+        if column_type is not None:
+            self.__field_type = column_type
+        self.__str_stat.update(added=added, removed=removed)
+        self.__values = values
+        if self.__unique_sketch is not None and removed is None:  # The counter can't forget values, only add them
+            if added is not None:
+                self.__unique_sketch.add(values=added)
+            self.__count_unique = self.__unique_sketch.count()
+            self.__field_dtype = "variable" if self.__count_unique >= self.__count * self.__categorical \
+                else "categorical"
+        else:
+            self.__count_unique = None
+            self.__field_dtype = None
+
+    def __actualize(self) -> None:
+        """
+        This method recalculates order statistics, which could not be updated by the changed rows only
+        """
+        if self.__values is None:
+            return
+        values = self.__values
+        self.__values = None
+        self.__count = len(values)
+        self.__count_unique = self.__get_unique_count(values=values)
+        self.__field_dtype = "variable" if self.__count_unique >= self.__count * self.__categorical else "categorical"
+        self.__nan_count = self.__get_nan_count(values=values)
+        self.__str_stat = StringIndicators(values=values, extended=self.__is_extended,
+                                           letters_sample_size=self.__letters_sample_size)
+
+    def bind_values(self, values: pd.Series or list or None) -> None:
+        """
+        This method binds the column values to statistics, which were calculated in other process or were loaded,
+        so the extended distributions, which were not requested yet, can be calculated. If the statistics were updated
+        by the changed rows only (for example, in the appended segments), the order statistics are recalculated
+        by these values at the first request
+        :param values: Values from column (None - release the reference to values)
+        """
+        is_stale = self.__count_unique is None or self.__is_extended and self.__str_stat.get_letter_counter() is None
+        if values is None or is_stale:  # Order statistics and distributions are reset by 'update'
+            self.__values = values
+        self.__str_stat.bind_values(values=values)
 
     def get_values_distribution(self) -> Dict[str, float]:
         """
         This method returns the percentage of values in the column
         """
-        if not self.get_str_stat().get_is_extended():
+        if not self.get_str_stat().is_extended:
             raise Exception(f"Statistics have not been calculated for column '{self.__column_name}' yet! "
                             f"To get statistical values, use 'get_column_stat' with the 'extended' parameter")
         return self.__str_stat.get_letter_counter().get_distribution()
@@ -136,34 +251,11 @@ class ColumnStrStat():
         """
         This method returns the percentage of values in the column
         """
-        if not self.get_str_stat().get_is_extended():
+        if not self.get_str_stat().is_extended:
             raise Exception(f"Statistics have not been calculated for column '{self.__column_name}' yet! "
                             f"To get statistical values, use 'get_column_stat' with the 'extended' parameter")
         return self.__str_stat.get_letter_counter().get_letters_distribution()
 
-    def __get_column_type(self, values: list) -> ColumnType:
-        """
-        This method learns the column type
-        :param column_name: Name of DataSet column
-        """
-        types = []
-        for i in range(len(values)):
-            column_type = type(values[i]).__name__
-            if column_type == 'bool':
-                types.append(ColumnType.BOOLEAN)
-            elif column_type == 'int':
-                types.append(ColumnType.INTEGER)
-            elif column_type == 'float':
-                types.append(ColumnType.FLOAT)
-            elif column_type == 'str':
-                types.append(ColumnType.STRING)
-        if len(list(set(types))) == 1:
-            return types[0]
-        else:
-            if len(types) == 2 and ColumnType.STRING in list(set(types)):
-                return ColumnType.STRING
-            return ColumnType.OBJECT
-
     # def get_from_json(self, data: dict, values: dict) -> None:
     #     """
     #     This method load DataSet indicators from json
@@ -220,15 +312,27 @@ class ColumnStrStat():
     #     else:
     #         raise Exception("The values were not loaded!")
 
+    def __get_unique_count(self, values: list) -> int:
+        """
+        This method calculates count of unique values: exactly by the set of values for small columns
+        and approximately by HyperLogLog for columns, which are longer, than 'unique_threshold'
+        :param values: Values from column
+        """
+        if self.__unique_threshold is None or len(values) <= self.__unique_threshold:
+            self.__unique_sketch = None
+            values = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+            return int(values.nunique(dropna=False))  # Unlike the set, it counts all NaN values as one value
+        self.__unique_sketch = HyperLogLog(error=self.__unique_error)
+        self.__unique_sketch.add(values=values)
+        return self.__unique_sketch.count()
+
     @staticmethod
-    def __get_nan_count(values: list) -> int:
+    def __get_nan_count(values: pd.Series or list) -> int:
         """
         This method calculate count of NaN values
         """
-        nan_cnt = 0
-        for value in values:
-            if pd.isna(value):
-                nan_cnt += 1
-        return nan_cnt
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values, dtype=object)
+        return int(values.isna().sum())
 
 
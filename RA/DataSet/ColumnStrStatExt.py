@@ -2,17 +2,26 @@ import math
 import numpy as np
 import pandas as pd
 from scipy import stats
-from typing import Dict, List
+from collections import Counter
+from typing import Dict, List, Iterator
 from prettytable import PrettyTable
 
 
 class StringStatistics:
-    def __init__(self, values: List[int or float] = None):
+    def __init__(self, values: List[int or float] = None, letters_sample_size: int = None):
+        """
+        This method init work of class
+        :param values: Values from column
+        :param letters_sample_size: The number of random values, by which the letter frequencies are estimated
+        (None - count letters of all values)
+        """
+        self.__values = None  # Reference to the column values, until both distributions are calculated
+        self.__letters_sample_size = letters_sample_size
         self.__strings_distribution = None
         self.__letters_distribution = None
         self.__is_string_statistics = False
         if values is not None:
-            self.__fill_letter_distribution(values=values)
+            self.set_values(values=values)
 
     def __str__(self):
         table = PrettyTable()
@@ -24,12 +33,24 @@ class StringStatistics:
                 table.add_row([ld, letter_distr[ld]])
         return str(table)
 
+    def __getstate__(self) -> dict:
+        """
+        This method drops the reference to values before pickling, so the pickled statistics do not contain the column
+        (use 'bind_values' after unpickling to calculate the distributions, which were not requested yet)
+        """
+        state = self.__dict__.copy()
+        state["_StringStatistics__values"] = None
+        return state
+
     def get_distribution(self) -> Dict[int or float, float]:
         """
         This method return mathematical distribution dict
         """
         if not self.__is_string_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__strings_distribution is None:
+            self.__fill_strings_distribution(values=self.__get_values())
+            self.__release_values()
         return self.__strings_distribution
 
     def get_letters_distribution(self) -> Dict[int or float, float]:
@@ -38,6 +59,9 @@ class StringStatistics:
         """
         if not self.__is_string_statistics:
             raise Exception("The data has not been loaded yet!")
+        if self.__letters_distribution is None:
+            self.__fill_letter_distribution(values=self.__get_values())
+            self.__release_values()
         return self.__letters_distribution
 
     def from_json(self, data) -> None:
@@ -58,66 +82,109 @@ class StringStatistics:
 
     def set_values(self, values: List[int or float]) -> None:
         """
-        This method set values to the LetterDistribution class
-        :param values:
+        This method set values to the LetterDistribution class.
+        Each distribution is calculated at the first request and then is stored
+        :param values: list of column values
         """
         if not self.__is_string_statistics:
             if values is not None:
-                self.__fill_letter_distribution(values=values)
+                self.bind_values(values=values)
+                self.__is_string_statistics = True
+
+    def bind_values(self, values: List[int or float] or None) -> None:
+        """
+        This method binds the column values, from which the not yet requested distributions are calculated,
+        without resetting already calculated distributions (for example, after unpickling)
+        :param values: list of column values (None - release the reference to values)
+        """
+        self.__values = values
 
-    def __fill_letter_distribution(self, values: List[int or float]) -> None:
+    def __get_values(self) -> pd.Series or List[int or float]:
         """
-        This method fill LetterCounter class when we use values
+        This method returns the bound values
+        """
+        if self.__values is None:
+            raise Exception("The values of column are not bound, so the distribution can not be calculated! "
+                            "Use 'bind_values' to bind them.")
+        return self.__values
+
+    def __release_values(self) -> None:
+        """
+        This method releases the reference to values, when both distributions are calculated,
+        so the cached statistics do not keep the column
+        """
+        if self.__strings_distribution is not None and self.__letters_distribution is not None:
+            self.__values = None
+
+    def __fill_strings_distribution(self, values: pd.Series or List[int or float]) -> None:
+        """
+        This method counts the frequency of each string by 'value_counts' of chunks
         :param values: list of column values
         """
-        self.__letters_distribution = {}
-        self.__strings_distribution = {}
-        for string in values:
-            if string not in self.__strings_distribution:
-                self.__strings_distribution[string] = 1
-            else:
-                self.__strings_distribution[string] += 1
-            for letter in string:
-                if letter not in self.__letters_distribution:
-                    self.__letters_distribution[letter] = 1
-                else:
-                    self.__letters_distribution[letter] += 1
-        self.__letters_distribution = dict(sorted(self.__letters_distribution.items(),
-                                                  key=lambda x: x[1],
-                                                  reverse=True))
-        self.__strings_distribution = dict(sorted(self.__strings_distribution.items(),
-                                                  key=lambda x: x[1],
-                                                  reverse=True))
-        self.__is_string_statistics = True
+        strings_counts = None
+        for chunk in get_string_chunks(values=values):
+            chunk_counts = chunk.value_counts(sort=False)
+            strings_counts = chunk_counts if strings_counts is None else strings_counts.add(chunk_counts, fill_value=0)
+        if strings_counts is None:
+            self.__strings_distribution = {}
+            return
+        strings_counts = strings_counts.astype(np.int64).sort_values(ascending=False, kind="stable")
+        self.__strings_distribution = dict(zip(strings_counts.index.tolist(), strings_counts.tolist()))
+
+    def __fill_letter_distribution(self, values: pd.Series or List[int or float]) -> None:
+        """
+        This method counts the frequency of each letter by 'Counter' of joined chunks.
+        If 'letters_sample_size' is set, the letters are counted in a random sample of values
+        and the counts are scaled to the whole column
+        :param values: list of column values
+        """
+        scale = 1
+        if self.__letters_sample_size is not None and len(values) > self.__letters_sample_size:
+            scale = len(values) / self.__letters_sample_size
+            values = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+            values = values.sample(n=self.__letters_sample_size, random_state=0)
+        letters_counter = Counter()
+        for chunk in get_string_chunks(values=values):
+            letters_counter.update("".join(chunk.tolist()))
+        self.__letters_distribution = {letter: int(round(count * scale))
+                                       for letter, count in letters_counter.most_common()}
 
 
 class StringIndicators:
-    def __init__(self, values: List[int or float], extended: bool):
-        values = [val for val in values if isinstance(val, str)]
-        self.__min_len = min([len(v) for v in values])
-        self.__min_val = min(values, key=len)
-        self.__max_len = max([len(v) for v in values])
-        self.__max_val = max(values, key=len)
-        self.__mean_len = len("".join(values)) / len(values)
+    def __init__(self, values: List[int or float], extended: bool, letters_sample_size: int = None):
+        """
+        This method init work of class
+        :param values: Values from column
+        :param extended: Param switched brtween simple or extended statistics
+        :param letters_sample_size: The number of random values, by which the letter frequencies are estimated
+        (None - count letters of all values)
+        """
+        kernel = get_string_kernel(values=values)
+        self.__min_len = kernel["min_len"]
+        self.__min_val = kernel["min_value"]
+        self.__max_len = kernel["max_len"]
+        self.__max_val = kernel["max_value"]
+        self.__str_count = kernel["str_count"]
+        self.__total_len = kernel["total_len"]
+        self.__mean_len = self.__total_len / self.__str_count if self.__str_count > 0 else float('nan')
         self.__letter_counter = None
         self.__is_extended = extended
         self.__is_letter_counter = False
         if extended:
-            self.__letter_counter = StringStatistics()
+            # The distributions are calculated at the first request
+            self.__letter_counter = StringStatistics(letters_sample_size=letters_sample_size)
             self.__letter_counter.set_values(values=values)
             self.__is_letter_counter = True
-            print(self.__is_letter_counter)
 
     def __str__(self):
         table = PrettyTable()
         table.title = f"\"StringIndicators\""
         table.field_names = ["Indicator", "Value"]
-        if self.__is_string_indicators:
-            table.add_row(["Minimal string", self.get_min_value()])
-            table.add_row(["Minimal string length", self.get_min()])
-            table.add_row(["Mean string length", self.get_mean()])
-            table.add_row(["Maximal string", self.get_max_value()])
-            table.add_row(["Maximal string length", self.get_max()])
+        table.add_row(["Minimal string", self.min_value()])
+        table.add_row(["Minimal string length", self.min()])
+        table.add_row(["Mean string length", self.mean()])
+        table.add_row(["Maximal string", self.max_value()])
+        table.add_row(["Maximal string length", self.max()])
         return str(table)
 
     @property
@@ -158,6 +225,45 @@ class StringIndicators:
         if self.__is_letter_counter:
             return self.__letter_counter
 
+    def bind_values(self, values: List[int or float] or None) -> None:
+        """
+        This method binds the column values to the extended statistics, which were not requested yet
+        :param values: Values from column (None - release the reference to values)
+        """
+        if self.__is_letter_counter:
+            self.__letter_counter.bind_values(values=values)
+
+    def update(self, added: List[str] = None, removed: List[str] = None) -> None:
+        """
+        This method updates the running indicators (min, max and mean string length) by the changed values only.
+        Letters distribution can not be updated this way, so it is reset
+        :param added: Values, which were added to the column
+        :param removed: Values, which were removed from the column
+        """
+        for block, is_added in [(added, True), (removed, False)]:
+            kernel = get_string_kernel(values=block) if block is not None else None
+            if kernel is None or kernel["str_count"] == 0:
+                continue
+            if is_added:
+                is_empty = self.__str_count == 0
+                self.__str_count += kernel["str_count"]
+                self.__total_len += kernel["total_len"]
+                if is_empty or (self.__min_len is not None and kernel["min_len"] < self.__min_len):
+                    self.__min_len, self.__min_val = kernel["min_len"], kernel["min_value"]
+                if is_empty or (self.__max_len is not None and kernel["max_len"] > self.__max_len):
+                    self.__max_len, self.__max_val = kernel["max_len"], kernel["max_value"]
+            else:
+                self.__str_count -= kernel["str_count"]
+                self.__total_len -= kernel["total_len"]
+                if self.__min_len is not None and kernel["min_len"] <= self.__min_len:
+                    self.__min_len, self.__min_val = None, None
+                if self.__max_len is not None and kernel["max_len"] >= self.__max_len:
+                    self.__max_len, self.__max_val = None, None
+        self.__mean_len = self.__total_len / self.__str_count if self.__str_count > 0 else float('nan')
+        if self.__is_letter_counter:
+            self.__letter_counter = None
+            self.__is_letter_counter = False
+
     def get_from_json(self, data: dict) -> None:
         """
         This method load NumericalIndicators indicators from json
@@ -196,3 +302,50 @@ class StringIndicators:
             data['Letter counter'] = self.__letter_counter.to_json()
         return data
 
+
+def get_string_chunks(values: pd.Series or List[int or float], chunk_size: int = 100000) -> Iterator[pd.Series]:
+    """
+    This method splits column values into chunks and leaves only strings in each chunk,
+    so the vectorized string methods work with bounded memory
+    :param values: Values from column
+    :param chunk_size: Count of values in one chunk
+    """
+    if chunk_size <= 0:
+        raise Exception("The 'chunk_size' should be large, then 0!")
+    for start in range(0, len(values), chunk_size):
+        if isinstance(values, pd.Series):
+            chunk = values.iloc[start:start + chunk_size]
+        else:
+            chunk = pd.Series(values[start:start + chunk_size], dtype=object)
+        if chunk.dtype == object and pd.api.types.infer_dtype(chunk, skipna=True) != "string":
+            chunk = chunk[chunk.map(lambda val: isinstance(val, str))]  # Mixed chunk: keep only strings
+        else:
+            chunk = chunk[chunk.notna()]
+        if len(chunk) > 0:
+            yield chunk
+
+
+def get_string_kernel(values: pd.Series or List[int or float], chunk_size: int = 100000) -> Dict[str, int or str]:
+    """
+    This method calculates count of strings, total length, the shortest and the longest strings of column values
+    by the vectorized '.str.len()' of chunks (values, which are not strings, are skipped)
+    :param values: Values from column
+    :param chunk_size: Count of values in one chunk
+    """
+    kernel = {"str_count": 0,
+              "total_len": 0,
+              "min_len": None,
+              "min_value": None,
+              "max_len": None,
+              "max_value": None}
+    for chunk in get_string_chunks(values=values, chunk_size=chunk_size):
+        lengths = chunk.str.len().to_numpy(dtype=np.int64)
+        kernel["str_count"] += len(lengths)
+        kernel["total_len"] += int(lengths.sum())
+        min_index = int(np.argmin(lengths))
+        max_index = int(np.argmax(lengths))
+        if kernel["min_len"] is None or lengths[min_index] < kernel["min_len"]:
+            kernel["min_len"], kernel["min_value"] = int(lengths[min_index]), chunk.iloc[min_index]
+        if kernel["max_len"] is None or lengths[max_index] > kernel["max_len"]:
+            kernel["max_len"], kernel["max_value"] = int(lengths[max_index]), chunk.iloc[max_index]
+    return kernel
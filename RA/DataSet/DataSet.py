@@ -3,22 +3,37 @@ import sys
 import json
 import math
 import copy
+import shutil
+import weakref
 import warnings
+import collections
 import numpy as np
 import matplotlib.pyplot as plt
 
 from enum import Enum
 from tqdm import tqdm
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Iterable, Iterator, Callable
 from scipy import stats
 from prettytable import PrettyTable
 from RA.DataSet.ColumnStr import *
 from RA.DataSet.ColumnNum import *
-from RA.DataSet.ColumnType import *
+from RA.DataSet.enum_column_type import *
 from RA.DataSet.DataSetStat import *
-from RA.DataSet.DataSetStatus import *
+from RA.DataSet.enum_dataset_status import *
 from RA.DataSet.ColumnNumStat import *
 from RA.DataSet.ColumnStrStat import *
+from RA.DataSet.column_type_inference import *
+from RA.DataSet.jobs_count import *
+from RA.DataSet.column_stat_pool import *
+from RA.DataSet.column_stat_cache import *
+from RA.DataSet.column_storage import *
+from RA.DataSet.column_memmap import *
+from RA.DataSet.csv_shards import *
+from RA.DataSet.excel_reader import *
+from RA.DataSet.csv_writer import *
+from RA.DataSet.csv_sniffer import *
+from RA.DataSet.segmented_project import *
+from RA.DataSet.row_builder import *
 
 
 class DataSet(object):
@@ -32,6 +47,8 @@ class DataSet(object):
         self.__delimiter = ","
         self.__encoding = 'utf-8'
         self.__is_dataset_loaded = False
+        self.__lazy_source = None  # Arguments of reading the .csv file of the lazy dataset
+        self.__lazy_types = {}  # ColumnType of each column, which is not read yet, learned by the sample of rows
         self.__dataset = None  # Dataset in pd.DataFrame
         self.__dataset_len = None  # Number of records in the dataset
         self.__dataset_columns_name = None  # Column names in the dataset
@@ -39,6 +56,17 @@ class DataSet(object):
         self.__dataset_file = None
         self.__dataset_save_path = None
         self.__dataset_analytics = {}
+        self.__dataset_columns_types = {}  # Cached ColumnType of each column, which is reused by all statistics
+        self.__type_sample_size = None  # Number of values scanned to learn the type of 'object' columns (None - all)
+        self.__unique_threshold = None  # Length of column, above which unique strings are counted approximately
+        self.__unique_error = 0.01  # Relative standard error of the approximate count of unique strings
+        self.__letters_sample_size = None  # Number of strings, by which letter frequencies are estimated (None - all)
+        self.__analytics_cache_folder = None  # Folder of the persistent cache of statistics (None - no cache)
+        self.__dataset_columns_hashes = {}  # Cached content hash of each column, which is the key in the cache
+        self.__memmap_folder = None  # Folder of memory mapped numerical columns (None - all columns are in memory)
+        self.__memmap_files = {}  # Memory mapped file of each numerical column
+        self.__memmap_counter = 0  # Counter for the unique names of memory mapped files
+        self.__memmap_finalizer = None  # Deletes memory mapped files, when DataSet is deleted
 
     def __str__(self):
         table = PrettyTable()
@@ -69,8 +97,7 @@ class DataSet(object):
         """
         if self.__dataset is None:
             raise Exception("The dataset has not been loaded yet!")
-        for i in range(len(self.__dataset)):
-            yield self.get_row(index=i)
+        yield from self.iter_rows()
 
     def __reversed__(self):
         """
@@ -91,7 +118,46 @@ class DataSet(object):
         """
         This method returns count rows in this dataset
         """
-        return len(self.__dataset) if self.__dataset is not None else 0
+        if self.__frame is None:
+            return 0
+        return self.__dataset_len if len(self.__lazy_columns) > 0 else len(self.__frame)
+
+    @property
+    def __dataset(self) -> pd.DataFrame or None:
+        """
+        This property returns the DataFrame of dataset. The columns of the lazy dataset, which are not read yet,
+        are read at once, so all methods, which work with the whole DataFrame, get all columns
+        """
+        if len(self.__lazy_columns) > 0:
+            self.__read_lazy_columns(columns=self.__lazy_columns)
+        return self.__frame
+
+    @__dataset.setter
+    def __dataset(self, dataframe: pd.DataFrame or None) -> None:
+        """
+        This property sets the DataFrame of dataset (the dataset stops being lazy)
+        :param dataframe: The DataFrame of dataset
+        """
+        self.__frame = dataframe
+        self.__lazy_columns = []  # Columns of the lazy dataset, which are not read yet
+
+    @property
+    def __dataset_len(self) -> int or None:
+        """
+        This property returns the number of records in the dataset (rows of the lazy dataset are counted,
+        when any column is read, so one column is read, if there are no read columns yet)
+        """
+        if self.__frame is not None and len(self.__frame.columns) == 0 and len(self.__lazy_columns) > 0:
+            self.__read_lazy_columns(columns=self.__lazy_columns[:1])
+        return self.__rows_count
+
+    @__dataset_len.setter
+    def __dataset_len(self, rows_count: int or None) -> None:
+        """
+        This property sets the number of records in the dataset
+        :param rows_count: Number of records
+        """
+        self.__rows_count = rows_count
 
     @property
     def name(self) -> str:
@@ -136,7 +202,7 @@ class DataSet(object):
         """
         This property return column names of dataset pd.DataFrame
         """
-        if self.__dataset is None:
+        if self.__frame is None:
             raise Exception("The dataset has not been loaded yet!")
         return list(self.__dataset_columns_name)
 
@@ -145,7 +211,7 @@ class DataSet(object):
         """
         This method return count of column names of dataset pd.DataFrame
         """
-        if self.__dataset is None:
+        if self.__frame is None:
             raise Exception("The dataset has not been loaded yet")
         return self.__dataset_columns_name_count
 
@@ -154,63 +220,42 @@ class DataSet(object):
         """
         This property returns a list of supported files
         """
-        return [".xls", ".xlsx", ".xlsm", ".xlt", ".xltx", ".xlsb", '.ots', '.ods']
+        return list(EXCEL_ENGINES)
 
     def head(self, n: int = 5, full_view: bool = False) -> str:
         """
-        This method prints the first n rows
+        This method returns the table of the first n rows (columns of the lazy dataset are not read,
+        only the first rows of the .csv file are parsed)
         :param full_view:
         :param n: Count of lines
         """
-        if self.__dataset is None:
+        if self.__frame is None:
             raise Exception("The dataset has not been loaded yet!")
         if n <= 0:
             raise Exception("Count of rows 'n' should be large, then 0!")
-        if n > len(self.__dataset):
-            n = len(self.__dataset)
-        table = PrettyTable()
-        table.title = self.__dataset_name
-        table.field_names = self.__dataset_columns_name
-        for i in range(n):
-            this_row = self.get_row(index=i)
-            table_row = []
-            for column_name in self.__dataset_columns_name:
-                column_type = self.get_column_stat(column_name=column_name, extended=False).type
-                if not full_view and column_type == ColumnType.STRING and isinstance(this_row[column_name], str) and \
-                        len(this_row[column_name]) > 50:
-                    table_row.append(f"{str(this_row[column_name])[:47]}...")
-                else:
-                    table_row.append(this_row[column_name])
-            table.add_row(table_row)
-        return str(table)
+        columns = list(self.__dataset_columns_name)
+        rows = next(self.__iter_blocks(columns=columns, block_size=n), None)
+        return self.__render_rows(rows=rows if rows is not None else pd.DataFrame(columns=columns),
+                                  full_view=full_view)
 
-    def tail(self, n: int = 5, full_view: bool = False) -> None:
+    def tail(self, n: int = 5, full_view: bool = False) -> str:
         """
-        This method prints the last n rows
+        This method returns the table of the last n rows (columns of the lazy dataset are not read,
+        the .csv file is streamed and only the last rows are kept)
         :param full_view:
         :param n: Count of lines
         """
-        if self.__dataset is None:
+        if self.__frame is None:
             raise Exception("The dataset has not been loaded yet!")
         if n <= 0:
             raise Exception("Count of rows 'n' should be large, then 0!")
-        if n > len(self.__dataset):
-            n = len(self.__dataset)
-        table = PrettyTable()
-        table.title = self.__dataset_name
-        table.field_names = self.__dataset_columns_name
-        for i in range(self.__dataset_len - n, self.__dataset_len):
-            this_row = self.get_row(index=i)
-            table_row = []
-            for column_name in self.__dataset_columns_name:
-                column_type = self.get_column_stat(column_name=column_name, extended=False).get_type()
-                if not full_view and column_type.startswith("str") and isinstance(this_row[column_name], str) and \
-                        len(this_row[column_name]) > 50:
-                    table_row.append(f"{str(this_row[column_name])[:47]}...")
-                else:
-                    table_row.append(this_row[column_name])
-            table.add_row(table_row)
-        print(table)
+        columns = list(self.__dataset_columns_name)
+        if any(key in self.__lazy_columns for key in columns):  # Two last blocks contain the last n rows
+            blocks = collections.deque(self.__iter_blocks(columns=columns, block_size=max(n, 100000)), maxlen=2)
+            rows = pd.concat(blocks, ignore_index=True).iloc[-n:] if blocks else pd.DataFrame(columns=columns)
+        else:
+            rows = self.__frame[columns].iloc[-n:]
+        return self.__render_rows(rows=rows, full_view=full_view)
 
     def set_name(self, dataset_name: str) -> None:
         """
@@ -241,6 +286,83 @@ class DataSet(object):
             raise Exception("A separator with a length of 1 character is allowed!")
         self.__delimiter = delimiter
 
+    def set_type_sample_size(self, sample_size: int = None) -> None:
+        """
+        This method sets the number of values, which are scanned to learn the type of 'object' columns
+        :param sample_size: The number of random values (None - scan all values)
+        """
+        if sample_size is not None and (not isinstance(sample_size, int) or sample_size <= 0):
+            raise Exception("The 'sample_size' must be an integer large, then 0!")
+        self.__type_sample_size = sample_size
+        self.__dataset_columns_types = {}
+        self.__dataset_columns_hashes = {}
+
+    def set_letters_sample_size(self, sample_size: int = None) -> None:
+        """
+        This method sets the number of random strings, by which the letter frequencies of string columns are estimated
+        (it is useful for very large text columns)
+        :param sample_size: The number of random strings (None - count letters of all strings)
+        """
+        if sample_size is not None and (not isinstance(sample_size, int) or sample_size <= 0):
+            raise Exception("The 'sample_size' must be an integer large, then 0!")
+        self.__letters_sample_size = sample_size
+        self.__dataset_columns_hashes = {}
+        for key in list(self.__dataset_analytics.keys()):
+            if isinstance(self.__dataset_analytics[key], ColumnStrStat):
+                self.__dataset_analytics.pop(key)
+
+    def set_unique_approximation(self, threshold: int = None, error: float = 0.01) -> None:
+        """
+        This method switches on the approximate (HyperLogLog) count of unique values for long string columns.
+        It uses a few kilobytes of memory instead of the set of all values
+        :param threshold: The length of column, above which unique values are counted approximately (None - exactly)
+        :param error: Relative standard error of the approximate count
+        """
+        if threshold is not None and (not isinstance(threshold, int) or threshold < 0):
+            raise Exception("The 'threshold' must be a non-negative integer!")
+        if not 0 < error < 1:
+            raise Exception("The 'error' must be between 0 and 1!")
+        self.__unique_threshold = threshold
+        self.__unique_error = error
+        self.__dataset_columns_hashes = {}
+        for key in list(self.__dataset_analytics.keys()):
+            if isinstance(self.__dataset_analytics[key], ColumnStrStat):
+                self.__dataset_analytics.pop(key)
+
+    def set_analytics_cache(self, cache_folder: str = None) -> None:
+        """
+        This method sets the folder of the persistent cache of statistics. The statistics of each column are saved
+        by the content hash of column, so the statistics of unchanged columns are loaded instead of the calculation
+        :param cache_folder: The folder of cache (None - do not use the cache)
+        """
+        if cache_folder is not None:
+            if not isinstance(cache_folder, str):
+                raise Exception("The 'cache_folder' must be a string!")
+            os.makedirs(cache_folder, exist_ok=True)
+        self.__analytics_cache_folder = cache_folder
+
+    def set_memmap_backend(self, folder: str = None) -> None:
+        """
+        This method moves numerical columns to memory mapped files, so the dataset can be larger, than RAM.
+        Numerical columns are moved at each loading of dataset and after each change of DataSet, files of replaced
+        columns are deleted at once and other files are deleted with DataSet.
+        Samples of models, which are set by 'set_data(..., shuffle=False)' from 'get_DataFrame', are slices of rows
+        of these files (shuffled samples are copied to memory). Values from 'get_column' and rows of 'split' are
+        copied to memory, and changes of DataFrame from 'get_DataFrame' (for example, by 'loc') are not moved
+        back to files
+        :param folder: The folder of files (None - the 'memmap' folder of DataSet in the saving path)
+        """
+        if folder is None:
+            if self.__dataset_save_path is None:
+                raise Exception("The 'folder' or the saving path of DataSet must be set!")
+            folder = os.path.join(self.__dataset_save_path, self.__dataset_name, "memmap")
+        os.makedirs(folder, exist_ok=True)
+        self.__memmap_folder = folder
+        if self.__memmap_finalizer is None:  # The finalizer keeps the dict of files, not DataSet
+            self.__memmap_finalizer = weakref.finalize(self, remove_memmap_files, self.__memmap_files.values())
+        if self.__is_dataset_loaded:
+            self.__move_to_memmap()
+
     def set_encoding(self, encoding: str) -> None:
         """
         This method sets the encoding for the future export of the dataset
@@ -265,9 +387,15 @@ class DataSet(object):
             raise Exception("The row value must be less than the number of rows in the dataset!")
         if column not in self.__dataset_columns_name:
             raise Exception(f"The \"{column}\" column does not exist in this dataset!")
-        if column in self.__dataset_analytics:
-            self.__dataset_analytics.pop(column)
-        self.__dataset.loc[index, column] = value
+        if index < self.__dataset_len:
+            removed = [self.__dataset.at[index, column]]
+            self.__dataset.loc[index, column] = value
+            self.__update_column_analytics(column_name=column, added=[value], removed=removed)
+        else:
+            self.__dataset.loc[index, column] = value
+            for key in self.__dataset_columns_name:
+                self.__drop_column_analytics(column_name=key)
+        self.__move_to_memmap()  # The column is copied to memory, if the value changes its dtype
 
     def get_from_field(self, column: str, index: int) -> Any:
         """
@@ -303,9 +431,31 @@ class DataSet(object):
                 raise Exception(f"The \"{column}\" column is missing!")
         self.__dataset.loc[len(self.__dataset)] = [new_row[d] for d in self.__dataset_columns_name]
         for key in self.__dataset_columns_name:
-            if key in self.__dataset_analytics:
-                self.__dataset_analytics.pop(key)
+            self.__update_column_analytics(column_name=key, added=[new_row[key]])
         self.__dataset_len += 1
+        self.__move_to_memmap()
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]], block_size: int = 100000) -> None:
+        """
+        This method adds many rows to the dataset. Rows are buffered by columns and added by blocks,
+        so the dataset is reallocated and the statistics are updated once per block
+        :param rows: Rows in dictionary format, where the key is the column name and the value is the value
+        :param block_size: Count of rows in one block
+        """
+        with self.row_builder(block_size=block_size) as builder:
+            for new_row in rows:
+                builder.add_row(new_row=new_row)
+
+    def row_builder(self, block_size: int = 100000) -> RowBuilder:
+        """
+        This method returns the builder of rows, which adds buffered rows to the dataset by blocks
+        and the rest of rows at the exit of 'with' block (or at the call of 'flush'):
+        with dataset.row_builder() as builder:
+            builder.add_row({...})
+        :param block_size: Count of rows in one block
+        """
+        columns_names = list(self.__dataset_columns_name) if self.__is_dataset_loaded else None
+        return RowBuilder(flush=self.__append_rows, columns_names=columns_names, block_size=block_size)
 
     def get_row(self, index: int) -> Dict[str, Any]:
         """
@@ -326,6 +476,48 @@ class DataSet(object):
                                                      index=index)
         return result
 
+    def iter_rows(self,
+                  columns: List[str] = None,
+                  named: bool = False,
+                  block_size: int = 10000) -> Iterator[Dict[str, Any] or tuple]:
+        """
+        This method iterates over rows of the dataset. Rows are converted by blocks,
+        so there is no lookup per cell and only one block is converted in memory
+        :param columns: Names of columns (None - all columns). Columns of the lazy dataset, which are not read yet,
+        are streamed from the .csv file by blocks and are not kept in DataSet
+        :param named: Rows are namedtuples 'Row' (invalid names of columns are replaced by positional ones),
+        otherwise they are dictionaries, where the key is the column name and the value is the value
+        :param block_size: Count of rows, which are converted at once
+        """
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise Exception("The 'block_size' must be an integer large, then 0!")
+        columns = list(self.__dataset_columns_name) if columns is None else list(columns)
+        row_type = collections.namedtuple("Row", [str(key) for key in columns], rename=True)
+        for block in self.__iter_blocks(columns=columns, block_size=block_size):
+            if named:  # The type of rows is created once, not for each block
+                yield from map(row_type._make, block.itertuples(index=False, name=None))
+            else:
+                yield from block.to_dict(orient="records")
+
+    def iter_batches(self,
+                     batch_size: int = 10000,
+                     columns: List[str] = None,
+                     dtype: type = None) -> Iterator[np.ndarray]:
+        """
+        This method iterates over the dataset by batches of rows, each batch is a contiguous 2D numpy array
+        with columns in the order of 'columns', so the dataset is streamed with the memory of one batch
+        :param batch_size: Count of rows in one batch (the last batch can be smaller)
+        :param columns: Names of columns (None - all columns). Columns of the lazy dataset, which are not read yet,
+        are streamed from the .csv file by batches and are not kept in DataSet
+        :param dtype: Type of arrays (None - the common type of columns, 'object' for columns of different types;
+        types of streamed columns are learned by each batch, so set 'dtype' to get the same type of all batches)
+        """
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise Exception("The 'batch_size' must be an integer large, then 0!")
+        columns = list(self.__dataset_columns_name) if columns is None else list(columns)
+        for batch in self.__iter_blocks(columns=columns, block_size=batch_size):
+            yield np.ascontiguousarray(batch.to_numpy(dtype=dtype))
+
     def delete_row(self, index: int) -> None:
         """
         This method delete row from dataset
@@ -337,11 +529,32 @@ class DataSet(object):
             raise Exception("The row index must be greater than 0!")
         if index > self.__dataset_len:
             raise Exception("The row value must be less than the number of rows in the dataset!")
+        removed = self.__dataset.iloc[[index]]
         self.__dataset = self.__dataset.drop(index=index).reset_index(level=0, drop=True)
         for key in self.__dataset_columns_name:
-            if key in self.__dataset_analytics:
-                self.__dataset_analytics.pop(key)
+            self.__update_column_analytics(column_name=key, removed=removed[key])
         self.__dataset_len = self.__dataset_len - 1 if self.__dataset_len > 0 else 0
+        self.__move_to_memmap()
+
+    def delete_rows(self, rows: List[int] or np.ndarray or pd.Series or Callable) -> None:
+        """
+        This method deletes many rows from the dataset in one pass, the statistics are updated once by deleted rows
+        :param rows: Indexes of rows, the boolean mask with the length of dataset or the function,
+        which gets DataFrame of DataSet and returns such mask (for example, lambda df: df["age"] < 0)
+        """
+        if not self.__is_dataset_loaded:
+            raise Exception("The dataset has not been loaded yet!")
+        if callable(rows):
+            rows = rows(self.__dataset)
+        mask = self.__get_rows_mask(rows=rows)
+        if not mask.any():
+            return
+        removed = self.__dataset[mask]
+        self.__dataset = self.__dataset[~mask].reset_index(drop=True)
+        self.__move_to_memmap()
+        self.__update_dataset_base_info()
+        for key in self.__dataset_columns_name:
+            self.__update_column_analytics(column_name=key, removed=removed[key])
 
     def Column(self, column_name: str) -> ColumnStr or ColumnNum:
         """
@@ -352,11 +565,11 @@ class DataSet(object):
             raise Exception("The dataset has not been loaded yet!")
         if column_name not in self.__dataset_columns_name:
             raise Exception(f"The \"{column_name}\" column does not exist in this dataset!")
-        col_type = self.get_column_stat(column_name=column_name, extended=False).type
+        col_type = self.__get_column_type(column_name=column_name)
         if col_type == ColumnType.STRING:
-            return ColumnStr(column=self.__dataset[column_name], column_type=col_type)
+            return ColumnStr(column=self.__get_values(column_name=column_name), column_type=col_type)
         elif col_type == ColumnType.INTEGER or col_type == ColumnType.FLOAT:
-            return ColumnNum(column=self.__dataset[column_name], column_type=col_type)
+            return ColumnNum(column=self.__get_values(column_name=column_name), column_type=col_type)
 
     def add_column(self, column_name: str, values: list, dif_len: bool = False) -> None:
         """
@@ -376,6 +589,7 @@ class DataSet(object):
         self.__dataset[column_name] = values
         self.__dataset_columns_name = self.__dataset.keys()
         self.__dataset_columns_name_count += 1
+        self.__move_to_memmap()
 
     def get_column(self, column_name: str) -> list:
         """
@@ -386,7 +600,7 @@ class DataSet(object):
             raise Exception("The dataset has not been loaded yet!")
         if column_name not in self.__dataset_columns_name:
             raise Exception(f"The \"{column_name}\" column does not exist in this dataset!")
-        return self.__dataset[column_name].to_list()
+        return self.__get_values(column_name=column_name).to_list()
 
     def rename_column(self, column_name: str, new_column_name: str) -> None:
         """
@@ -406,6 +620,11 @@ class DataSet(object):
             self.__dataset_analytics.pop(column_name)
             self.__dataset_analytics[new_column_name] = column_analytic
             self.__dataset_analytics[new_column_name].set_column_name(new_column_name=new_column_name)
+        if column_name in self.__dataset_columns_types:
+            self.__dataset_columns_types[new_column_name] = self.__dataset_columns_types.pop(column_name)
+        self.__dataset_columns_hashes.pop(column_name, None)
+        if column_name in self.__memmap_files:
+            self.__memmap_files[new_column_name] = self.__memmap_files.pop(column_name)
         self.__dataset_columns_name = self.__dataset.keys()
 
     def delete_column(self, column_name: str) -> None:
@@ -418,10 +637,10 @@ class DataSet(object):
         if column_name not in self.__dataset_columns_name:
             raise Exception(f"The \"{column_name}\" column does not exist in this dataset!")
         self.__dataset = self.__dataset.drop([column_name], axis=1)
-        if column_name in self.__dataset_analytics:
-            self.__dataset_analytics.pop(column_name)
+        self.__drop_column_analytics(column_name=column_name)
         self.__dataset_columns_name = self.__dataset.keys()
         self.__dataset_columns_name_count = len(self.__dataset.keys())
+        self.__move_to_memmap()
 
     def set_columns_types(self, new_column_types: type, exception: Dict[str, type] = None) -> None:
         """
@@ -468,10 +687,64 @@ class DataSet(object):
                 except Exception as e:
                     raise Exception(str(e).capitalize())
             secondary_type = str(self.__dataset[column_name].dtype)
+            self.__drop_column_analytics(column_name=column_name)
+            self.__move_to_memmap()
             print(f"Convert DataSet field \'{column_name}\': {primary_type} -> {secondary_type}")
         else:
             raise Exception("There is no such column in the presented dataset!")
 
+    def optimize_memory(self,
+                        downcast: bool = True,
+                        categorize: bool = True,
+                        float_tolerance: float = None) -> Dict[str, Dict[str, str or int]]:
+        """
+        This method reduces the memory of dataset: integers are downcasted to the smallest type for their range,
+        floats are downcasted to float32, if it keeps all values exactly or, if 'float_tolerance' is set,
+        if the relative error of each value is not more than it, and string columns, which are categorical
+        by the statistics of column, are converted to pandas categoricals.
+        Measured floats are rarely exact in float32, so without 'float_tolerance' they are usually kept in float64.
+        Within the range of float32 the relative error of rounding is not more than 6e-8, so any tolerance from 1e-7
+        downcasts all columns, which have neither too large values nor too small ones
+        :param downcast: Downcast numerical columns
+        :param categorize: Convert categorical string columns to pandas categoricals
+        :param float_tolerance: The maximum relative error of downcasted float values (None - values are kept exactly)
+        :return: Dict, where the key is the column name and the value is dtypes and memory (in bytes) before and after
+        """
+        if not self.__is_dataset_loaded:
+            raise Exception("The dataset has not been loaded yet!")
+        if float_tolerance is not None and (not isinstance(float_tolerance, (int, float)) or
+                                            not 0 <= float_tolerance < 1):
+            raise Exception("The 'float_tolerance' must be a number from 0 to 1!")
+        report = {}
+        for key in self.__dataset_columns_name:
+            values = self.__dataset[key]
+            column_type = self.__get_column_type(column_name=key)
+            new_values = None
+            if downcast and column_type in [ColumnType.INTEGER, ColumnType.FLOAT]:
+                new_values = self.__downcast_numbers(values=values, float_tolerance=float_tolerance)
+            elif categorize and column_type == ColumnType.STRING and \
+                    not isinstance(values.dtype, pd.CategoricalDtype) and \
+                    self.get_column_stat(column_name=key, extended=False).dtype == "categorical":
+                new_values = values.astype("category")
+            report[key] = {"dtype_before": str(values.dtype),
+                           "dtype_after": str(values.dtype),
+                           "memory_before": int(values.memory_usage(index=False, deep=True)),
+                           "memory_after": int(values.memory_usage(index=False, deep=True))}
+            if new_values is None or new_values.dtype == values.dtype:
+                continue
+            self.__dataset[key] = new_values
+            report[key]["dtype_after"] = str(new_values.dtype)
+            report[key]["memory_after"] = int(new_values.memory_usage(index=False, deep=True))
+            if isinstance(new_values.dtype, pd.CategoricalDtype) or \
+                    float_tolerance is not None and new_values.dtype.kind == "f":  # Floats can be rounded
+                self.__drop_column_analytics(column_name=key)
+            else:  # Values have not changed, so the statistics are still right, only the content hash is other
+                self.__dataset_columns_hashes.pop(key, None)
+                if key in self.__dataset_analytics:
+                    self.__dataset_analytics[key].bind_values(values=self.__dataset[key])
+        self.__move_to_memmap()
+        return report
+
     def get_column_stat(self, column_name: str, extended: bool) -> ColumnNumStat or ColumnStrStat:
         """
         This method returns statistical analytics for a given column
@@ -483,29 +756,61 @@ class DataSet(object):
         if column_name not in self.__dataset_columns_name:
             raise Exception(f"The \"{column_name}\" column does not exist in this dataset!")
         col = column_name
-        if col in self.__dataset_analytics:
-            if extended and not self.__dataset_analytics[col].get_is_extended():
-                if self.__get_column_type(col) == ColumnType.INTEGER or self.__get_column_type(col) == ColumnType.FLOAT:
-                    self.__dataset_analytics[col] = ColumnNumStat(col, list(self.__dataset[col]), extended)
-                elif self.__get_column_type(col) == ColumnType.STRING:
-                    self.__dataset_analytics[col] = ColumnStrStat(col, list(self.__dataset[col]), extended)
-        else:
-            if self.__get_column_type(col) == ColumnType.INTEGER or self.__get_column_type(col) == ColumnType.FLOAT:
-                self.__dataset_analytics[col] = ColumnNumStat(col, list(self.__dataset[col]), extended)
-            elif self.__get_column_type(col) == ColumnType.STRING:
-                self.__dataset_analytics[col] = ColumnStrStat(col, list(self.__dataset[col]), extended)
+        if col in self.__dataset_analytics and (not extended or self.__dataset_analytics[col].is_extended):
+            return self.__dataset_analytics[col]
+        column_stat = self.__load_cached_column_stat(column_name=col, extended=extended)
+        if column_stat is None:
+            column_stat = calculate_column_stat(column_name=col,
+                                                values=self.__get_values(column_name=col),
+                                                extended=extended,
+                                                column_type=self.__get_column_type(column_name=col),
+                                                unique_threshold=self.__unique_threshold,
+                                                unique_error=self.__unique_error,
+                                                letters_sample_size=self.__letters_sample_size)
+            self.__save_cached_column_stat(column_name=col, column_stat=column_stat)
+        if column_stat is not None:
+            self.__dataset_analytics[col] = column_stat
         return self.__dataset_analytics[col]
 
-    def get_columns_stat(self, extended: bool) -> Dict[str, ColumnNumStat]:
+    def get_columns_stat(self,
+                         extended: bool,
+                         n_jobs: int = 1,
+                         use_processes: bool = False) -> Dict[str, ColumnNumStat or ColumnStrStat]:
         """
         This method returns DataSet columns stat info
-        """
-        for key in self.__dataset_columns_name:
-            if key in self.__dataset_analytics:
-                if not self.__dataset_analytics[key].get_is_extended() and extended:
-                    self.get_column_stat(key, extended)
-            else:
+        :param extended: Responsible for calculating additional parameters
+        :param n_jobs: The number of jobs to run in parallel (-1 - all processors)
+        :param use_processes: Use the pool of processes instead of the pool of threads (when n_jobs != 1)
+        """
+        n_jobs = get_jobs_count(n_jobs=n_jobs)  # The shortcut of one job must not skip the check
+        columns = [key for key in self.__dataset_columns_name if key not in self.__dataset_analytics or
+                   (extended and not self.__dataset_analytics[key].is_extended)]
+        self.__read_lazy_columns(columns=columns)  # All needed columns of the lazy dataset are read by one pass
+        if n_jobs == 1 or len(columns) <= 1:
+            for key in columns:
                 self.get_column_stat(key, extended)
+            return self.__dataset_analytics
+        if not self.__is_dataset_loaded:
+            raise Exception("The dataset has not been loaded yet!")
+        for key in list(columns):
+            column_stat = self.__load_cached_column_stat(column_name=key, extended=extended)
+            if column_stat is not None:
+                self.__dataset_analytics[key] = column_stat
+                columns.remove(key)
+        columns = {key: (self.__get_values(column_name=key), self.__get_column_type(column_name=key)) for key in columns}
+        columns_stat = calculate_columns_stat(columns=columns,
+                                              extended=extended,
+                                              n_jobs=n_jobs,
+                                              use_processes=use_processes,
+                                              unique_threshold=self.__unique_threshold,
+                                              unique_error=self.__unique_error,
+                                              letters_sample_size=self.__letters_sample_size)
+        for key in columns:
+            if columns_stat[key] is not None:
+                if use_processes:  # The statistics from other processes come without values for lazy indicators
+                    columns_stat[key].bind_values(values=self.__dataset[key])
+                self.__dataset_analytics[key] = columns_stat[key]
+                self.__save_cached_column_stat(column_name=key, column_stat=columns_stat[key])
         return self.__dataset_analytics
 
     def reverse(self) -> None:
@@ -514,6 +819,7 @@ class DataSet(object):
         """
         self.__dataset = self.__dataset.reindex(index=self.__dataset.index[::-1])
         self.__dataset = self.__dataset.reset_index(level=0, drop=True)
+        self.__move_to_memmap()
 
     def fillna(self) -> None:
         """
@@ -528,36 +834,66 @@ class DataSet(object):
                 self.__dataset[key] = self.__dataset[key].fillna(value="⁣")
             elif column_type.startswith('int') or column_type.startswith('float'):
                 self.__dataset[key] = self.__dataset[key].fillna(value=0)
+        self.__move_to_memmap()
         self.update_dataset_info()
 
-    def equals(self, dataset) -> bool:
-        diff_responce = self.diff(dataset=dataset)
-        if 'length' not in diff_responce and 'columns' not in diff_responce and len(diff_responce["rows"].keys()) == 0:
-            return True
-        return False
-
-    def diff(self, dataset) -> json:
+    def equals(self, dataset, block_size: int = 1000000) -> bool:
+        """
+        This method checks, that datasets have the same columns and the same values (NaN is equal to NaN).
+        Columns are compared by blocks of rows, so the comparison stops at the first different block
+        :param dataset: The DataSet object to be compared with the current one
+        :param block_size: Count of rows in one block
+        """
+        if not self.__is_dataset_loaded:
+            raise Exception("The dataset has not been loaded yet!")
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise Exception("The 'block_size' must be an integer large, then 0!")
+        some: DataSet = dataset
+        if len(self) != len(some) or self.columns_name != some.columns_name:
+            return False
+        for start in range(0, len(self), block_size):
+            for column in self.__dataset_columns_name:
+                mask = DataSet.__get_diff_mask(values_a=self.__get_values(column_name=column)[start:start + block_size],
+                                               values_b=some.__get_values(column_name=column)[start:start + block_size])
+                if mask.any():
+                    return False
+        return True
+
+    def diff(self, dataset, row_hash: bool = False) -> Dict[str, Any]:
+        """
+        This method compares datasets row by row (by positions of rows) in common columns, NaN is equal to NaN
+        :param dataset: The DataSet object to be compared with the current one
+        :param row_hash: Rows are compared by hashes of values in common columns, so only indexes of changed rows
+        are found (values of different types, for example 1 and 1.0, have different hashes)
+        :return: Dict with 'length' (if lengths are different), 'columns' (columns, which are only in one of datasets,
+        if columns are different) and 'rows' (Dict, where the key is the index of row and the value is the list of
+        different columns, or the list of indexes of changed rows, if 'row_hash' is set)
+        """
         if not self.__is_dataset_loaded:
             raise Exception("The dataset has not been loaded yet!")
         some: DataSet = dataset
         report = {}
-        if self.__dataset_len != some.__dataset_len:
-            report['length'] = {self.name: f"{self.__dataset_len}", some.name: f"{some.__dataset_len}"}
+        if len(self) != len(some):
+            report['length'] = {self.name: f"{len(self)}", some.name: f"{len(some)}"}
         if some.columns_name != self.columns_name:
             not_exist = [column for column in some.columns_name if column not in self.__dataset_columns_name]
             missing = [column for column in self.__dataset_columns_name if column not in some.columns_name]
             report['columns'] = list(set(not_exist + missing))
+        length = min(len(self), len(some))
+        common_columns = [column for column in self.__dataset_columns_name if column in some.columns_name]
+        if row_hash:
+            report['rows'] = []
+            if len(common_columns) > 0:
+                hashes_a = pd.util.hash_pandas_object(self.get_DataFrame(columns=common_columns)[:length], index=False)
+                hashes_b = pd.util.hash_pandas_object(some.get_DataFrame(columns=common_columns)[:length], index=False)
+                report['rows'] = np.flatnonzero(hashes_a.to_numpy() != hashes_b.to_numpy()).tolist()
+            return report
         report['rows'] = {}
-        for column in self.__dataset_columns_name:
-            if column in self.__dataset_columns_name and column in some.columns_name:
-                indexes = DataSet.__dif_lists_index(list_a=self.Column(column_name=column).values(),
-                                                    list_b=some.Column(column_name=column).values())
-                for index in indexes:
-                    if index not in list(report['rows'].keys()):
-                        report['rows'][index] = [column]
-                    else:
-                        report['rows'][index].append(column)
-        print(len(report["rows"].keys()))
+        for column in common_columns:
+            mask = DataSet.__get_diff_mask(values_a=self.__get_values(column_name=column)[:length],
+                                           values_b=some.__get_values(column_name=column)[:length])
+            for index in np.flatnonzero(mask).tolist():
+                report['rows'].setdefault(index, []).append(column)
         return report
 
     def split(self, count: int) -> List:
@@ -605,38 +941,56 @@ class DataSet(object):
                                                                 ascending=reverse,
                                                                 kind=sort_type)
                 self.__dataset = self.__dataset.reset_index(level=0, drop=True)
+                self.__move_to_memmap()
                 return
             except:
                 pass
 
-    def get_correlations(self) -> CorrelationMatrix:
+    def get_correlations(self, method: str = "pearson", block_size: int = 1000) -> CorrelationMatrix:
         """
-        This method calculate correlations between columns
+        This method calculate correlations between columns (the whole numerical block at once)
+        :param method: Method of correlation: 'pearson' or 'spearman'
+        :param block_size: Count of columns, which are correlated by one matrix multiplication
         """
         if self.__dataset is None:
             raise Exception("The dataset has not been loaded yet!")
-        corr_matrix = CorrelationMatrix(keys=self.__dataset_columns_name)
-        for keya in self.__dataset_columns_name:
-            row_type = self.get_column_stat(column_name=keya, extended=False).get_type()
-            for keyb in self.__dataset_columns_name:
-                if corr_matrix.is_cell_free(keya, keyb):
-                    column_type = self.get_column_stat(column_name=keyb, extended=False).get_type()
-                    if (column_type.startswith('int') or column_type.startswith('bool') or column_type.startswith(
-                            'float')) \
-                            and (
-                            row_type.startswith('int') or row_type.startswith('bool') or row_type.startswith('float')):
-                        corr_matrix.add_corr(keya, keyb, np.corrcoef(self.__dataset[keya], self.__dataset[keyb])[0][1])
-                    else:
-                        corr_matrix.add_corr(keya, keyb, float('nan'))
-        return corr_matrix
-
-    def get_DataFrame(self) -> pd.DataFrame:
+        keys = list(self.__dataset_columns_name)
+        numerical = [i for i, key in enumerate(keys)
+                     if self.__get_column_type(column_name=key) in [ColumnType.INTEGER,
+                                                                    ColumnType.FLOAT,
+                                                                    ColumnType.BOOLEAN]]
+        matrix = np.full((len(keys), len(keys)), float('nan'))
+        if len(numerical) > 0:
+            values = self.__dataset[[keys[i] for i in numerical]].to_numpy(dtype=np.float64, na_value=np.nan)
+            matrix[np.ix_(numerical, numerical)] = calculate_correlations(values=values,
+                                                                          method=method,
+                                                                          block_size=block_size)
+        return CorrelationMatrix(keys=keys, matrix=matrix)
+
+    def get_DataFrame(self, columns: List[str] = None) -> pd.DataFrame:
         """
         This method return dataset as pd.DataFrame
+        :param columns: Names of columns (None - all columns). Only these columns of the lazy dataset are read
         """
-        if self.__dataset is None:
+        if self.__frame is None:
             raise Exception("The dataset has not been uploaded yet!")
-        return self.__dataset
+        if columns is None:
+            return self.__dataset
+        for key in columns:
+            if key not in self.__dataset_columns_name:
+                raise Exception(f"The \"{key}\" column does not exist in this dataset!")
+        self.__read_lazy_columns(columns=columns)
+        return self.__frame[list(columns)]
+
+    def get_columns_types(self) -> Dict[str, ColumnType]:
+        """
+        This method returns types of all columns. Types of columns of the lazy dataset, which are not read yet,
+        are learned by the sample of first rows, so the schema is known without reading the whole file
+        """
+        if self.__frame is None:
+            raise Exception("The dataset has not been loaded yet!")
+        return {key: self.__lazy_types[key] if key in self.__lazy_columns else self.__get_column_type(column_name=key)
+                for key in self.__dataset_columns_name}
 
     def join_DataFrame(self, dataframe: pd.DataFrame, dif_len: bool = False) -> None:
         """
@@ -657,6 +1011,7 @@ class DataSet(object):
             raise Exception("The current dataset and the new dataset have the same column names!")
         self.__dataset = self.__dataset.join(dataframe,
                                              how='outer')
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
 
     def join_DataSet(self, dataset, dif_len: bool = False) -> None:
@@ -679,6 +1034,7 @@ class DataSet(object):
         self.__dataset = self.__dataset.join(dataset.get_DataFrame(),
                                              how='outer')
         self.__dataset_analytics = merge_two_dicts(self.__dataset_analytics, dataset.get_columns_stat_info())
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
 
     def concat_DataFrame(self, dataframe: pd.DataFrame) -> None:
@@ -695,9 +1051,11 @@ class DataSet(object):
         if len(self.__dataset.keys()) != len(columns_names) and len(self.__dataset) > 0:
             raise Exception("The current dataset and the new dataset have the different column names!")
         self.__dataset = pd.concat([self.__dataset, dataframe])
-        self.__dataset_analytics = {}
         self.__dataset = self.__dataset.reset_index(level=0, drop=True)
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
+        for key in self.__dataset_columns_name:
+            self.__update_column_analytics(column_name=key, added=dataframe[key])
 
     def concat_DataSet(self, dataset) -> None:
         """
@@ -709,32 +1067,42 @@ class DataSet(object):
             self.create_empty_dataset()
         if len(dataset) == 0:
             raise Exception("You are trying to add an empty dataset")
-        columns_names = set(list(self.__dataset.keys()) + list(dataset.get_keys()))
+        columns_names = set(list(self.__dataset.keys()) + list(dataset.columns_name))
         if len(self.__dataset.keys()) != len(columns_names) and len(self.__dataset) > 0:
             raise Exception("The current dataset and the new dataset have the different column names!")
-        self.__dataset = pd.concat([self.__dataset, dataset.get_DataFrame()])
-        self.__dataset_analytics = {}
+        dataframe = dataset.get_DataFrame()
+        self.__dataset = pd.concat([self.__dataset, dataframe])
         self.__dataset = self.__dataset.reset_index(level=0, drop=True)
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
+        for key in self.__dataset_columns_name:
+            self.__update_column_analytics(column_name=key, added=dataframe[key])
 
     def update_dataset_info(self) -> None:
         """
         This method updates, the analitic-statistics data about already precalculated columns
         """
         self.__update_dataset_base_info()
+        self.__dataset_columns_types = {}
+        self.__dataset_columns_hashes = {}
         for key in self.__dataset_columns_name:
             is_extended = False
             if key in self.__dataset_analytics:
-                is_extended = self.__dataset_analytics[key].get_is_extended()
-            if self.__get_column_type(column_name=key) == ColumnType.INTEGER or \
-                    self.__get_column_type(column_name=key) == ColumnType.FLOAT:
+                is_extended = self.__dataset_analytics[key].is_extended
+            column_type = self.__get_column_type(column_name=key)
+            if column_type == ColumnType.INTEGER or column_type == ColumnType.FLOAT:
                 self.__dataset_analytics[key] = ColumnNumStat(column_name=key,
                                                               values=self.__dataset[key],
-                                                              extended=is_extended)
-            elif self.__get_column_type(column_name=key) == ColumnType.STRING:
+                                                              extended=is_extended,
+                                                              column_type=column_type)
+            elif column_type == ColumnType.STRING:
                 self.__dataset_analytics[key] = ColumnStrStat(column_name=key,
                                                               values=self.__dataset[key],
-                                                              extended=is_extended)
+                                                              extended=is_extended,
+                                                              column_type=column_type,
+                                                              unique_threshold=self.__unique_threshold,
+                                                              unique_error=self.__unique_error,
+                                                              letters_sample_size=self.__letters_sample_size)
 
     def create_empty_dataset(self,
                              columns_names: list = None,
@@ -785,6 +1153,7 @@ class DataSet(object):
         self.__dataset = pd.DataFrame({columns[i]: data[i] for i in range(len(columns))})
         self.set_delimiter(delimiter=delimiter)
         self.set_encoding(encoding=encoding)
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
         self.__is_dataset_loaded = True
 
@@ -797,31 +1166,131 @@ class DataSet(object):
             raise Exception("The dataset is already loaded!")
         self.__dataset = dataframe
         self.__dataset = self.__dataset.reset_index(level=0, drop=True)
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
         self.__is_dataset_loaded = True
 
     def load_csv_dataset(self,
                          csv_file: str,
-                         delimiter: str,
-                         encoding: str = 'utf-8') -> None:
-        """
-        This method loads the dataset into the DataSet class
+                         delimiter: str = None,
+                         encoding: str = None,
+                         dtype: Dict[str, type] or type = None,
+                         usecols: List[str] = None,
+                         chunk_size: int = None,
+                         memory_limit: int = None,
+                         lazy: bool = False,
+                         lazy_sample_size: int = 1000,
+                         header: bool = None) -> None:
+        """
+        This method loads the dataset into the DataSet class.
+        If 'chunk_size' or 'memory_limit' is set, the file is read by chunks and the simple statistics of columns
+        are accumulated from chunks, so the dataset is profiled by the end of loading.
+        If 'lazy' is set, only the header and the sample of first rows are read, and each column is read from the file
+        at the first use ('Column', 'get_column', 'get_column_stat', 'get_DataFrame'), other methods read all columns.
+        If 'encoding' is not set, it is detected by the prefix of file. If 'delimiter' is not set, it is detected
+        together with the quote character, the header and text columns (see 'sniff_csv_file'), otherwise the first row
+        is the header, unless 'header' is set
         :param csv_file: The name of the .csv file
-        :param delimiter: Symbol-split in a .csv file
-        :param encoding: Explicit indication of the .csv file encoding
+        :param delimiter: Symbol-split in a .csv file (None - detect)
+        :param encoding: Explicit indication of the .csv file encoding (None - detect)
+        :param dtype: Types of columns (for example, {'age': 'int8', 'city': 'category'}), which save the memory
+        :param usecols: Names of columns, which are loaded (None - all columns)
+        :param chunk_size: Count of rows in one chunk (None - choose it by 'memory_limit')
+        :param memory_limit: The maximum memory of the loaded dataset in bytes (None - without limit)
+        :param lazy: Read columns at the first use
+        :param lazy_sample_size: Count of first rows, by which types of not read columns are learned
+        :param header: The first row is the header, otherwise columns are named 'column_0', 'column_1', ...
+        (None - detect it, if 'delimiter' is not set, otherwise the first row is the header)
         """
         if self.__is_dataset_loaded:
             raise Exception("The dataset is already loaded!")
         if csv_file is not None:  # Checking that the uploaded file has the .csv format
-            if not csv_file.endswith(".csv"):
-                raise Exception("The dataset format should be '.csv'!")
-        if csv_file is not None and delimiter is None:  # Checking that a separator is specified
-            raise Exception("When loading a dataset from a .csv file, you must specify a separator character!")
+            if not csv_file.endswith(tuple(f".csv{extension}" for extension in CSV_COMPRESSIONS.values())):
+                raise Exception("The dataset format should be '.csv', '.csv.gz', '.csv.bz2' or '.csv.xz'!")
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size <= 0):
+            raise Exception("The 'chunk_size' must be an integer large, then 0!")
+        if memory_limit is not None and (not isinstance(memory_limit, int) or memory_limit <= 0):
+            raise Exception("The 'memory_limit' must be an integer large, then 0!")
+        if lazy and (chunk_size is not None or memory_limit is not None):
+            raise Exception("The lazy dataset can not be read by chunks!")
+        csv_options = {}
+        if delimiter is None or encoding is None or header is not None:
+            sniffed = sniff_csv(filename=str(csv_file),
+                                delimiters=[delimiter] if delimiter is not None else None,
+                                header=header if header is not None or delimiter is None else True)
+            if delimiter is None:  # The format of file is not known, so the header and types are sniffed too
+                csv_options = get_sniffed_csv_options(sniffed=sniffed)
+                sniffed_dtype = csv_options.pop("dtype")
+                if dtype is None or isinstance(dtype, dict):  # Explicit types are more important, than sniffed ones
+                    dtype = {**sniffed_dtype, **(dtype if dtype is not None else {})}
+            elif not header and header is not None:  # Only the header, which was set explicitly
+                csv_options = {"header": None, "names": list(sniffed["dtypes"].keys())}
+            delimiter = sniffed["delimiter"] if delimiter is None else delimiter
+            encoding = sniffed["encoding"] if encoding is None else encoding
         self.__delimiter = delimiter
+        self.__encoding = encoding
         self.__dataset_file = csv_file
-        self.__dataset = self.__read_from_csv(filename=str(csv_file),
-                                              delimiter=delimiter,
-                                              encoding=encoding)
+        if lazy:
+            self.__load_lazy_csv_dataset(filename=str(csv_file),
+                                         delimiter=delimiter,
+                                         encoding=encoding,
+                                         dtype=dtype,
+                                         usecols=usecols,
+                                         sample_size=lazy_sample_size,
+                                         csv_options=csv_options)
+        elif chunk_size is None and memory_limit is None:
+            self.__dataset = self.__read_from_csv(filename=str(csv_file),
+                                                  delimiter=delimiter,
+                                                  encoding=encoding,
+                                                  dtype=dtype,
+                                                  usecols=usecols,
+                                                  **csv_options)
+            self.__move_to_memmap()
+            self.__update_dataset_base_info()
+        else:
+            self.__read_from_csv_by_chunks(filename=str(csv_file),
+                                           delimiter=delimiter,
+                                           encoding=encoding,
+                                           dtype=dtype,
+                                           usecols=usecols,
+                                           chunk_size=chunk_size,
+                                           memory_limit=memory_limit,
+                                           csv_options=csv_options)
+        self.__is_dataset_loaded = True
+
+    def load_csv_shards(self,
+                        path: str,
+                        delimiter: str,
+                        pattern: str = "*.csv",
+                        encoding: str = 'utf-8',
+                        dtype: Dict[str, type] or type = None,
+                        usecols: List[str] = None,
+                        n_jobs: int = 1) -> None:
+        """
+        This method loads many .csv files with the same columns into the DataSet class.
+        Files are parsed in the pool of processes and concatenated once, in the order of their names
+        :param path: The folder of files or the glob pattern of their names (for example, 'data/2024-*.csv')
+        :param delimiter: Symbol-split in .csv files
+        :param pattern: The glob pattern of files names in the folder (only if 'path' is a folder)
+        :param encoding: Explicit indication of the .csv files encoding
+        :param dtype: Types of columns (for example, {'age': 'int8', 'city': 'category'}), which save the memory
+        :param usecols: Names of columns, which are loaded (None - all columns)
+        :param n_jobs: The number of processes (-1 - all processors)
+        """
+        if self.__is_dataset_loaded:
+            raise Exception("The dataset is already loaded!")
+        if delimiter is None:
+            raise Exception("When loading a dataset from .csv files, you must specify a separator character!")
+        files = get_shards_files(path=path, pattern=pattern)
+        self.__delimiter = delimiter
+        self.__dataset_file = path
+        self.__dataset = read_csv_shards(files=files,
+                                         delimiter=delimiter,
+                                         encoding=encoding,
+                                         dtype=dtype,
+                                         usecols=usecols,
+                                         n_jobs=n_jobs)
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
         self.__is_dataset_loaded = True
 
@@ -835,14 +1304,12 @@ class DataSet(object):
         """
         if self.__is_dataset_loaded:
             raise Exception("The dataset is already loaded!")
-        if excel_file is not None:  # Checking that the uploaded file has the .csv format
-            if not excel_file.endswith(tuple(DataSet.supported_formats)):
-                raise Exception(f"The dataset format should be {', '.join(DataSet.supported_formats)}!")
-        if sheet_name not in pd.ExcelFile(excel_file).sheet_names:
-            raise Exception(f"Sheet name \'{sheet_name}\' not found!")
+        with open_excel_file(excel_file=str(excel_file)) as workbook:  # The engine is chosen by the extension
+            if sheet_name not in workbook.sheet_names:
+                raise Exception(f"Sheet name \'{sheet_name}\' not found!")
+            self.__dataset = workbook.parse(sheet_name=sheet_name)
         self.__dataset_file = excel_file
-        self.__dataset = self.__read_from_xlsx(filename=str(excel_file),
-                                               sheet_name=sheet_name)
+        self.__move_to_memmap()
         self.__update_dataset_base_info()
         self.__is_dataset_loaded = True
 
@@ -861,16 +1328,33 @@ class DataSet(object):
         if not os.path.exists(dataset_project_folder):
             raise Exception("The specified path was not found!")
 
-        with open(f"{dataset_project_folder}\\{json_config_filename}", 'r') as json_file:
+        with open(os.path.join(dataset_project_folder, json_config_filename), 'r') as json_file:
             dataset_info = json.load(json_file)
             json_file.close()
             self.__dataset_file = dataset_info["dataset_filename"]
             self.__delimiter = dataset_info["delimiter"]
             self.__encoding = dataset_info["encoding"]
-            self.__dataset = self.__read_from_csv(filename=os.path.join(dataset_project_folder, self.__dataset_file),
-                                                  delimiter=self.__delimiter,
-                                                  encoding=self.__encoding)
-            self.__read_dataset_info_from_json(dataset_info)
+            if dataset_info.get("format", "csv") == "columnar":
+                self.__dataset = load_columns(folder=os.path.join(dataset_project_folder, self.__dataset_file),
+                                              columns=dataset_info["columns"])
+                # The files of project are written by DataSet, so its types and hashes are not learned again
+                self.__dataset_columns_types = {key: ColumnType[column["type"]]
+                                                for key, column in dataset_info["columns"].items()}
+                self.__dataset_columns_hashes = {key: column["hash"] for key, column in dataset_info["columns"].items()}
+            elif dataset_info.get("format", "csv") == "segmented":
+                self.__dataset = read_segments(project_folder=dataset_project_folder, manifest=dataset_info)
+                self.__dataset_columns_types = {key: ColumnType[column["type"]]
+                                                for key, column in dataset_info["columns"].items() if "type" in column}
+            else:
+                # Floats are parsed exactly, so the content hashes are the same as at the export
+                self.__dataset = self.__read_from_csv(filename=os.path.join(dataset_project_folder,
+                                                                            self.__dataset_file),
+                                                      delimiter=self.__delimiter,
+                                                      encoding=self.__encoding,
+                                                      float_precision="round_trip")
+            self.__move_to_memmap()
+            self.__read_dataset_info_from_json(data=dataset_info,
+                                               analytics_folder=os.path.join(dataset_project_folder, "analytics"))
         self.__is_dataset_loaded = True
 
     def export(self,
@@ -879,7 +1363,11 @@ class DataSet(object):
                including_json: bool = False,
                including_plots: bool = False,
                delimeter: str = None,
-               encoding: str = None) -> None:
+               encoding: str = None,
+               file_format: str = "csv",
+               compression: str = None,
+               compression_level: int = CSV_COMPRESSION_LEVEL,
+               background: bool = False) -> CsvExportHandle or None:
         """
         This method exports the dataset as DataSet Project
         :param delimeter: Symbol-split in a .csv file
@@ -888,9 +1376,22 @@ class DataSet(object):
         :param dataset_folder: The folder to place the dataset files in
         :param including_json: Responsible for the export the .json config file together with the dataset
         :param including_plots: Responsible for the export the plots config file together with the dataset
+        :param file_format: 'csv' - one .csv file, 'columnar' - one binary file per column, which is memory mapped
+        at loading, 'segmented' - immutable .csv segments, to which new rows are appended by
+        'append_to_dataset_project' (the .json config file is always exported with them, because it is the manifest)
+        :param compression: Compression of .csv file: None, 'gzip', 'bz2' or 'xz'
+        :param compression_level: Level of compression from 1 (the fastest) to 9 (the smallest file)
+        :param background: Responsible for writing the .csv file in the background thread
+        (only for the 'csv' format, the .json config file and plots are written at once)
+        :return: The handle of export with 'wait()', 'is_done' and 'progress', if 'background' is True
         """
         if self.__dataset is None:
             raise Exception("The dataset has not been loaded yet!")
+        if file_format not in ["csv", "columnar", "segmented"]:
+            raise Exception(f"'{file_format}' is an invalid format of project. Valid formats: csv, columnar, segmented")
+        check_csv_compression(compression=compression, compression_level=compression_level)
+        if background and file_format != "csv":
+            raise Exception("Only the 'csv' format can be exported in the background!")
         print(f"Saving DataSet \'{self.__dataset_name}\'...")
         pass
 
@@ -924,19 +1425,37 @@ class DataSet(object):
         if delimeter is not None and isinstance(delimeter, str):
             self.set_delimiter(delimiter=delimeter)
 
-        if including_json and self.__dataset is not None:
-            json_config = {"dataset_filename": f"{dataset_filename}.csv",
+        if file_format == "segmented":
+            self.__export_segments(folder=folder, dataset_filename=dataset_filename, including_json=including_json)
+        elif (including_json or file_format == "columnar") and self.__dataset is not None:
+            json_config = {"dataset_filename": f"{dataset_filename}.csv{CSV_COMPRESSIONS[compression]}"
+                           if file_format == "csv" else "columns",
+                           "format": file_format,
                            "columns_names": list(self.__dataset_columns_name),
                            "columns_count": self.__dataset_columns_name_count,
                            "rows": self.__dataset_len,
                            "delimiter": self.__delimiter,
                            "encoding": self.__encoding,
                            "columns": {}}
+            analytics_folder = os.path.join(folder, "analytics")  # The statistics are saved by the content hash
+            os.makedirs(analytics_folder, exist_ok=True)
             for key in self.__dataset_columns_name:
-                if key not in self.__dataset_analytics:
-                    self.__dataset_analytics[key] = self.get_column_stat(column_name=key, extended=True)
-                json_config["columns"] = merge_two_dicts(json_config["columns"],
-                                                         self.__dataset_analytics[key].to_json())
+                column_type = self.__get_column_type(column_name=key)
+                json_config["columns"][key] = {"type": column_type.name,
+                                               "hash": self.__get_column_hash(column_name=key)}
+                if including_json and column_type in [ColumnType.INTEGER, ColumnType.FLOAT, ColumnType.STRING]:
+                    save_column_stat(cache_folder=analytics_folder,
+                                     column_hash=json_config["columns"][key]["hash"],
+                                     column_stat=self.get_column_stat(column_name=key, extended=True))
+                elif key in self.__dataset_analytics:  # Already calculated statistics are saved anyway
+                    save_column_stat(cache_folder=analytics_folder,
+                                     column_hash=json_config["columns"][key]["hash"],
+                                     column_stat=self.__dataset_analytics[key])
+            if file_format == "columnar":
+                columns_files = save_columns(dataframe=self.__dataset,
+                                             folder=os.path.join(folder, json_config["dataset_filename"]))
+                for key in columns_files:
+                    json_config["columns"][key].update(columns_files[key])
             with open(os.path.join(folder, f"{dataset_filename}.json"), 'w') as json_file:
                 json.dump(json_config, json_file, indent=4)
 
@@ -951,56 +1470,129 @@ class DataSet(object):
                         pass
                     self.__save_plots(path=os.path.join(folder, "plots"),
                                       column=self.__dataset_analytics[key])
-        pd.DataFrame(self.__dataset).to_csv(os.path.join(folder, f"{dataset_filename}.csv"),
-                                            index=False,
-                                            sep=self.__delimiter,
-                                            encoding=self.__encoding)
+        if file_format == "csv":
+            csv_filename = f"{dataset_filename}.csv{CSV_COMPRESSIONS[compression]}"
+            handle = start_csv_export(dataframe=self.__dataset.copy(deep=False),
+                                      path=os.path.join(folder, csv_filename),
+                                      delimiter=self.__delimiter,
+                                      encoding=self.__encoding,
+                                      compression=compression,
+                                      compression_level=compression_level)
+            if background:
+                return handle
+            handle.wait()
+
+    @staticmethod
+    def append_to_dataset_project(dataset_project_folder: str,
+                                  json_config_filename: str,
+                                  dataframe: pd.DataFrame) -> None:
+        """
+        This method appends rows to the segmented DataSet project (see 'export') without reading the project:
+        rows are written as the new segment and the saved statistics are updated by these rows only
+        :param dataset_project_folder: The folder of project
+        :param json_config_filename: The name of .json manifest of project
+        :param dataframe: New rows with the same columns as the project
+        """
+        if not json_config_filename.endswith(".json"):
+            raise Exception("The file must be in .json format!")
+        if len(dataframe) == 0:
+            raise Exception("You are trying to add an empty dataset")
+        with open(os.path.join(dataset_project_folder, json_config_filename), 'r') as json_file:
+            manifest = json.load(json_file)
+        if manifest.get("format") != "segmented":
+            raise Exception("Rows can be appended only to the segmented DataSet project!")
+        write_segment(project_folder=dataset_project_folder, manifest=manifest, dataframe=dataframe)
 
     def to_csv(self,
                file_name: str = None,
                path_to_saving_folder: str = None,
                delimeter: str = None,
-               encoding: str = None) -> None:
+               encoding: str = None,
+               compression: str = None,
+               chunk_size: int = 100000,
+               compression_level: int = CSV_COMPRESSION_LEVEL) -> None:
         """
-        This method saves pd.DataFrame to .csv file
+        This method saves pd.DataFrame to .csv file by blocks of rows
         :param file_name: File name
         :param path_to_saving_folder: The path to the folder where the file will be saved
         :param delimeter: Symbol-split in a .csv/.tsv file
         :param encoding: Explicit indication of the .csv/.tsv file encoding
+        :param compression: Compression of file: None, 'gzip', 'bz2' or 'xz'
+        :param chunk_size: Count of rows in one block
+        :param compression_level: Level of compression from 1 (the fastest) to 9 (the smallest file)
+        """
+        self.to_csv_in_background(file_name=file_name,
+                                  path_to_saving_folder=path_to_saving_folder,
+                                  delimeter=delimeter,
+                                  encoding=encoding,
+                                  compression=compression,
+                                  chunk_size=chunk_size,
+                                  compression_level=compression_level).wait()
+
+    def to_csv_in_background(self,
+                             file_name: str = None,
+                             path_to_saving_folder: str = None,
+                             delimeter: str = None,
+                             encoding: str = None,
+                             compression: str = None,
+                             chunk_size: int = 100000,
+                             compression_level: int = CSV_COMPRESSION_LEVEL) -> CsvExportHandle:
+        """
+        This method starts saving pd.DataFrame to .csv file by blocks of rows in the background thread,
+        so only one block is formatted in memory and the caller is not blocked.
+        The current rows of DataSet are written (cells, which are changed in place during the export, may be written)
+        :param file_name: File name (the extension of compression is added, if it is missing)
+        :param path_to_saving_folder: The path to the folder where the file will be saved
+        :param delimeter: Symbol-split in a .csv/.tsv file
+        :param encoding: Explicit indication of the .csv/.tsv file encoding
+        :param compression: Compression of file: None, 'gzip', 'bz2' or 'xz'
+        :param chunk_size: Count of rows in one block
+        :param compression_level: Level of compression from 1 (the fastest) to 9 (the smallest file)
+        :return: The handle of export with 'wait()', 'is_done' and 'progress'
         """
         if self.__dataset is None:
             raise Exception("The dataset has not been loaded yet!")
-        if file_name is not None and not file_name.endswith((".csv", ".tsv")):
+        check_csv_compression(compression=compression, compression_level=compression_level)
+        extension = CSV_COMPRESSIONS[compression]
+        if file_name is not None and not file_name.endswith((".csv", ".tsv", f".csv{extension}", f".tsv{extension}")):
             raise Exception("The dataset format should be '.csv' or '.tsv'!")
         if file_name is None:
             file_name = f"{self.__dataset_name}.csv"
+        if not file_name.endswith(extension):
+            file_name = f"{file_name}{extension}"
         if path_to_saving_folder is None:
             path_to_saving_folder = self.__dataset_save_path
         if encoding is not None and isinstance(encoding, str):
             self.set_encoding(encoding=encoding)
         if delimeter is not None and isinstance(delimeter, str):
             self.set_delimiter(delimiter=delimeter)
-        pd.DataFrame(self.__dataset).to_csv(os.path.join(path_to_saving_folder, file_name),
-                                            index=False,
-                                            sep=self.__delimiter,
-                                            encoding=self.__encoding)
+        return start_csv_export(dataframe=self.__dataset.copy(deep=False),
+                                path=os.path.join(path_to_saving_folder, file_name),
+                                delimiter=self.__delimiter,
+                                encoding=self.__encoding,
+                                compression=compression,
+                                chunk_size=chunk_size,
+                                compression_level=compression_level)
 
     def to_excel(self,
                  file_name: str = None,
                  path_to_saving_folder: str = None,
-                 sheet_name: str = None) -> None:
+                 sheet_name: str = None,
+                 background: bool = False) -> CsvExportHandle or None:
         """
         This method saves pd.DataFrame to excel file
         :param file_name: File name
         :param path_to_saving_folder: The path to the folder where the file will be saved
         :param sheet_name: Name of sheet in excel file
+        :param background: Responsible for writing the file in the background thread
+        :return: The handle of export with 'wait()', 'is_done' and 'progress', if 'background' is True
         """
         if self.__dataset is None:
             raise Exception("The dataset has not been loaded yet!")
-        if not file_name.endswith(".xlsx"):
-            raise Exception("The dataset format should be '.xlsx'!")
         if file_name is None:
             file_name = f"{self.__dataset_name}.xlsx"
+        if not file_name.endswith(".xlsx"):
+            raise Exception("The dataset format should be '.xlsx'!")
         if path_to_saving_folder is None:
             path_to_saving_folder = self.__dataset_save_path
         if sheet_name is not None:
@@ -1009,9 +1601,12 @@ class DataSet(object):
             sheet_name = self.__dataset_name
         else:
             sheet_name = os.path.basename(self.__dataset_file).replace(".csv", "").replace(".xlsx", "")
-        pd.DataFrame(self.__dataset).to_excel(os.path.join(path_to_saving_folder, file_name),
-                                              index=False,
-                                              sheet_name=sheet_name)
+        handle = start_excel_export(dataframe=self.__dataset.copy(deep=False),
+                                    path=os.path.join(path_to_saving_folder, file_name),
+                                    sheet_name=sheet_name)
+        if background:
+            return handle
+        handle.wait()
 
 
 
@@ -1077,33 +1672,198 @@ class DataSet(object):
     #         plt.savefig(os.path.join(path, plot_title + ".png"))
     #     plt.close()
 
+    def __export_segments(self, folder: str, dataset_filename: str, including_json: bool) -> None:
+        """
+        This method exports the dataset as the first segment of the segmented DataSet project
+        :param folder: The folder of project
+        :param dataset_filename: The name of project
+        :param including_json: Responsible for the export of statistics of all columns (otherwise only calculated)
+        """
+        if os.path.exists(os.path.join(folder, SEGMENTS_FOLDER)):  # Segments of the old export are not in the manifest
+            shutil.rmtree(os.path.join(folder, SEGMENTS_FOLDER))
+        manifest = {"dataset_filename": SEGMENTS_FOLDER,
+                    "manifest_filename": f"{dataset_filename}.json",
+                    "format": "segmented",
+                    "columns_names": list(self.__dataset_columns_name),
+                    "columns_count": self.__dataset_columns_name_count,
+                    "rows": 0,
+                    "delimiter": self.__delimiter,
+                    "encoding": self.__encoding,
+                    "columns": {},
+                    "segments": []}
+        manifest = write_segment(project_folder=folder, manifest=manifest, dataframe=self.__dataset)
+        for key in self.__dataset_columns_name:
+            column_type = self.__get_column_type(column_name=key)
+            if including_json and column_type in [ColumnType.INTEGER, ColumnType.FLOAT, ColumnType.STRING]:
+                column_stat = self.get_column_stat(column_name=key, extended=True)
+            else:  # Already calculated statistics are saved anyway
+                column_stat = self.__dataset_analytics.get(key)
+            if column_stat is not None:
+                save_column_stat(cache_folder=os.path.join(folder, "analytics"),
+                                 column_hash=manifest["columns"][key]["hash"],
+                                 column_stat=column_stat)
+
+    def __append_rows(self, dataframe: pd.DataFrame) -> None:
+        """
+        This method attaches the block of rows to the dataset (at bottom) and updates the statistics by this block
+        :param dataframe: The block of rows with the same columns as the dataset
+        """
+        if not self.__is_dataset_loaded:
+            warnings.warn(f'The dataset was not loaded. '
+                          f'An empty dataset was created with the columns {list(dataframe.columns)}!', UserWarning)
+            self.create_empty_dataset(columns_names=list(dataframe.columns))
+        if len(self.__dataset) == 0:  # Types of the empty dataset are unknown, so they are taken from the block
+            self.__dataset = dataframe.reset_index(drop=True)
+        else:
+            self.__dataset = pd.concat([self.__dataset, dataframe], ignore_index=True)
+        self.__move_to_memmap()
+        self.__update_dataset_base_info()
+        for key in self.__dataset_columns_name:
+            self.__update_column_analytics(column_name=key, added=dataframe[key])
+
+    def __render_rows(self, rows: pd.DataFrame, full_view: bool) -> str:
+        """
+        This method renders the slice of rows as the table. Strings longer than 50 symbols are truncated
+        by columns, and the statistics of columns are not calculated
+        :param rows: The slice of rows
+        :param full_view: Strings are not truncated
+        """
+        if not full_view:
+            rows = rows.copy()
+            for key in rows.columns:
+                # Only columns with strings are truncated, not string values of 'object' columns have no length
+                if pd.api.types.infer_dtype(rows[key], skipna=True) in ["string", "mixed", "mixed-integer"]:
+                    values = rows[key]
+                    is_long = values.str.len().fillna(0) > 50
+                    rows[key] = values.astype(object).where(~is_long, values.str[:47] + "...")
+        table = PrettyTable()
+        table.title = self.__dataset_name
+        table.field_names = list(self.__dataset_columns_name)
+        table.add_rows(rows.values.tolist())
+        return str(table)
+
+    def __get_rows_mask(self, rows: List[int] or np.ndarray or pd.Series) -> np.ndarray:
+        """
+        This method turns indexes of rows or the boolean mask into the boolean mask with the length of dataset
+        :param rows: Indexes of rows or the boolean mask
+        """
+        rows = rows.to_numpy() if isinstance(rows, pd.Series) else np.asarray(rows)
+        if rows.dtype == bool:
+            if len(rows) != self.__dataset_len:
+                raise Exception("The mask must have the same length as the dataset!")
+            return rows
+        if len(rows) > 0 and rows.dtype.kind not in "iu":
+            raise Exception("The rows must be the indexes of rows or the boolean mask!")
+        rows = rows.astype(np.int64)
+        if len(rows) > 0 and rows.min() < 0:
+            raise Exception("The row index must be greater than 0!")
+        if len(rows) > 0 and rows.max() >= self.__dataset_len:
+            raise Exception("The row index must be less than the number of rows in the dataset!")
+        mask = np.zeros(self.__dataset_len, dtype=bool)
+        mask[rows] = True
+        return mask
+
     def __get_column_type(self, column_name: str) -> ColumnType:
         """
-        This method learns the column type
+        This method returns the cached column type (learns it at the first call)
         :param column_name: Name of DataSet column
         """
-        types = []
-        for i in range(len(self.__dataset)):
-            column_type = type(self.__dataset.at[i, column_name]).__name__
-            if column_type == 'bool':
-                types.append(ColumnType.BOOLEAN)
-            elif column_type == 'int':
-                types.append(ColumnType.INTEGER)
-            elif column_type == 'float':
-                types.append(ColumnType.FLOAT)
-            elif column_type == 'str':
-                types.append(ColumnType.STRING)
-        if len(list(set(types))) == 1:
-            return types[0]
+        if column_name not in self.__dataset_columns_types:
+            self.__dataset_columns_types[column_name] = infer_column_type(values=self.__get_values(column_name),
+                                                                          sample_size=self.__type_sample_size)
+        return self.__dataset_columns_types[column_name]
+
+    def __update_column_analytics(self,
+                                  column_name: str,
+                                  added: pd.Series or list = None,
+                                  removed: pd.Series or list = None) -> None:
+        """
+        This method updates the precalculated statistics and the cached type of column by the changed rows only.
+        If the column has changed its type group (numerical <-> string), the statistics are removed
+        :param column_name: Name of DataSet column
+        :param added: Values, which were added to the column
+        :param removed: Values, which were removed from the column
+        """
+        self.__dataset_columns_hashes.pop(column_name, None)
+        column_type = self.__dataset_columns_types.pop(column_name, None)
+        if column_type is not None and self.__dataset[column_name].dtype == object:
+            # Only 'object' columns are learned by values, so we check, that the changed values keep the type
+            is_added_same = added is None or infer_column_type(values=added) in [column_type, ColumnType.NAN]
+            is_removed_same = removed is None or column_type != ColumnType.OBJECT
+            if is_added_same and is_removed_same:
+                self.__dataset_columns_types[column_name] = column_type
+        if column_name not in self.__dataset_analytics:
+            return
+        column_type = self.__get_column_type(column_name=column_name)
+        column_stat = self.__dataset_analytics[column_name]
+        if isinstance(column_stat, ColumnNumStat) and column_type in [ColumnType.INTEGER, ColumnType.FLOAT] or \
+                isinstance(column_stat, ColumnStrStat) and column_type == ColumnType.STRING:
+            column_stat.update(values=self.__dataset[column_name],
+                               added=added,
+                               removed=removed,
+                               column_type=column_type)
         else:
-            if len(types) == 2 and ColumnType.STRING in list(set(types)):
-                return ColumnType.STRING
-            return ColumnType.OBJECT
+            self.__dataset_analytics.pop(column_name)
+
+    def __drop_column_analytics(self, column_name: str) -> None:
+        """
+        This method removes the precalculated statistics and the cached type of column
+        :param column_name: Name of DataSet column
+        """
+        if column_name in self.__dataset_analytics:
+            self.__dataset_analytics.pop(column_name)
+        if column_name in self.__dataset_columns_types:
+            self.__dataset_columns_types.pop(column_name)
+        self.__dataset_columns_hashes.pop(column_name, None)
+
+    def __get_column_hash(self, column_name: str) -> str:
+        """
+        This method returns the cached content hash of column together with the settings of statistics
+        :param column_name: Name of DataSet column
+        """
+        if column_name not in self.__dataset_columns_hashes:
+            settings = (self.__get_column_type(column_name=column_name).name,
+                        self.__unique_threshold,
+                        self.__unique_error,
+                        self.__letters_sample_size)
+            self.__dataset_columns_hashes[column_name] = get_column_hash(column_name=column_name,
+                                                                         values=self.__get_values(column_name),
+                                                                         settings=settings)
+        return self.__dataset_columns_hashes[column_name]
 
-    def __read_dataset_info_from_json(self, data) -> None:
+    def __load_cached_column_stat(self, column_name: str, extended: bool) -> ColumnNumStat or ColumnStrStat or None:
         """
-        This method reads config and statistics info from .json file
+        This method loads the statistics of column from the persistent cache, if the column has not changed
+        :param column_name: Name of DataSet column
+        :param extended: Responsible for calculating additional parameters
+        """
+        if self.__analytics_cache_folder is None:
+            return None
+        column_stat = load_column_stat(cache_folder=self.__analytics_cache_folder,
+                                       column_hash=self.__get_column_hash(column_name=column_name))
+        if column_stat is None or (extended and not column_stat.is_extended):
+            return None
+        column_stat.bind_values(values=self.__get_values(column_name=column_name))  # For the lazy extended statistics
+        return column_stat
+
+    def __save_cached_column_stat(self, column_name: str, column_stat: ColumnNumStat or ColumnStrStat) -> None:
+        """
+        This method saves the statistics of column to the persistent cache
+        :param column_name: Name of DataSet column
+        :param column_stat: Statistics of column
+        """
+        if self.__analytics_cache_folder is None or column_stat is None:
+            return
+        save_column_stat(cache_folder=self.__analytics_cache_folder,
+                         column_hash=self.__get_column_hash(column_name=column_name),
+                         column_stat=column_stat)
+
+    def __read_dataset_info_from_json(self, data: dict, analytics_folder: str) -> None:
+        """
+        This method reads config and statistics info from .json file.
+        The statistics are loaded only for columns, which content hash has not changed
         :param data: json data
+        :param analytics_folder: The folder with saved statistics of project
         """
         self.__dataset_file = data["dataset_filename"]
         self.__dataset_columns_name = data["columns_names"]
@@ -1111,10 +1871,135 @@ class DataSet(object):
         self.__dataset_len = data["rows"]
         self.__delimiter = data["delimiter"]
         self.__encoding = data["encoding"]
+        is_segmented = data.get("format") == "segmented"  # Hashes of segments are chained, they are not recalculated
         for dk in self.__dataset_columns_name:
-            self.__dataset_analytics[dk] = DataSetColumn(column_name=dk)
-            self.__dataset_analytics[dk].get_from_json(data=data["columns"][dk],
-                                                       values=self.__dataset[dk].values)
+            column_hash = data["columns"].get(dk, {}).get("hash")
+            if column_hash is None or (not is_segmented and column_hash != self.__get_column_hash(column_name=dk)):
+                continue
+            column_stat = load_column_stat(cache_folder=analytics_folder, column_hash=column_hash)
+            if column_stat is not None:
+                column_stat.bind_values(values=self.__dataset[dk])
+                self.__dataset_analytics[dk] = column_stat
+
+    def __load_lazy_csv_dataset(self,
+                                filename: str,
+                                delimiter: str,
+                                encoding: str,
+                                dtype: Dict[str, type] or type,
+                                usecols: List[str],
+                                sample_size: int,
+                                csv_options: Dict[str, Any] = None) -> None:
+        """
+        This method reads only the header and the sample of first rows of the .csv file,
+        columns are read by '__read_lazy_columns' at the first use
+        :param filename: The name of the .csv file
+        :param delimiter: Symbol-split in a .csv file
+        :param encoding: Explicit indication of the .csv file encoding
+        :param dtype: Types of columns
+        :param usecols: Names of columns, which are loaded (None - all columns)
+        :param sample_size: Count of first rows, by which types of columns are learned
+        :param csv_options: Other parameters of 'pd.read_csv' (for example, the sniffed 'quotechar')
+        """
+        if not isinstance(sample_size, int) or sample_size <= 0:
+            raise Exception("The 'lazy_sample_size' must be an integer large, then 0!")
+        csv_options = csv_options if csv_options is not None else {}
+        sample = self.__read_from_csv(filename=filename, delimiter=delimiter, encoding=encoding,
+                                      dtype=dtype, usecols=usecols, nrows=sample_size, **csv_options)
+        self.__dataset = pd.DataFrame()
+        self.__lazy_columns = list(sample.columns)
+        self.__lazy_types = {key: infer_column_type(values=sample[key]) for key in sample.columns}
+        self.__lazy_source = {"filename": filename, "delimiter": delimiter, "encoding": encoding, "dtype": dtype,
+                              **csv_options}
+        self.__dataset_columns_name = sample.columns
+        self.__dataset_columns_name_count = len(sample.columns)
+
+    def __read_lazy_columns(self, columns: List[str]) -> None:
+        """
+        This method reads columns of the lazy dataset, which are not read yet, from the .csv file by one pass
+        :param columns: Names of columns
+        """
+        columns = [key for key in columns if key in self.__lazy_columns]
+        if len(columns) == 0:
+            return
+        values = self.__read_from_csv(usecols=columns, **self.__lazy_source)
+        if len(self.__frame.columns) > 0:
+            values = pd.concat([self.__frame, values], axis=1)
+        self.__frame = values[[key for key in self.__dataset_columns_name if key in values.columns]]
+        self.__lazy_columns = [key for key in self.__lazy_columns if key not in columns]
+        for key in columns:
+            self.__lazy_types.pop(key, None)
+        self.__dataset_len = len(self.__frame)
+        self.__move_to_memmap()
+
+    def __iter_blocks(self, columns: List[str], block_size: int) -> Iterator[pd.DataFrame]:
+        """
+        This method iterates over blocks of rows of columns. Columns of the lazy dataset, which are not read yet,
+        are read from the .csv file by chunks of 'block_size' rows, other columns are sliced from the dataset
+        :param columns: Names of columns
+        :param block_size: Count of rows in one block
+        """
+        if self.__frame is None:
+            raise Exception("The dataset has not been uploaded yet!")
+        for key in columns:
+            if key not in self.__dataset_columns_name:
+                raise Exception(f"The \"{key}\" column does not exist in this dataset!")
+        unread = [key for key in dict.fromkeys(columns) if key in self.__lazy_columns]
+        if len(unread) == 0:
+            dataframe = self.__frame[columns]
+            for start in range(0, len(dataframe), block_size):
+                yield dataframe.iloc[start:start + block_size]
+            return
+        dataframe = self.__frame[[key for key in dict.fromkeys(columns) if key not in unread]]
+        start = 0
+        with self.__read_from_csv(usecols=unread, chunksize=block_size, **self.__lazy_source) as reader:
+            for chunk in reader:  # Rows of the lazy dataset can not be changed, so the file has the same rows
+                block = dataframe.iloc[start:start + len(chunk)].reset_index(drop=True)
+                block = pd.concat([block, chunk.reset_index(drop=True)], axis=1)
+                start += len(chunk)
+                yield block[columns]
+
+    def __get_values(self, column_name: str) -> pd.Series:
+        """
+        This method returns values of column (the column of the lazy dataset is read at the first call)
+        :param column_name: Name of DataSet column
+        """
+        self.__read_lazy_columns(columns=[column_name])
+        return self.__frame[column_name]
+
+    def __move_to_memmap(self) -> None:
+        """
+        This method copies numerical columns, which are in memory, to memory mapped files
+        (if the memory mapped backend is set). The files of replaced and deleted columns are deleted
+        """
+        if self.__memmap_folder is None or self.__frame is None:
+            return
+        columns = {}
+        is_moved = False
+        for key in self.__frame.columns:  # Only read columns of the lazy dataset are moved
+            values = self.__frame[key]
+            if is_memmap_dtype(values.dtype) and not is_memmap(values.to_numpy()):
+                path = os.path.join(self.__memmap_folder, f"{self.__dataset_name}_{self.__memmap_counter}.npy")
+                self.__memmap_counter += 1
+                values = to_memmap(values=values.to_numpy(), path=path)
+                self.__set_memmap_file(column_name=key, path=path)
+                is_moved = True
+            columns[key] = values
+        if is_moved:
+            self.__frame = pd.DataFrame(columns, columns=list(self.__frame.columns), copy=False)
+        for key in list(self.__memmap_files):  # For example, the column was deleted or converted to strings
+            if key not in self.__frame.columns or not is_memmap(self.__frame[key].to_numpy()):
+                remove_memmap_files(paths=[self.__memmap_files.pop(key)])
+
+    def __set_memmap_file(self, column_name: str, path: str) -> None:
+        """
+        This method sets the memory mapped file of column and deletes the old file of this column
+        :param column_name: Name of DataSet column
+        :param path: The path of file
+        """
+        old_path = self.__memmap_files.get(column_name)
+        self.__memmap_files[column_name] = path
+        if old_path is not None and old_path != path:
+            remove_memmap_files(paths=[old_path])
 
     def __update_dataset_base_info(self) -> None:
         """
@@ -1128,50 +2013,208 @@ class DataSet(object):
             self.__dataset_columns_name_count = len(self.__dataset.keys())
 
     @staticmethod
-    def __dif_lists_index(list_a: list, list_b: list) -> List[int]:
-        diff = []
-        for i in range(min(len(list_a), len(list_b))):
-            if list_a[i] != list_b[i]:
-                diff.append(i)
-        return diff
+    def __get_diff_mask(values_a: pd.Series, values_b: pd.Series) -> np.ndarray:
+        """
+        This method compares values of two columns with the same length by positions, NaN is equal to NaN
+        :param values_a: Values of the first column
+        :param values_b: Values of the second column
+        :return: The boolean mask of different values
+        """
+        values_a = values_a.reset_index(drop=True)
+        values_b = values_b.reset_index(drop=True)
+        if isinstance(values_a.dtype, pd.CategoricalDtype):  # Categories of compared columns can be different
+            values_a = values_a.astype(object)
+        if isinstance(values_b.dtype, pd.CategoricalDtype):
+            values_b = values_b.astype(object)
+        is_different = (values_a != values_b) & ~(values_a.isna() & values_b.isna())
+        return is_different.to_numpy(dtype=bool, na_value=True)
+
+    @staticmethod
+    def __downcast_numbers(values: pd.Series, float_tolerance: float = None) -> pd.Series:
+        """
+        This method downcasts numerical values to the smallest type, which keeps all values exactly
+        (or floats with the relative error not more than 'float_tolerance')
+        :param values: Values from numerical column
+        :param float_tolerance: The maximum relative error of float values (None - values are kept exactly)
+        """
+        if pd.api.types.is_integer_dtype(values.dtype):
+            return pd.to_numeric(values, downcast="integer")
+        if values.dtype == np.float64:
+            source = values.to_numpy()
+            with np.errstate(over="ignore"):  # Too large values become infinite and are not in the tolerance
+                downcasted = source.astype(np.float32)
+            if float_tolerance is None:
+                is_kept = np.array_equal(downcasted.astype(np.float64), source, equal_nan=True)
+            else:  # NaN and infinite values are kept by float32 exactly
+                finite = np.isfinite(source)
+                errors = np.abs(downcasted[finite].astype(np.float64) - source[finite])
+                is_kept = bool(np.all(errors <= float_tolerance * np.abs(source[finite])))
+            if is_kept:
+                return pd.Series(downcasted, index=values.index, name=values.name)
+        return values
+
+    def __read_from_csv_by_chunks(self,
+                                  filename: str,
+                                  delimiter: str,
+                                  encoding: str,
+                                  dtype: Dict[str, type] or type,
+                                  usecols: List[str],
+                                  chunk_size: int,
+                                  memory_limit: int,
+                                  csv_options: Dict[str, Any] = None) -> None:
+        """
+        This method reads the dataset from a .csv file by chunks and accumulates the simple statistics of columns
+        by the running update of statistics with each chunk. The order statistics (median, unique count)
+        are recalculated at the first request. Chunks of each column are concatenated and released column by column,
+        so at the end only the largest column is in memory twice (it is counted in 'memory_limit' too)
+        :param filename: The name of the .csv file
+        :param delimiter: Symbol-split in a .csv file
+        :param encoding: Explicit indication of the .csv file encoding
+        :param dtype: Types of columns
+        :param usecols: Names of columns, which are loaded
+        :param chunk_size: Count of rows in one chunk (None - a tenth of 'memory_limit')
+        :param memory_limit: The maximum memory of the loaded dataset in bytes
+        :param csv_options: Other parameters of 'pd.read_csv' (for example, the sniffed 'quotechar')
+        """
+        csv_options = csv_options if csv_options is not None else {}
+        if chunk_size is None:  # The size of row is estimated by the first rows of file
+            prefix = self.__read_from_csv(filename=filename, delimiter=delimiter, encoding=encoding,
+                                          dtype=dtype, usecols=usecols, nrows=1000, **csv_options)
+            row_size = max(prefix.memory_usage(index=False, deep=True).sum() / max(len(prefix), 1), 1)
+            chunk_size = max(int(memory_limit / 10 / row_size), 1)
+        pieces = {}  # Column name -> chunks of column, which is kept in memory
+        columns_sizes = {}  # Column name -> memory of its chunks in bytes
+        columns_stat = {}
+        columns_names = None
+        memmap_writer = None
+        if self.__memmap_folder is not None:  # Numerical columns are written to files and are not kept in memory
+            memmap_writer = MemmapColumnsWriter(folder=self.__memmap_folder,
+                                                prefix=f"{self.__dataset_name}_{self.__memmap_counter}")
+            self.__memmap_counter += 1
+        try:  # Files of the failed reading are deleted at once
+            for chunk in self.__read_from_csv(filename=filename, delimiter=delimiter, encoding=encoding,
+                                              dtype=dtype, usecols=usecols, chunksize=chunk_size, **csv_options):
+                if columns_names is None:
+                    columns_names = list(chunk.columns)
+                for key in chunk.columns:
+                    column_type = infer_column_type(values=chunk[key])
+                    if key not in columns_stat or columns_stat[key] is None:
+                        columns_stat[key] = calculate_column_stat(column_name=key,
+                                                                  values=chunk[key],
+                                                                  extended=False,
+                                                                  column_type=column_type,
+                                                                  unique_threshold=self.__unique_threshold,
+                                                                  unique_error=self.__unique_error,
+                                                                  letters_sample_size=self.__letters_sample_size)
+                    elif columns_stat[key] is not False:  # False - the column has changed its type group
+                        is_num_stat = isinstance(columns_stat[key], ColumnNumStat)
+                        is_num_chunk = column_type in [ColumnType.INTEGER, ColumnType.FLOAT]
+                        if is_num_stat == is_num_chunk or bool(chunk[key].isna().all()):
+                            columns_stat[key].update(values=None, added=chunk[key])
+                        else:
+                            columns_stat[key] = False
+                if memmap_writer is not None:
+                    chunk, restored = memmap_writer.write(chunk=chunk)
+                    for key, values in restored.items():  # The column has got text, so it is kept in memory
+                        pieces[key] = [values]
+                        columns_sizes[key] = int(values.memory_usage(index=False, deep=True))
+                for key in chunk.columns:  # The copy does not keep the block of other columns of chunk
+                    pieces.setdefault(key, []).append(chunk[key].copy())
+                    columns_sizes[key] = columns_sizes.get(key, 0) + \
+                        int(chunk[key].memory_usage(index=False, deep=True))
+                if memory_limit is not None and len(columns_sizes) > 0:
+                    # At the concatenation the largest column is in memory twice: in chunks and concatenated
+                    if sum(columns_sizes.values()) + max(columns_sizes.values()) > memory_limit:
+                        raise Exception(f"The dataset takes more, than {memory_limit} bytes! "
+                                        f"Use 'usecols' and 'dtype' to load less data.")
+        except BaseException:
+            if memmap_writer is not None:
+                memmap_writer.remove_files()
+            raise
+        if columns_names is None:
+            self.__dataset = self.__read_from_csv(filename=filename, delimiter=delimiter, encoding=encoding,
+                                                  dtype=dtype, usecols=usecols, **csv_options)
+        else:
+            memmap_columns = memmap_writer.get_columns() if memmap_writer is not None else {}
+            columns = {}
+            for key in columns_names:
+                if key in memmap_columns:
+                    columns[key] = memmap_columns[key]
+                else:  # Chunks of column are released at once after its concatenation
+                    columns[key] = pd.concat(pieces.pop(key), ignore_index=True)
+            self.__dataset = pd.DataFrame(columns, copy=False)
+            del columns
+            for key, path in (memmap_writer.get_files().items() if memmap_writer is not None else []):
+                self.__set_memmap_file(column_name=key, path=path)
+        self.__update_dataset_base_info()
+        for key, column_stat in columns_stat.items():
+            if not column_stat:
+                continue
+            column_type = self.__get_column_type(column_name=key)
+            if isinstance(column_stat, ColumnNumStat) and column_type in [ColumnType.INTEGER, ColumnType.FLOAT] or \
+                    isinstance(column_stat, ColumnStrStat) and column_type == ColumnType.STRING:
+                column_stat.update(values=self.__dataset[key], column_type=column_type)
+                self.__dataset_analytics[key] = column_stat
 
     @staticmethod
     def __read_from_csv(filename: str,
                         delimiter: str,
-                        encoding: str = 'utf-8') -> pd.DataFrame:
+                        encoding: str = 'utf-8',
+                        dtype: Dict[str, type] or type = None,
+                        usecols: List[str] = None,
+                        **kwargs) -> pd.DataFrame:
         """
         This method reads the dataset from a .csv file
         :param filename: The name of the .csv file
         :param delimiter: Symbol-split in a .csv file
         :param encoding: Explicit indication of the .csv file encoding
+        :param dtype: Types of columns
+        :param usecols: Names of columns, which are loaded (None - all columns)
+        :param kwargs: Other parameters of 'pd.read_csv' (for example, 'chunksize')
         """
         return pd.read_csv(filename,
                            encoding=encoding,
-                           delimiter=delimiter)
+                           delimiter=delimiter,
+                           dtype=dtype,
+                           usecols=usecols,
+                           **kwargs)
 
     @staticmethod
-    def __read_from_xlsx(filename: str,
-                         sheet_name: str) -> pd.DataFrame:
+    def sniff_csv_file(csv_file: str, prefix_size: int = 1 << 16) -> Dict[str, Any]:
         """
-        This method reads the dataset from a .csv file
-        :param filename: The name of the .csv file
+        This method detects the delimiter, the quote character, the encoding, the header and types of columns
+        by the bounded prefix of .csv file
+        :param csv_file: The name of the .csv file
+        :param prefix_size: The maximum count of bytes, which are read from the beginning of file
         """
-        for engine in ["xlrd", "openpyxl", "odf", "pyxlsb"]:
-            try:
-                return pd.read_excel(filename, sheet_name=sheet_name, engine=engine)
-            except:
-                pass
+        return sniff_csv(filename=str(csv_file), prefix_size=prefix_size)
 
     @staticmethod
     def get_excel_sheet_names(excel_file: str) -> List[str]:
         """
-        This method loads the dataset into the DataSet class
+        This method returns names of sheets in the excel file
         :param excel_file: The name of the excel file
         """
-        if excel_file is not None:  # Checking that the uploaded file has the .csv format
-            if not excel_file.endswith(tuple(DataSet.supported_formats)):
-                raise Exception(f"The dataset format should be {', '.join(DataSet.supported_formats)}!")
-        return pd.ExcelFile(excel_file).sheet_names
+        with open_excel_file(excel_file=str(excel_file)) as workbook:
+            return list(workbook.sheet_names)
+
+    @staticmethod
+    def load_excel_sheets(excel_file: str, sheet_names: List[str] = None, n_jobs: int = 1) -> Dict[str, 'DataSet']:
+        """
+        This method loads several sheets of the excel file into several DataSets, which are named as sheets.
+        Sheets are read in the pool of processes, and each process opens the workbook once
+        :param excel_file: The name of the excel file
+        :param sheet_names: Names of sheets (None - all sheets)
+        :param n_jobs: The number of processes (-1 - all processors)
+        :return: Dict, where the key is the sheet name and the value is DataSet of sheet
+        """
+        datasets = {}
+        for sheet_name, dataframe in read_excel_sheets(excel_file=str(excel_file),
+                                                       sheet_names=sheet_names,
+                                                       n_jobs=n_jobs).items():
+            datasets[sheet_name] = DataSet(dataset_name=str(sheet_name))
+            datasets[sheet_name].load_DataFrame(dataframe=dataframe)
+        return datasets
 
 
 def merge_two_dicts(dict1: dict, dict2: dict) -> dict:
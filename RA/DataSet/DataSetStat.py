@@ -1,26 +1,31 @@
+import numpy as np
 import pandas as pd
+from scipy import stats
+from typing import List, Tuple
 from prettytable import PrettyTable
 
 
 class CorrelationMatrix:
-    def __init__(self, keys: list) -> None:
+    def __init__(self, keys: list, matrix: np.ndarray = None) -> None:
         """
         This method init the work of this class
         :param keys: List of DataSet column names
+        :param matrix: Already calculated square matrix of correlations in the order of keys (None - empty matrix)
         """
-        self.__keys = keys
-        self.__correlation_matrix = {}
-        for outkey in keys:
-            self.__correlation_matrix[outkey] = {}
-            for inkey in keys:
-                self.__correlation_matrix[outkey][inkey] = float('nan')
+        self.__keys = list(keys)
+        self.__indexes = {key: i for i, key in enumerate(self.__keys)}
+        if matrix is None:
+            matrix = np.full((len(self.__keys), len(self.__keys)), float('nan'))
+        if matrix.shape != (len(self.__keys), len(self.__keys)):
+            raise Exception("The correlation matrix must be square and have as many rows as there are keys!")
+        self.__correlation_matrix = matrix
 
     def __str__(self) -> str:
         table = PrettyTable()
         table.title = f"Correlation Matrix"
         table.field_names = ["Name"] + list(self.__keys)
-        for key in self.__correlation_matrix:
-            table.add_row([key] + list(self.__correlation_matrix[key].values()))
+        for i, key in enumerate(self.__keys):
+            table.add_row([key] + self.__correlation_matrix[i].tolist())
         return str(table)
 
     def is_cell_free(self, column_name_a: str, column_name_b: str) -> bool:
@@ -30,11 +35,7 @@ class CorrelationMatrix:
         :param column_name_b: column name of DataSet
         :return: is cell filled
         """
-        if column_name_a not in self.__keys:
-            raise Exception(f"The \"{column_name_a}\" column does not exist in this dataset!")
-        if column_name_b not in self.__keys:
-            raise Exception(f"The \"{column_name_b}\" column does not exist in this dataset!")
-        return pd.isna(self.__correlation_matrix[column_name_a][column_name_b])
+        return pd.isna(self.__correlation_matrix[self.__get_index(column_name_a), self.__get_index(column_name_b)])
 
     def add_corr(self, column_name_a: str, column_name_b: str, value: float) -> None:
         """
@@ -44,12 +45,10 @@ class CorrelationMatrix:
         :param value: coefficient of correlation between column_name_a values and column_name_b values
         :return: None
         """
-        if column_name_a not in self.__keys:
-            raise Exception(f"The \"{column_name_a}\" column does not exist in this dataset!")
-        if column_name_b not in self.__keys:
-            raise Exception(f"The \"{column_name_b}\" column does not exist in this dataset!")
-        self.__correlation_matrix[column_name_a][column_name_b] = value
-        self.__correlation_matrix[column_name_b][column_name_a] = value
+        index_a = self.__get_index(column_name_a)
+        index_b = self.__get_index(column_name_b)
+        self.__correlation_matrix[index_a, index_b] = value
+        self.__correlation_matrix[index_b, index_a] = value
 
     def get_corr(self, column_name_a: str, column_name_b: str) -> float:
         """
@@ -58,8 +57,76 @@ class CorrelationMatrix:
         :param column_name_b: column name of DataSet
         :return: coefficient of correlation between column_name_a values and column_name_b values
         """
-        if column_name_a not in self.__keys:
-            raise Exception(f"The \"{column_name_a}\" column does not exist in this dataset!")
-        if column_name_b not in self.__keys:
-            raise Exception(f"The \"{column_name_b}\" column does not exist in this dataset!")
-        return self.__correlation_matrix[column_name_a][column_name_b]
+        return float(self.__correlation_matrix[self.__get_index(column_name_a), self.__get_index(column_name_b)])
+
+    def get_matrix(self) -> np.ndarray:
+        """
+        This method returns the correlation matrix as ndarray in the order of keys
+        """
+        return self.__correlation_matrix
+
+    def get_top_correlations(self, count: int = 10, absolute: bool = True) -> List[Tuple[str, str, float]]:
+        """
+        This method returns "count" pairs of different columns with the largest correlation
+        :param count: Count of pairs
+        :param absolute: Compare the absolute values of correlation (negative correlations are strong too)
+        :return: List of (column_name_a, column_name_b, coefficient of correlation) in descending order
+        """
+        if count <= 0:
+            raise Exception("Count of pairs 'count' should be large, then 0!")
+        rows, columns = np.triu_indices(len(self.__keys), k=1)
+        values = self.__correlation_matrix[rows, columns]
+        scores = np.abs(values) if absolute else values.copy()
+        scores[np.isnan(scores)] = -np.inf
+        count = min(count, int(np.count_nonzero(np.isfinite(scores))))
+        if count == 0:
+            return []
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.__keys[rows[i]], self.__keys[columns[i]], float(values[i])) for i in top]
+
+    def __get_index(self, column_name: str) -> int:
+        """
+        This method returns the index of column in the matrix
+        :param column_name: column name of DataSet
+        """
+        if column_name not in self.__indexes:
+            raise Exception(f"The \"{column_name}\" column does not exist in this dataset!")
+        return self.__indexes[column_name]
+
+
+def calculate_correlations(values: np.ndarray, method: str = "pearson", block_size: int = 1000) -> np.ndarray:
+    """
+    This method calculates the correlation matrix of all columns of 2D array by matrix multiplication.
+    For wide tables it is done by blocks of "block_size" columns, so only two standardized blocks are in memory
+    :param values: 2D array, where each column is a column of DataSet
+    :param method: Method of correlation: 'pearson' or 'spearman'
+    :param block_size: Count of columns in one block
+    """
+    if method not in ["pearson", "spearman"]:
+        raise Exception(f"'{method}' is an invalid method of correlation. Valid methods: pearson, spearman")
+    if block_size <= 0:
+        raise Exception("The 'block_size' should be large, then 0!")
+    columns_count = values.shape[1]
+    blocks = [(start, min(start + block_size, columns_count)) for start in range(0, columns_count, block_size)]
+    result = np.empty((columns_count, columns_count))
+    for i, (start_a, end_a) in enumerate(blocks):
+        block_a = __standardize(values[:, start_a:end_a], method=method)
+        for start_b, end_b in blocks[i:]:
+            block_b = block_a if start_b == start_a else __standardize(values[:, start_b:end_b], method=method)
+            result[start_a:end_a, start_b:end_b] = block_a.T @ block_b
+            result[start_b:end_b, start_a:end_a] = result[start_a:end_a, start_b:end_b].T
+    return np.clip(result, -1, 1)
+
+
+def __standardize(values: np.ndarray, method: str) -> np.ndarray:
+    """
+    This method centers the columns and divides them by their norm, so the product of two columns is their correlation
+    :param values: 2D array of columns
+    :param method: Method of correlation: 'pearson' or 'spearman'
+    """
+    if method == "spearman":
+        values = stats.rankdata(values, axis=0)
+    values = values - values.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return values / np.sqrt((values ** 2).sum(axis=0))  # Constant columns turn to NaN, as in np.corrcoef
@@ -0,0 +1,77 @@
+import math
+import numpy as np
+import pandas as pd
+
+
+class HyperLogLog:
+    def __init__(self, error: float = 0.01) -> None:
+        """
+        This method init the approximate counter of unique values
+        :param error: Relative standard error of the count (the less it is, the more memory is used)
+        """
+        if not 0 < error < 1:
+            raise Exception("The 'error' must be between 0 and 1!")
+        self.__error = error
+        self.__precision = min(max(math.ceil(math.log2((1.04 / error) ** 2)), 4), 18)
+        self.__registers = np.zeros(2 ** self.__precision, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        """
+        This method returns the estimated count of unique values
+        """
+        return self.count()
+
+    @property
+    def error(self) -> float:
+        """
+        This property returns the relative standard error of the count
+        """
+        return self.__error
+
+    def add(self, values: pd.Series or np.ndarray or list) -> None:
+        """
+        This method adds values to the counter (vectorized, without a set of values)
+        :param values: Values from column
+        """
+        values = values.to_numpy() if isinstance(values, pd.Series) else pd.Series(values).to_numpy()
+        if len(values) == 0:
+            return
+        hashes = pd.util.hash_array(values, categorize=False)
+        rest_bits = 64 - self.__precision
+        indexes = (hashes >> np.uint64(rest_bits)).astype(np.int64)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        ranks = (rest_bits - HyperLogLog.__get_bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.__registers, indexes, ranks)
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """
+        This method merges other counter with the same error into this one
+        :param other: Other counter
+        """
+        if other.error != self.__error:
+            raise Exception("Only counters with the same error can be merged!")
+        np.maximum(self.__registers, other.__registers, out=self.__registers)
+
+    def count(self) -> int:
+        """
+        This method returns the estimated count of unique values
+        """
+        registers_count = len(self.__registers)
+        alpha = 0.7213 / (1 + 1.079 / registers_count)
+        estimate = alpha * registers_count ** 2 / np.sum(np.ldexp(1.0, -self.__registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.__registers == 0))
+        if zeros > 0:  # Linear counting is more accurate for small counts, where the raw estimate is biased
+            linear_estimate = registers_count * math.log(registers_count / zeros)
+            if linear_estimate <= 3 * registers_count:
+                estimate = linear_estimate
+        return int(round(estimate))
+
+    @staticmethod
+    def __get_bit_length(values: np.ndarray) -> np.ndarray:
+        """
+        This method calculates the bit length of each uint64 value (exactly, by 32-bit halves)
+        :param values: Array of uint64 values
+        """
+        high = (values >> np.uint64(32)).astype(np.float64)
+        low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
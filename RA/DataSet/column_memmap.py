@@ -0,0 +1,151 @@
+import os
+import mmap
+import weakref
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Tuple
+
+PROMOTION_BLOCK_SIZE = 1 << 20  # Count of values, which are converted at once at the promotion of column dtype
+
+
+def is_memmap(values: np.ndarray) -> bool:
+    """
+    This method checks, that the array is a view of memory mapped file
+    :param values: Array of column values
+    """
+    while values is not None:
+        if isinstance(values, (np.memmap, mmap.mmap)):
+            return True
+        values = getattr(values, "base", None)
+    return False
+
+
+def is_memmap_dtype(dtype: np.dtype) -> bool:
+    """
+    This method checks, that the column of this dtype can be placed in the memory mapped file
+    :param dtype: The dtype of column
+    """
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def to_memmap(values: np.ndarray, path: str) -> np.ndarray:
+    """
+    This method copies the array to the new memory mapped .npy file
+    :param values: Array of column values
+    :param path: The path of new file
+    """
+    memmap = np.lib.format.open_memmap(path, mode="w+", dtype=values.dtype, shape=values.shape)
+    memmap[:] = values
+    memmap.flush()
+    return memmap
+
+
+def remove_memmap_files(paths: Iterable[str]) -> None:
+    """
+    This method deletes memory mapped files
+    :param paths: Paths of files
+    """
+    for path in list(paths):
+        try:  # The file can still be mapped by other DataFrame (on Windows it can not be deleted)
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class MemmapColumnsWriter:
+    def __init__(self, folder: str, prefix: str) -> None:
+        """
+        This method init the writer, which appends numerical columns of chunks to raw files,
+        so only the current chunk of these columns is in memory.
+        Files are deleted with the writer (for example, if the reading has failed), until 'get_files' is called
+        :param folder: The folder of files
+        :param prefix: The prefix of files names (it must be unique for each writing)
+        """
+        os.makedirs(folder, exist_ok=True)
+        self.__folder = folder
+        self.__prefix = prefix
+        self.__files = {}  # Column name -> [path, dtype, count of rows]
+        self.__paths = []  # Paths of files, which are deleted with the writer
+        self.__files_count = 0
+        self.__chunks_count = 0
+        self.__finalizer = weakref.finalize(self, remove_memmap_files, self.__paths)
+
+    def write(self, chunk: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, pd.Series]]:
+        """
+        This method appends numerical columns of chunk to files. If the column gets not numerical values
+        (for example, text), its file is read back to memory and the column is not written to files anymore
+        :param chunk: Chunk of DataFrame
+        :return: The chunk without columns, which were written to files,
+        and values of previous chunks of columns, which were read back to memory
+        """
+        written = []
+        restored = {}
+        for key in chunk.columns:
+            if key not in self.__files:
+                if self.__chunks_count > 0 or not is_memmap_dtype(chunk[key].dtype):
+                    continue  # Only columns, which are numerical in the first chunk, are written to files
+                path = os.path.join(self.__folder, f"{self.__prefix}_{self.__files_count}.dat")
+                self.__files_count += 1
+                self.__paths.append(path)
+                open(path, 'wb').close()
+                self.__files[key] = [path, chunk[key].dtype, 0]
+            path, dtype, rows = self.__files[key]
+            values = chunk[key].to_numpy()
+            if values.dtype != dtype:  # For example, NaN appeared in integer column
+                if not is_memmap_dtype(values.dtype):
+                    restored[key] = pd.Series(np.fromfile(path, dtype=dtype, count=rows), name=key)
+                    self.__files.pop(key)
+                    self.__paths.remove(path)
+                    remove_memmap_files(paths=[path])
+                    continue
+                new_dtype = np.result_type(dtype, values.dtype)
+                if new_dtype != dtype:
+                    self.__promote(path=path, dtype=dtype, new_dtype=new_dtype, rows=rows)
+                    self.__files[key][1] = dtype = new_dtype
+                values = values.astype(dtype)
+            with open(path, 'ab') as column_file:
+                column_file.write(np.ascontiguousarray(values).tobytes())
+            self.__files[key][2] = rows + len(values)
+            written.append(key)
+        self.__chunks_count += 1
+        return chunk.drop(columns=written), restored
+
+    def get_files(self) -> Dict[str, str]:
+        """
+        This method returns the written files, since then they are not deleted with the writer
+        :return: Dict, where the key is the column name and the value is the path of file
+        """
+        self.__paths.clear()
+        return {key: path for key, (path, dtype, rows) in self.__files.items()}
+
+    def remove_files(self) -> None:
+        """
+        This method deletes the written files at once (for example, if the reading has failed)
+        """
+        self.__finalizer()
+
+    def get_columns(self) -> Dict[str, np.ndarray]:
+        """
+        This method maps the written files to memory
+        :return: Dict, where the key is the column name and the value is the memory mapped array
+        """
+        return {key: np.memmap(path, dtype=dtype, mode="r+", shape=(rows,)) if rows > 0 else np.empty(0, dtype=dtype)
+                for key, (path, dtype, rows) in self.__files.items()}
+
+    @staticmethod
+    def __promote(path: str, dtype: np.dtype, new_dtype: np.dtype, rows: int) -> None:
+        """
+        This method converts the written values of column to the new dtype by blocks,
+        so the column is not loaded to memory entirely
+        :param path: The path of file
+        :param dtype: The dtype of written values
+        :param new_dtype: The new dtype of values
+        :param rows: Count of written values
+        """
+        new_path = f"{path}.tmp"
+        with open(new_path, 'wb') as new_file:
+            for start in range(0, rows, PROMOTION_BLOCK_SIZE):
+                block = np.fromfile(path, dtype=dtype, count=min(PROMOTION_BLOCK_SIZE, rows - start),
+                                    offset=start * dtype.itemsize)
+                new_file.write(block.astype(new_dtype).tobytes())
+        os.replace(new_path, path)
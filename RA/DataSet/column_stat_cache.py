@@ -0,0 +1,57 @@
+import os
+import pickle
+import hashlib
+import numpy as np
+import pandas as pd
+from RA.DataSet.ColumnNumStat import *
+from RA.DataSet.ColumnStrStat import *
+
+
+STATS_VERSION = 1  # It must be increased, when the statistics classes are changed, so the old cache is not used
+
+
+def get_column_hash(column_name: str, values: pd.Series, settings: tuple = ()) -> str:
+    """
+    This method calculates the content hash of column, which is the key of its statistics in the cache.
+    The buffer of numerical columns is hashed as is, other columns are hashed by the vectorized pandas hashing
+    :param column_name: The name of DataSet column
+    :param values: Values from column
+    :param settings: Settings, which change the result of statistics (for example, the column type)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((STATS_VERSION, column_name, str(values.dtype), len(values), settings)).encode())
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+        digest.update(np.ascontiguousarray(values.to_numpy()).view(np.uint8).data)
+    else:
+        digest.update(pd.util.hash_pandas_object(values, index=False, categorize=False).to_numpy().data)
+    return digest.hexdigest()
+
+
+def load_column_stat(cache_folder: str, column_hash: str) -> ColumnNumStat or ColumnStrStat or None:
+    """
+    This method loads the statistics of column from the cache (the cache folder must be trusted, because it is pickle)
+    :param cache_folder: The folder of cache
+    :param column_hash: The content hash of column
+    :return: Statistics or None, if there is no such column in the cache
+    """
+    path = os.path.join(cache_folder, f"{column_hash}.pkl")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as cache_file:
+            return pickle.load(cache_file)
+    except Exception:  # The broken file of cache is the same as missing one
+        return None
+
+
+def save_column_stat(cache_folder: str, column_hash: str, column_stat: ColumnNumStat or ColumnStrStat) -> None:
+    """
+    This method saves the statistics of column to the cache (without the column values)
+    :param cache_folder: The folder of cache
+    :param column_hash: The content hash of column
+    :param column_stat: Statistics of column
+    """
+    path = os.path.join(cache_folder, f"{column_hash}.pkl")
+    with open(f"{path}.tmp", 'wb') as cache_file:
+        pickle.dump(column_stat, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{path}.tmp", path)  # The file appears at once, so other sessions never read a half-written file
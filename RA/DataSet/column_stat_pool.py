@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+from multiprocessing import shared_memory
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from RA.DataSet.enum_column_type import *
+from RA.DataSet.ColumnNumStat import *
+from RA.DataSet.ColumnStrStat import *
+from RA.DataSet.jobs_count import *
+
+
+def calculate_column_stat(column_name: str,
+                          values: pd.Series or np.ndarray,
+                          extended: bool,
+                          column_type: ColumnType,
+                          unique_threshold: int = None,
+                          unique_error: float = 0.01,
+                          letters_sample_size: int = None) -> ColumnNumStat or ColumnStrStat or None:
+    """
+    This method calculates statistics of one column according to its type
+    :param column_name: The name of DataSet column
+    :param values: Values from column
+    :param extended: Responsible for calculating additional parameters
+    :param column_type: The type of column
+    :param unique_threshold: The count of values, above which the unique strings are counted approximately
+    :param unique_error: Relative standard error of the approximate count of unique strings
+    :param letters_sample_size: The number of random strings, by which the letter frequencies are estimated
+    """
+    if column_type == ColumnType.INTEGER or column_type == ColumnType.FLOAT:
+        return ColumnNumStat(column_name, values, extended, column_type=column_type)
+    elif column_type == ColumnType.STRING:
+        return ColumnStrStat(column_name, values, extended, column_type=column_type,
+                             unique_threshold=unique_threshold, unique_error=unique_error,
+                             letters_sample_size=letters_sample_size)
+    return None
+
+
+def calculate_shared_column_stat(column_name: str,
+                                 memory_name: str,
+                                 shape: Tuple[int],
+                                 dtype: str,
+                                 extended: bool,
+                                 column_type: ColumnType) -> ColumnNumStat or None:
+    """
+    This method calculates statistics of numerical column, which values are placed in the shared memory block
+    (it is called in the worker process, so the values are not pickled)
+    :param column_name: The name of DataSet column
+    :param memory_name: The name of shared memory block
+    :param shape: The shape of values array
+    :param dtype: The dtype of values array
+    :param extended: Responsible for calculating additional parameters
+    :param column_type: The type of column
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        values = np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf)
+        column_stat = calculate_column_stat(column_name=column_name,
+                                            values=values,
+                                            extended=extended,
+                                            column_type=column_type)
+        if column_stat is not None:
+            column_stat.bind_values(values=None)  # Lazy extended statistics must not keep the view of shared memory
+        del values  # The view of shared memory must be released before closing it
+    finally:
+        memory.close()
+    return column_stat
+
+
+def calculate_columns_stat(columns: Dict[str, Tuple[pd.Series, ColumnType]],
+                           extended: bool,
+                           n_jobs: int,
+                           use_processes: bool = False,
+                           unique_threshold: int = None,
+                           unique_error: float = 0.01,
+                           letters_sample_size: int = None) -> Dict[str, ColumnNumStat or ColumnStrStat or None]:
+    """
+    This method calculates statistics of independent columns in the pool of threads or processes.
+    In the pool of processes, numerical columns are passed to workers through the shared memory
+    :param columns: Dict, where the key is the column name and the value is a pair of column values and column type
+    :param extended: Responsible for calculating additional parameters
+    :param n_jobs: The number of jobs to run in parallel (-1 - all processors)
+    :param use_processes: Use the pool of processes instead of the pool of threads
+    :param unique_threshold: The count of values, above which the unique strings are counted approximately
+    :param unique_error: Relative standard error of the approximate count of unique strings
+    :param letters_sample_size: The number of random strings, by which the letter frequencies are estimated
+    """
+    n_jobs = get_jobs_count(n_jobs=n_jobs)
+    if not use_processes:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            futures = {key: executor.submit(calculate_column_stat, key, values, extended, column_type,
+                                            unique_threshold, unique_error, letters_sample_size)
+                       for key, (values, column_type) in columns.items()}
+            return {key: future.result() for key, future in futures.items()}
+    memories = []
+    try:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = {}
+            for key, (values, column_type) in columns.items():
+                if column_type in [ColumnType.INTEGER, ColumnType.FLOAT]:
+                    array = get_numerical_array(values=values)
+                    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                    memories.append(memory)
+                    np.ndarray(array.shape, dtype=array.dtype, buffer=memory.buf)[:] = array
+                    futures[key] = executor.submit(calculate_shared_column_stat, key, memory.name, array.shape,
+                                                   array.dtype.str, extended, column_type)
+                else:
+                    futures[key] = executor.submit(calculate_column_stat, key, values, extended, column_type,
+                                                   unique_threshold, unique_error, letters_sample_size)
+            return {key: future.result() for key, future in futures.items()}
+    finally:
+        for memory in memories:
+            memory.close()
+            memory.unlink()
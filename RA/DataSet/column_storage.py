@@ -0,0 +1,57 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict
+
+try:  # Feather files of non-numerical columns are written only if pyarrow is installed
+    import pyarrow
+    IS_PYARROW = True
+except ImportError:
+    IS_PYARROW = False
+
+
+def save_columns(dataframe: pd.DataFrame, folder: str) -> Dict[str, Dict[str, str]]:
+    """
+    This method saves each column of DataFrame to its own binary file: numerical columns to .npy,
+    which can be memory mapped, other columns to .feather (if pyarrow is installed) or to .pkl
+    :param dataframe: DataFrame of DataSet
+    :param folder: The folder of columns files
+    :return: Dict, where the key is the column name and the value is the description of column file
+    """
+    os.makedirs(folder, exist_ok=True)
+    columns = {}
+    for i, key in enumerate(dataframe.columns):
+        values = dataframe[key]
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+            file_format, filename = "npy", f"column_{i}.npy"
+            np.save(os.path.join(folder, filename), values.to_numpy(), allow_pickle=False)
+        elif IS_PYARROW:
+            file_format, filename = "feather", f"column_{i}.feather"
+            values.to_frame(name="values").reset_index(drop=True).to_feather(os.path.join(folder, filename))
+        else:
+            file_format, filename = "pickle", f"column_{i}.pkl"
+            values.reset_index(drop=True).to_pickle(os.path.join(folder, filename))
+        columns[key] = {"file": filename, "format": file_format, "dtype": str(values.dtype)}
+    return columns
+
+
+def load_columns(folder: str, columns: Dict[str, Dict[str, str]], mmap: bool = True) -> pd.DataFrame:
+    """
+    This method loads columns, which were saved by 'save_columns', into DataFrame without parsing.
+    The .npy columns are memory mapped in the copy-on-write mode, so the changes of DataSet do not change files
+    :param folder: The folder of columns files
+    :param columns: Dict, where the key is the column name and the value is the description of column file
+    :param mmap: Map .npy files to memory instead of reading them
+    """
+    values = {}
+    for key, column in columns.items():
+        path = os.path.join(folder, column["file"])
+        if column["format"] == "npy":
+            values[key] = np.load(path, mmap_mode="c" if mmap else None, allow_pickle=False)
+        elif column["format"] == "feather":
+            values[key] = pd.read_feather(path)["values"]
+        elif column["format"] == "pickle":
+            values[key] = pd.read_pickle(path)
+        else:
+            raise Exception(f"Unknown format of column file: '{column['format']}'!")
+    return pd.DataFrame(values, columns=list(columns.keys()), copy=False)
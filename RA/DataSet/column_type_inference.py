@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from RA.DataSet.enum_column_type import *
+
+
+# Mapping of the 'pd.api.types.infer_dtype' answers to the DataSet column types
+_INFERRED_TYPES = {"string": ColumnType.STRING,
+                   "boolean": ColumnType.BOOLEAN,
+                   "integer": ColumnType.INTEGER,
+                   "floating": ColumnType.FLOAT,
+                   "mixed-integer-float": ColumnType.FLOAT,
+                   "decimal": ColumnType.FLOAT,
+                   "empty": ColumnType.NAN}
+
+
+def infer_column_type(values: pd.Series or np.ndarray or list, sample_size: int = None) -> ColumnType:
+    """
+    This method learns the column type from the pandas dtype of column.
+    Only columns with the 'object' dtype are scanned, and it is done by the vectorized 'infer_dtype'
+    :param values: Values from column
+    :param sample_size: The number of random values which are scanned for 'object' columns (None - all values)
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values)
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return infer_column_type(values=pd.Series(dtype.categories), sample_size=sample_size)
+    if pd.api.types.is_bool_dtype(dtype):
+        return ColumnType.BOOLEAN
+    if pd.api.types.is_integer_dtype(dtype):
+        return ColumnType.INTEGER
+    if pd.api.types.is_float_dtype(dtype):
+        return ColumnType.FLOAT
+    if dtype != object:
+        if pd.api.types.is_string_dtype(dtype):
+            return ColumnType.STRING
+        return ColumnType.OBJECT
+    if sample_size is not None:
+        if sample_size <= 0:
+            raise Exception("The 'sample_size' should be large, then 0!")
+        if len(values) > sample_size:
+            column_type = _INFERRED_TYPES.get(pd.api.types.infer_dtype(values.sample(n=sample_size, random_state=0),
+                                                                       skipna=True), ColumnType.OBJECT)
+            if column_type != ColumnType.NAN:  # The sample could consist only of NaN, then we check all values
+                return column_type
+    return _INFERRED_TYPES.get(pd.api.types.infer_dtype(values, skipna=True), ColumnType.OBJECT)
@@ -0,0 +1,78 @@
+import os
+import glob
+import pandas as pd
+from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from RA.DataSet.jobs_count import *
+
+
+def get_shards_files(path: str, pattern: str = "*.csv") -> List[str]:
+    """
+    This method returns the sorted list of shards files
+    :param path: The folder of shards or the glob pattern of their names (for example, 'data/2024-*.csv')
+    :param pattern: The glob pattern of shards names in the folder (only if 'path' is a folder)
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, pattern)
+    files = sorted(filename for filename in glob.glob(path) if os.path.isfile(filename))
+    if len(files) == 0:
+        raise Exception(f"There are no files by the path '{path}'!")
+    return files
+
+
+def get_shard_columns(filename: str, delimiter: str, encoding: str = 'utf-8', usecols: List[str] = None) -> List[str]:
+    """
+    This method reads only the header of shard
+    :param filename: The name of the .csv file
+    :param delimiter: Symbol-split in a .csv file
+    :param encoding: Explicit indication of the .csv file encoding
+    :param usecols: Names of columns, which are loaded (None - all columns)
+    """
+    return list(pd.read_csv(filename, delimiter=delimiter, encoding=encoding, usecols=usecols, nrows=0).columns)
+
+
+def read_csv_shard(filename: str,
+                   delimiter: str,
+                   encoding: str,
+                   dtype: Dict[str, type] or type,
+                   usecols: List[str],
+                   columns: List[str]) -> pd.DataFrame:
+    """
+    This method reads one shard and checks, that it has the same columns as the first shard
+    :param filename: The name of the .csv file
+    :param delimiter: Symbol-split in a .csv file
+    :param encoding: Explicit indication of the .csv file encoding
+    :param dtype: Types of columns
+    :param usecols: Names of columns, which are loaded (None - all columns)
+    :param columns: Columns of the first shard
+    """
+    shard = pd.read_csv(filename, delimiter=delimiter, encoding=encoding, dtype=dtype, usecols=usecols)
+    if list(shard.columns) != columns:
+        raise Exception(f"The columns of '{filename}' do not match the columns of the first file!")
+    return shard
+
+
+def read_csv_shards(files: List[str],
+                    delimiter: str,
+                    encoding: str = 'utf-8',
+                    dtype: Dict[str, type] or type = None,
+                    usecols: List[str] = None,
+                    n_jobs: int = 1) -> pd.DataFrame:
+    """
+    This method reads shards in the pool of processes and concatenates them once, in the order of files
+    :param files: Names of .csv files
+    :param delimiter: Symbol-split in a .csv file
+    :param encoding: Explicit indication of the .csv file encoding
+    :param dtype: Types of columns
+    :param usecols: Names of columns, which are loaded (None - all columns)
+    :param n_jobs: The number of processes (-1 - all processors)
+    """
+    n_jobs = get_jobs_count(n_jobs=n_jobs)
+    columns = get_shard_columns(filename=files[0], delimiter=delimiter, encoding=encoding, usecols=usecols)
+    arguments = [(filename, delimiter, encoding, dtype, usecols, columns) for filename in files]
+    if n_jobs == 1 or len(files) == 1:
+        shards = [read_csv_shard(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(files))) as executor:
+            shards = list(executor.map(read_csv_shard, *zip(*arguments)))
+    return pd.concat(shards, ignore_index=True)
@@ -0,0 +1,188 @@
+import io
+import os
+import re
+import bz2
+import csv
+import gzip
+import lzma
+import codecs
+import warnings
+import unicodedata
+import pandas as pd
+from typing import Any, Dict, List
+
+
+CSV_DELIMITERS = [",", ";", "\t", "|", ":"]  # Delimiters, which are checked by the sniffer
+CSV_ENCODINGS = ["utf-8", "cp1251", "latin-1"]  # UTF-8 is checked first, 8-bit encodings are chosen by the text
+_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}  # Compressed files are sniffed by their content
+_BOMS = [(codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16")]
+
+
+def sniff_encoding(prefix: bytes, encodings: List[str] = None) -> str:
+    """
+    This method detects the encoding of file by its prefix: by BOM or by the first Unicode encoding, which decodes
+    the prefix. 8-bit encodings (cp1251, latin-1, ...) decode almost any bytes, so if the prefix is not Unicode,
+    the 8-bit encoding, in which the text has the least count of implausible words, is chosen with the warning
+    :param prefix: The first bytes of file
+    :param encodings: Encodings, which are checked in this order (None - CSV_ENCODINGS)
+    """
+    for bom, encoding in _BOMS:
+        if prefix.startswith(bom):
+            return encoding
+    decoded = {}
+    for encoding in encodings if encodings is not None else CSV_ENCODINGS:
+        try:  # The prefix can cut the last symbol, so the incremental decoder does not fail on the incomplete end
+            text = codecs.getincrementaldecoder(encoding)().decode(prefix, final=False)
+        except (UnicodeDecodeError, LookupError):
+            continue
+        if codecs.lookup(encoding).name.startswith("utf"):  # Not Unicode text is almost never valid Unicode
+            return encoding
+        decoded[encoding] = text
+    if len(decoded) == 0:
+        raise Exception("The encoding of file is not detected! Specify the 'encoding' explicitly.")
+    encoding = min(decoded, key=lambda key: get_implausible_words_count(text=decoded[key]))  # The first of equal
+    if len(decoded) > 1:
+        warnings.warn(f"The file is not in Unicode, so the encoding '{encoding}' was chosen among "
+                      f"{', '.join(decoded)} by the text. Specify the 'encoding' explicitly, "
+                      f"if the text is read incorrectly!", UserWarning)
+    return encoding
+
+
+def get_implausible_words_count(text: str) -> int:
+    """
+    This method counts words, which appear, when the text is decoded by the wrong 8-bit encoding: words with letters
+    of different alphabets (for example, 'Josй') and Latin words, which consist mostly of not ASCII letters
+    (for example, 'Èâàí')
+    :param text: The decoded text
+    """
+    count = 0
+    for word in re.findall(r"[^\W\d_]+", text):
+        if word.isascii():
+            continue
+        alphabets = {unicodedata.name(letter, "UNKNOWN").split(" ")[0] for letter in word}
+        not_ascii_count = sum(not letter.isascii() for letter in word)
+        if len(alphabets) > 1 or ("LATIN" in alphabets and len(word) > 3 and not_ascii_count * 2 > len(word)):
+            count += 1
+    return count
+
+
+def sniff_dialect(text: str, delimiters: List[str] = None) -> csv.Dialect:
+    """
+    This method detects the delimiter and the quote character by complete lines of text.
+    If the standard sniffer fails, the delimiter, which splits all lines into the same number of fields, is chosen
+    :param text: Complete lines from the beginning of file
+    :param delimiters: Delimiters, which are checked (None - CSV_DELIMITERS)
+    """
+    delimiters = delimiters if delimiters is not None else CSV_DELIMITERS
+    try:
+        return csv.Sniffer().sniff(text, delimiters="".join(delimiters))
+    except csv.Error:
+        pass
+    lines = text.splitlines()[:100]
+    best_delimiter, best_score = ",", (False, 0)
+    for delimiter in delimiters:
+        counts = [len(row) for row in csv.reader(lines, delimiter=delimiter)]
+        if len(counts) == 0:
+            continue
+        score = (len(set(counts)) == 1, min(counts))  # Same number of fields in all lines, then more fields
+        if score > best_score:
+            best_delimiter, best_score = delimiter, score
+
+    class SniffedDialect(csv.excel):
+        delimiter = best_delimiter
+    return SniffedDialect
+
+
+def sniff_header(text: str, dialect: csv.Dialect) -> bool:
+    """
+    This method detects, whether the first row is the header. The first row is the header, if it has a text value
+    in a numerical column, and it is not the header, if it has a number in a numerical column or repeated values.
+    Otherwise (for example, all columns are text) the first row is considered to be the header
+    :param text: Complete lines from the beginning of file
+    :param dialect: The dialect of file
+    """
+    sample = pd.read_csv(io.StringIO(text),
+                         delimiter=dialect.delimiter,
+                         quotechar=dialect.quotechar,
+                         header=None,
+                         dtype=str)
+    first_row, rows = sample.iloc[0], sample.iloc[1:]
+    is_number_in_numerical = False
+    for key in sample.columns:
+        values = rows[key].dropna()
+        if len(values) == 0 or pd.to_numeric(values, errors="coerce").isna().any():
+            continue  # Not numerical column
+        if pd.isna(first_row[key]):
+            continue
+        if pd.isna(pd.to_numeric(first_row[key], errors="coerce")):
+            return True
+        is_number_in_numerical = True
+    if is_number_in_numerical or first_row.dropna().duplicated().any():
+        return False
+    return True
+
+
+def sniff_csv(filename: str,
+              prefix_size: int = 1 << 16,
+              delimiters: List[str] = None,
+              encodings: List[str] = None,
+              header: bool = None) -> Dict[str, Any]:
+    """
+    This method detects the delimiter, the quote character, the encoding, the header and types of columns
+    by the bounded prefix of .csv file, so the whole file is never read
+    :param filename: The name of the .csv file
+    :param prefix_size: The maximum count of bytes, which are read from the beginning of file
+    :param delimiters: Delimiters, which are checked (None - CSV_DELIMITERS)
+    :param encodings: Encodings, which are checked in this order (None - CSV_ENCODINGS)
+    :param header: The first row is the header (None - detect)
+    :return: Dict with 'delimiter', 'quotechar', 'encoding', 'header' (True, if the first row is the header)
+    and 'dtypes' (Dict, where the key is the column name and the value is the pandas dtype in the prefix)
+    """
+    if not isinstance(prefix_size, int) or prefix_size <= 0:
+        raise Exception("The 'prefix_size' must be an integer large, then 0!")
+    with _OPENERS.get(os.path.splitext(str(filename))[1].lower(), open)(filename, 'rb') as csv_file:
+        prefix = csv_file.read(prefix_size)
+        is_whole_file = len(csv_file.read(1)) == 0
+    encoding = sniff_encoding(prefix=prefix, encodings=encodings)
+    text = codecs.getincrementaldecoder(encoding)().decode(prefix, final=is_whole_file)
+    if not is_whole_file and "\n" in text:  # The last line can be cut by the prefix
+        text = text[:text.rindex("\n") + 1]
+    if len(text.strip()) == 0:
+        raise Exception(f"The file '{filename}' is empty!")
+    dialect = sniff_dialect(text=text, delimiters=delimiters)
+    if header is None:
+        header = sniff_header(text=text, dialect=dialect)
+    sample = pd.read_csv(io.StringIO(text),
+                         delimiter=dialect.delimiter,
+                         quotechar=dialect.quotechar,
+                         header=0 if header else None)
+    if not header:
+        sample.columns = get_default_columns_names(count=len(sample.columns))
+    return {"delimiter": dialect.delimiter,
+            "quotechar": dialect.quotechar,
+            "encoding": encoding,
+            "header": header,
+            "dtypes": {key: str(sample[key].dtype) for key in sample.columns}}
+
+
+def get_default_columns_names(count: int) -> List[str]:
+    """
+    This method returns names of columns for the file without the header
+    :param count: Count of columns
+    """
+    return [f"column_{i}" for i in range(count)]
+
+
+def get_sniffed_csv_options(sniffed: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    This method turns the result of 'sniff_csv' into arguments of 'pd.read_csv'. Only text columns get the explicit
+    type (it never fails on other values), numerical columns are parsed by pandas, so a wrong guess by the prefix
+    never fails the reading of the whole file
+    :param sniffed: The result of 'sniff_csv'
+    """
+    options = {"quotechar": sniffed["quotechar"],
+               "dtype": {key: str for key, dtype in sniffed["dtypes"].items() if dtype in ["object", "str", "string"]}}
+    if not sniffed["header"]:
+        options["header"] = None
+        options["names"] = list(sniffed["dtypes"].keys())
+    return options
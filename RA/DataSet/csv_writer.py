@@ -0,0 +1,214 @@
+import os
+import bz2
+import gzip
+import lzma
+import threading
+import pandas as pd
+
+
+CSV_COMPRESSIONS = {None: "", "gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}  # Compression -> extension of file
+_CSV_OPENERS = {None: open, "gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+_CSV_LEVEL_ARGUMENTS = {"gzip": "compresslevel", "bz2": "compresslevel", "xz": "preset"}  # Argument of opener
+CSV_COMPRESSION_LEVEL = 6  # The default level 9 of gzip and bz2 is much slower and compresses text only a bit better
+
+
+class CsvExportHandle:
+    def __init__(self, path: str, rows: int) -> None:
+        """
+        This method init the handle of export, which is written in the background thread
+        :param path: The path of .csv (or excel) file
+        :param rows: Count of rows, which are exported
+        """
+        self.__path = path
+        self.__rows = rows
+        self.__rows_written = 0
+        self.__error = None
+        self.__thread = None
+
+    @property
+    def path(self) -> str:
+        """
+        This property returns the path of .csv file
+        """
+        return self.__path
+
+    @property
+    def rows_written(self) -> int:
+        """
+        This property returns count of already written rows
+        """
+        return self.__rows_written
+
+    @property
+    def progress(self) -> float:
+        """
+        This property returns the share of already written rows
+        """
+        return self.__rows_written / self.__rows if self.__rows > 0 else 1.0
+
+    @property
+    def is_done(self) -> bool:
+        """
+        This property returns True, if the writing has finished (successfully or not)
+        """
+        return self.__thread is None or not self.__thread.is_alive()
+
+    def start(self, target, **kwargs) -> 'CsvExportHandle':
+        """
+        This method starts the writing in the background thread
+        :param target: The writing function, which gets the callback of progress 'on_chunk'
+        :param kwargs: Arguments of the writing function
+        """
+        self.__thread = threading.Thread(target=self.__run, args=(target, kwargs), daemon=False)
+        self.__thread.start()
+        return self
+
+    def wait(self, timeout: float = None) -> str:
+        """
+        This method waits for the end of writing and raises the exception of writing, if it has happened
+        :param timeout: Maximal time of waiting in seconds (None - without limit)
+        :return: The path of .csv file
+        """
+        if self.__thread is not None:
+            self.__thread.join(timeout=timeout)
+            if self.__thread.is_alive():
+                raise Exception(f"The export to '{self.__path}' has not finished in {timeout} seconds!")
+        if self.__error is not None:
+            raise self.__error
+        return self.__path
+
+    def __run(self, target, kwargs: dict) -> None:
+        """
+        This method runs the writing function in the background thread and keeps its exception for 'wait'
+        :param target: The writing function
+        :param kwargs: Arguments of the writing function
+        """
+        try:
+            target(on_chunk=self.__on_chunk, **kwargs)
+        except Exception as e:
+            self.__error = e
+
+    def __on_chunk(self, rows: int) -> None:
+        """
+        This method counts rows of each written block
+        :param rows: Count of rows in block
+        """
+        self.__rows_written += rows
+
+
+def write_csv_by_chunks(dataframe: pd.DataFrame,
+                        path: str,
+                        delimiter: str = ",",
+                        encoding: str = "utf-8",
+                        compression: str = None,
+                        chunk_size: int = 100000,
+                        on_chunk=None,
+                        compression_level: int = CSV_COMPRESSION_LEVEL) -> None:
+    """
+    This method writes DataFrame to .csv file by blocks of rows, so only one block is formatted in memory.
+    The file is written under a temporary name and appears at once, when it is written completely
+    :param dataframe: DataFrame of DataSet
+    :param path: The path of .csv file
+    :param delimiter: Symbol-split in a .csv file
+    :param encoding: Explicit indication of the .csv file encoding
+    :param compression: Compression of file: None, 'gzip', 'bz2' or 'xz'
+    :param chunk_size: Count of rows in one block
+    :param on_chunk: The function, which gets count of rows after each written block
+    :param compression_level: Level of compression from 1 (the fastest) to 9 (the smallest file)
+    """
+    check_csv_compression(compression=compression, compression_level=compression_level)
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise Exception("The 'chunk_size' must be an integer large, then 0!")
+    level = {_CSV_LEVEL_ARGUMENTS[compression]: compression_level} if compression is not None else {}
+    try:
+        with _CSV_OPENERS[compression](f"{path}.tmp", "wt", encoding=encoding, newline="", **level) as csv_file:
+            if len(dataframe) == 0:
+                dataframe.to_csv(csv_file, index=False, sep=delimiter)
+            for start in range(0, len(dataframe), chunk_size):
+                chunk = dataframe.iloc[start:start + chunk_size]
+                chunk.to_csv(csv_file, index=False, sep=delimiter, header=start == 0)
+                if on_chunk is not None:
+                    on_chunk(len(chunk))
+        os.replace(f"{path}.tmp", path)
+    except BaseException:
+        if os.path.exists(f"{path}.tmp"):
+            os.remove(f"{path}.tmp")
+        raise
+
+
+def start_csv_export(dataframe: pd.DataFrame,
+                     path: str,
+                     delimiter: str = ",",
+                     encoding: str = "utf-8",
+                     compression: str = None,
+                     chunk_size: int = 100000,
+                     compression_level: int = CSV_COMPRESSION_LEVEL) -> CsvExportHandle:
+    """
+    This method starts writing DataFrame to .csv file by blocks of rows in the background thread
+    :param dataframe: DataFrame of DataSet (it must not be changed in place, while it is written)
+    :param path: The path of .csv file
+    :param delimiter: Symbol-split in a .csv file
+    :param encoding: Explicit indication of the .csv file encoding
+    :param compression: Compression of file: None, 'gzip', 'bz2' or 'xz'
+    :param chunk_size: Count of rows in one block
+    :param compression_level: Level of compression from 1 (the fastest) to 9 (the smallest file)
+    :return: The handle of export to wait on
+    """
+    check_csv_compression(compression=compression, compression_level=compression_level)
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise Exception("The 'chunk_size' must be an integer large, then 0!")
+    handle = CsvExportHandle(path=path, rows=len(dataframe))
+    return handle.start(target=write_csv_by_chunks,
+                        dataframe=dataframe,
+                        path=path,
+                        delimiter=delimiter,
+                        encoding=encoding,
+                        compression=compression,
+                        chunk_size=chunk_size,
+                        compression_level=compression_level)
+
+
+def start_excel_export(dataframe: pd.DataFrame, path: str, sheet_name: str) -> CsvExportHandle:
+    """
+    This method starts writing DataFrame to excel file in the background thread
+    :param dataframe: DataFrame of DataSet (it must not be changed in place, while it is written)
+    :param path: The path of excel file
+    :param sheet_name: Name of sheet in excel file
+    :return: The handle of export to wait on
+    """
+    handle = CsvExportHandle(path=path, rows=len(dataframe))
+    return handle.start(target=write_excel, dataframe=dataframe, path=path, sheet_name=sheet_name)
+
+
+def write_excel(dataframe: pd.DataFrame, path: str, sheet_name: str, on_chunk=None) -> None:
+    """
+    This method writes DataFrame to excel file.
+    The file is written under a temporary name and appears at once, when it is written completely
+    :param dataframe: DataFrame of DataSet
+    :param path: The path of excel file
+    :param sheet_name: Name of sheet in excel file
+    :param on_chunk: The function, which gets count of rows after the writing
+    """
+    root, extension = os.path.splitext(path)
+    temp_path = f"{root}.tmp{extension}"  # The engine of excel is chosen by the extension
+    try:
+        dataframe.to_excel(temp_path, index=False, sheet_name=sheet_name)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if on_chunk is not None:
+        on_chunk(len(dataframe))
+
+
+def check_csv_compression(compression: str, compression_level: int) -> None:
+    """
+    This method checks the compression of .csv file and its level
+    :param compression: Compression of file: None, 'gzip', 'bz2' or 'xz'
+    :param compression_level: Level of compression from 1 (the fastest) to 9 (the smallest file)
+    """
+    if compression not in CSV_COMPRESSIONS:
+        raise Exception(f"'{compression}' is an invalid compression. Valid compressions: gzip, bz2, xz")
+    if not isinstance(compression_level, int) or not 1 <= compression_level <= 9:
+        raise Exception("The 'compression_level' must be an integer from 1 to 9!")
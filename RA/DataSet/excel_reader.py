@@ -0,0 +1,72 @@
+import os
+import pandas as pd
+from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from RA.DataSet.jobs_count import *
+
+
+EXCEL_ENGINES = {".xls": "xlrd",
+                 ".xlt": "xlrd",
+                 ".xlsx": "openpyxl",
+                 ".xlsm": "openpyxl",
+                 ".xltx": "openpyxl",
+                 ".xltm": "openpyxl",
+                 ".xlsb": "pyxlsb",
+                 ".ods": "odf",
+                 ".ots": "odf"}  # The engine of pandas, which reads files of each format
+
+
+def get_excel_engine(excel_file: str) -> str:
+    """
+    This method chooses the engine of pandas by the extension of file
+    :param excel_file: The name of the excel file
+    """
+    extension = os.path.splitext(str(excel_file))[1].lower()
+    if extension not in EXCEL_ENGINES:
+        raise Exception(f"The dataset format should be {', '.join(EXCEL_ENGINES)}!")
+    return EXCEL_ENGINES[extension]
+
+
+def open_excel_file(excel_file: str) -> pd.ExcelFile:
+    """
+    This method opens the workbook once, so its sheets can be read without reopening the file
+    :param excel_file: The name of the excel file
+    """
+    return pd.ExcelFile(excel_file, engine=get_excel_engine(excel_file=excel_file))
+
+
+def read_excel_sheets_group(excel_file: str, sheet_names: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    This method reads a group of sheets from the workbook, which is opened once
+    :param excel_file: The name of the excel file
+    :param sheet_names: Names of sheets
+    """
+    with open_excel_file(excel_file=excel_file) as workbook:
+        return {sheet_name: workbook.parse(sheet_name=sheet_name) for sheet_name in sheet_names}
+
+
+def read_excel_sheets(excel_file: str, sheet_names: List[str] = None, n_jobs: int = 1) -> Dict[str, pd.DataFrame]:
+    """
+    This method reads several sheets of the workbook. The parsing of sheets is CPU-bound,
+    so sheets are divided into 'n_jobs' groups, and each group is read in its own process,
+    which opens the workbook once
+    :param excel_file: The name of the excel file
+    :param sheet_names: Names of sheets (None - all sheets)
+    :param n_jobs: The number of processes (-1 - all processors)
+    :return: Dict, where the key is the sheet name and the value is DataFrame of sheet in the order of 'sheet_names'
+    """
+    n_jobs = get_jobs_count(n_jobs=n_jobs)
+    with open_excel_file(excel_file=excel_file) as workbook:
+        if sheet_names is None:
+            sheet_names = list(workbook.sheet_names)
+        for sheet_name in sheet_names:
+            if sheet_name not in workbook.sheet_names:
+                raise Exception(f"Sheet name \'{sheet_name}\' not found!")
+        if n_jobs == 1 or len(sheet_names) <= 1:
+            return {sheet_name: workbook.parse(sheet_name=sheet_name) for sheet_name in sheet_names}
+    groups = [sheet_names[i::n_jobs] for i in range(min(n_jobs, len(sheet_names)))]
+    sheets = {}
+    with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+        for group_sheets in executor.map(read_excel_sheets_group, [excel_file] * len(groups), groups):
+            sheets.update(group_sheets)
+    return {sheet_name: sheets[sheet_name] for sheet_name in sheet_names}
@@ -0,0 +1,13 @@
+import os
+
+
+def get_jobs_count(n_jobs: int) -> int:
+    """
+    This method checks the number of jobs and replaces -1 by the number of processors
+    :param n_jobs: The number of jobs to run in parallel (-1 - all processors)
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if not isinstance(n_jobs, int) or n_jobs <= 0:
+        raise Exception("The 'n_jobs' must be an integer large, then 0 (or -1 for all processors)!")
+    return n_jobs
@@ -0,0 +1,73 @@
+import pandas as pd
+from typing import Any, Dict, List
+
+
+class RowBuilder:
+    def __init__(self, flush, columns_names: List[str] = None, block_size: int = 100000) -> None:
+        """
+        This method init the builder, which buffers new rows in lists of columns and passes them to 'flush'
+        as one DataFrame per block, so the dataset is reallocated once per block instead of once per row
+        :param flush: The function, which gets DataFrame of buffered rows
+        :param columns_names: Names of columns (None - names of the first row)
+        :param block_size: Count of rows in one block
+        """
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise Exception("The 'block_size' must be an integer large, then 0!")
+        self.__flush = flush
+        self.__block_size = block_size
+        self.__columns_names = None
+        self.__columns = {}
+        self.__rows_count = 0
+        if columns_names is not None:
+            self.__set_columns_names(columns_names=list(columns_names))
+
+    def __enter__(self) -> 'RowBuilder':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:  # Rows of the failed block are not added to the dataset
+            self.flush()
+
+    def __len__(self) -> int:
+        return self.__rows_count
+
+    def add_row(self, new_row: Dict[str, Any]) -> None:
+        """
+        This method adds a new row to the buffer and flushes the buffer, when the block is full
+        :param new_row: The row in dictionary format, where the key is the column name and the value is the value
+        """
+        if self.__columns_names is None:
+            self.__set_columns_names(columns_names=list(new_row.keys()))
+        if new_row.keys() != self.__columns.keys():
+            for column in new_row:
+                if column not in self.__columns:
+                    raise Exception(f"The \"{column}\" column does not exist in this dataset!")
+            for column in self.__columns_names:
+                if column not in new_row:
+                    raise Exception(f"The \"{column}\" column is missing!")
+        for column, values in self.__columns.items():
+            values.append(new_row[column])
+        self.__rows_count += 1
+        if self.__rows_count >= self.__block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        This method passes buffered rows to 'flush' and clears the buffer
+        """
+        if self.__rows_count == 0:
+            return
+        block = pd.DataFrame(self.__columns, columns=self.__columns_names)
+        self.__columns = {column: [] for column in self.__columns_names}
+        self.__rows_count = 0
+        self.__flush(block)
+
+    def __set_columns_names(self, columns_names: List[str]) -> None:
+        """
+        This method sets names of columns and creates their empty buffers
+        :param columns_names: Names of columns
+        """
+        if len(set(columns_names)) != len(columns_names):
+            raise Exception(f"Column names should not be repeated!")
+        self.__columns_names = columns_names
+        self.__columns = {column: [] for column in columns_names}
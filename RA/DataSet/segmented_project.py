@@ -0,0 +1,129 @@
+import os
+import json
+import hashlib
+import pandas as pd
+from typing import Any, Dict
+from RA.DataSet.enum_column_type import *
+from RA.DataSet.column_type_inference import *
+from RA.DataSet.column_stat_cache import *
+from RA.DataSet.csv_writer import *
+
+
+SEGMENTS_FOLDER = "segments"  # The folder of segments files in the project folder
+
+
+def get_segment_filename(index: int) -> str:
+    """
+    This method returns the name of segment file
+    :param index: The index of segment
+    """
+    return os.path.join(SEGMENTS_FOLDER, f"segment_{index:06d}.csv")
+
+
+def get_chained_hash(previous_hash: str or None, segment_hash: str) -> str:
+    """
+    This method returns the hash of column after appending the segment: the hash of column in all previous
+    segments is combined with the content hash of new segment, so the whole column is never hashed again
+    :param previous_hash: The hash of column in previous segments (None - it is the first segment)
+    :param segment_hash: The content hash of column in new segment
+    """
+    if previous_hash is None:
+        return segment_hash
+    return hashlib.blake2b(f"{previous_hash}:{segment_hash}".encode(), digest_size=16).hexdigest()
+
+
+def write_segment(project_folder: str, manifest: Dict[str, Any], dataframe: pd.DataFrame) -> Dict[str, Any]:
+    """
+    This method writes rows as the new immutable segment and updates the saved statistics of columns by these rows
+    only. The manifest is replaced at once after the segment and statistics are written, so readers never see
+    a half-written segment
+    :param project_folder: The folder of project
+    :param manifest: The manifest of project (it is changed)
+    :param dataframe: New rows with the same columns as the project
+    :return: The updated manifest
+    """
+    if list(dataframe.columns) != list(manifest["columns_names"]):
+        raise Exception("The new rows and the project have the different column names!")
+    analytics_folder = os.path.join(project_folder, "analytics")
+    os.makedirs(os.path.join(project_folder, SEGMENTS_FOLDER), exist_ok=True)
+    os.makedirs(analytics_folder, exist_ok=True)
+    segment = {"file": get_segment_filename(index=len(manifest["segments"])), "rows": len(dataframe), "columns": {}}
+    write_csv_by_chunks(dataframe=dataframe,
+                        path=os.path.join(project_folder, segment["file"]),
+                        delimiter=manifest["delimiter"],
+                        encoding=manifest["encoding"])
+    for key in dataframe.columns:
+        column = manifest["columns"].setdefault(key, {})
+        previous_hash = column.get("hash")
+        column_type = infer_column_type(values=dataframe[key])
+        segment_hash = get_column_hash(column_name=key, values=dataframe[key], settings=(column_type.name,))
+        segment["columns"][key] = {"type": column_type.name, "hash": segment_hash}
+        column["hash"] = get_chained_hash(previous_hash=previous_hash, segment_hash=segment_hash)
+        old_type = ColumnType[column["type"]] if "type" in column else None
+        new_type = get_appended_type(old_type=old_type, segment_type=column_type, is_first=previous_hash is None)
+        if previous_hash is not None and new_type is not None and \
+                (new_type == old_type or {new_type, old_type} == {ColumnType.INTEGER, ColumnType.FLOAT}):
+            column_stat = load_column_stat(cache_folder=analytics_folder, column_hash=previous_hash)
+            if column_stat is not None:  # Simple statistics are updated by new rows, order ones at the first request
+                column_stat.update(values=None, added=dataframe[key], column_type=new_type)
+                save_column_stat(cache_folder=analytics_folder, column_hash=column["hash"], column_stat=column_stat)
+        if new_type is None:  # The column has changed its type group, so the type is learned again at loading
+            column.pop("type", None)
+        else:
+            column["type"] = new_type.name
+    manifest["segments"].append(segment)
+    manifest["rows"] = manifest["rows"] + len(dataframe)
+    save_manifest(project_folder=project_folder, manifest=manifest)
+    return manifest
+
+
+def get_appended_type(old_type: ColumnType or None, segment_type: ColumnType, is_first: bool) -> ColumnType or None:
+    """
+    This method returns the type of column after appending the segment
+    :param old_type: The type of column in previous segments (None - unknown)
+    :param segment_type: The type of column in new segment
+    :param is_first: It is the first segment of column
+    :return: The type or None, if it is not known without reading all segments
+    """
+    if is_first:
+        return segment_type
+    if old_type is None:
+        return None
+    if segment_type == ColumnType.NAN or segment_type == old_type:
+        return old_type
+    if old_type == ColumnType.NAN:
+        return segment_type
+    if {old_type, segment_type} == {ColumnType.INTEGER, ColumnType.FLOAT}:
+        return ColumnType.FLOAT
+    return None
+
+
+def save_manifest(project_folder: str, manifest: Dict[str, Any]) -> None:
+    """
+    This method replaces the manifest of project at once
+    :param project_folder: The folder of project
+    :param manifest: The manifest of project
+    """
+    path = os.path.join(project_folder, manifest["manifest_filename"])
+    with open(f"{path}.tmp", 'w') as json_file:
+        json.dump(manifest, json_file, indent=4)
+    os.replace(f"{path}.tmp", path)
+
+
+def read_segments(project_folder: str, manifest: Dict[str, Any]) -> pd.DataFrame:
+    """
+    This method reads all segments of project and concatenates them once.
+    Text columns are read as strings, so the same column has the same type in all segments,
+    and floats are parsed exactly, so the values are the same as at the writing
+    :param project_folder: The folder of project
+    :param manifest: The manifest of project
+    """
+    dtype = {key: str for key, column in manifest["columns"].items() if column.get("type") == ColumnType.STRING.name}
+    segments = [pd.read_csv(os.path.join(project_folder, segment["file"]),
+                            delimiter=manifest["delimiter"],
+                            encoding=manifest["encoding"],
+                            dtype=dtype,
+                            float_precision="round_trip") for segment in manifest["segments"]]
+    if len(segments) == 0:
+        return pd.DataFrame(columns=manifest["columns_names"])
+    return pd.concat(segments, ignore_index=True)
@@ -105,25 +105,82 @@ class Manager:
             raise Exception("There is no DataSet with this name!")
         return self.__datasets[str(dataset_name)]
 
-    def create_DataSet(self, dataset_name: str) -> None:
+    def create_DataSet(self, dataset_name: str, use_memmap: bool = False) -> None:
         """
         This method creates a new DataSet in manager
         :param dataset_name: The name of new DataSet
+        :param use_memmap: Keep numerical columns in memory mapped files in the project folder
         """
         if dataset_name in self.__datasets:
             raise Exception("A dataset with this name already exists!")
         self.__datasets[dataset_name] = DataSet(dataset_name=dataset_name)
         self.__datasets[dataset_name].set_saving_path(path=self.__project_path)
+        if use_memmap:
+            self.__datasets[dataset_name].set_memmap_backend()
+
+    def create_DataSet_from_shards(self,
+                                   dataset_name: str,
+                                   path: str,
+                                   delimiter: str,
+                                   pattern: str = "*.csv",
+                                   encoding: str = 'utf-8',
+                                   dtype: Dict[str, type] or type = None,
+                                   usecols: List[str] = None,
+                                   n_jobs: int = 1,
+                                   use_memmap: bool = False) -> None:
+        """
+        This method creates a new DataSet in manager from many .csv files with the same columns
+        :param dataset_name: The name of new DataSet
+        :param path: The folder of files or the glob pattern of their names (for example, 'data/2024-*.csv')
+        :param delimiter: Symbol-split in .csv files
+        :param pattern: The glob pattern of files names in the folder (only if 'path' is a folder)
+        :param encoding: Explicit indication of the .csv files encoding
+        :param dtype: Types of columns
+        :param usecols: Names of columns, which are loaded (None - all columns)
+        :param n_jobs: The number of processes (-1 - all processors)
+        :param use_memmap: Keep numerical columns in memory mapped files in the project folder
+        """
+        self.create_DataSet(dataset_name=dataset_name, use_memmap=use_memmap)
+        try:
+            self.__datasets[dataset_name].load_csv_shards(path=path,
+                                                          delimiter=delimiter,
+                                                          pattern=pattern,
+                                                          encoding=encoding,
+                                                          dtype=dtype,
+                                                          usecols=usecols,
+                                                          n_jobs=n_jobs)
+        except Exception:
+            del self.__datasets[dataset_name]
+            raise
+
+    def create_DataSets_from_excel(self, excel_file: str, sheet_names: List[str] = None, n_jobs: int = 1) -> List[str]:
+        """
+        This method creates new DataSets in manager from sheets of the excel file (DataSets are named as sheets)
+        :param excel_file: The name of the excel file
+        :param sheet_names: Names of sheets (None - all sheets)
+        :param n_jobs: The number of processes (-1 - all processors)
+        :return: Names of new DataSets
+        """
+        if sheet_names is None:
+            sheet_names = DataSet.get_excel_sheet_names(excel_file=excel_file)
+        for sheet_name in sheet_names:
+            if str(sheet_name) in self.__datasets:
+                raise Exception(f"A dataset with the name \'{sheet_name}\' already exists!")
+        datasets = DataSet.load_excel_sheets(excel_file=excel_file, sheet_names=sheet_names, n_jobs=n_jobs)
+        for sheet_name, dataset in datasets.items():
+            dataset.set_saving_path(path=self.__project_path)
+            self.__datasets[dataset.name] = dataset
+        return [dataset.name for dataset in datasets.values()]
 
     def add_DataSet(self, dataset: DataSet) -> None:
         """
         This method adds a DataSet to the manager
         :param dataset: The DataSet class that we want to add
         """
-        if str(dataset.get_name()) in self.__datasets:
+        if str(dataset.name) in self.__datasets:
             raise Exception("A dataset with this name already exists!")
-        self.__datasets[dataset.get_name()] = dataset
-        self.__datasets[dataset.get_name()].set_saving_path(path=self.__project_path)
+        self.__datasets[dataset.name] = dataset
+        self.__datasets[dataset.name].set_saving_path(path=self.__project_path)
 
     def delate_DataSet(self, dataset_name: str) -> None:
         """
@@ -146,13 +203,13 @@ class Manager:
             raise Exception("There is no DataSet with this name!")
         splitted_datasets = self.__datasets[str(dataset_name)].split(count=count)
         for i in range(len(splitted_datasets)):
-            if splitted_datasets[i].get_name() in self.__datasets:
+            if splitted_datasets[i].name in self.__datasets:
                 raise Exception(f"As a result of splitting the dataset \'{dataset_name}\' into parts, "
-                                f"the name of the dataset {splitted_datasets[i].get_name()} coincided!")
+                                f"the name of the dataset {splitted_datasets[i].name} coincided!")
         splitted_datasets_names = []
         for i in range(len(splitted_datasets)):
-            self.__datasets[splitted_datasets[i].get_name()] = splitted_datasets[i]
-            splitted_datasets_names.append(splitted_datasets[i].get_name())
+            self.__datasets[splitted_datasets[i].name] = splitted_datasets[i]
+            splitted_datasets_names.append(splitted_datasets[i].name)
         if delete_original_DataSet:
             del self.__datasets[str(dataset_name)]
         return splitted_datasets_names
@@ -175,18 +232,19 @@ class Manager:
             datasets = list(self.__datasets.keys())
         else:
             datasets = dataset_names
-        ds_keys = []
+        ds_keys = None
         for ds in datasets:
             if ds not in self.__datasets:
                 raise Exception("There is no DataSet with this name!")
-            if set(self.DataSet(ds).get_keys()) in ds_keys or len(ds_keys) == 0:
-                ds_keys.append(set(self.DataSet(ds).get_keys()))
-            else:
+            if ds_keys is None:
+                ds_keys = set(self.DataSet(ds).columns_name)
+            elif set(self.DataSet(ds).columns_name) != ds_keys:
                 raise Exception("The names of the columns in the datasets do not match!")
+        dataframe = pd.concat([self.DataSet(ds).get_DataFrame() for ds in datasets], ignore_index=True)
         self.create_DataSet(dataset_name=new_dataset_name)
-        for ds in datasets:
-            self.DataSet(new_dataset_name).concat_DataSet(dataset=self.DataSet(dataset_name=ds))
-            if only_new_dataset:
+        self.DataSet(new_dataset_name).load_DataFrame(dataframe=dataframe)
+        if only_new_dataset:
+            for ds in datasets:
                 self.delate_DataSet(dataset_name=ds)
 
     def get_DataSets(self) -> Dict[str, DataSet]:
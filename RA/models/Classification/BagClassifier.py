@@ -9,7 +9,6 @@ from typing import Dict
 from prettytable import PrettyTable
 from sklearn.ensemble import BaggingClassifier
 from sklearn.model_selection import GridSearchCV
-from sklearn.model_selection import train_test_split
 from RA.Errors import Errors
 from RA.models.Param import *
 from RA.models.static_methods import *
@@ -119,21 +118,24 @@ class BagClassifier:
                  task: pd.DataFrame or list,
                  target: pd.DataFrame or list,
                  train_split: int,
-                 show: bool = False) -> None:
+                 show: bool = False,
+                 shuffle: bool = True) -> None:
         """
         This method passes data to the class
         :param task: The training part of the dataset
         :param target: The target part of the dataset
         :param train_split: The coefficient of splitting into training and training samples
         :param show: The parameter responsible for displaying the progress of work
+        :param shuffle: Rows are split randomly, otherwise the first rows are the training sample
+        and samples are slices of 'task' and 'target' without copying
         """
         self.__show = show
         self.__keys = task.keys()
         self.__keys_len = len(task.keys())
-        self.__X_train, self.__x_test, self.__Y_train, self.__y_test = train_test_split(task,
-                                                                                        target,
-                                                                                        train_size=train_split,
-                                                                                        random_state=13)
+        self.__X_train, self.__x_test, self.__Y_train, self.__y_test = split_train_test(task=task,
+                                                                                        target=target,
+                                                                                        train_split=train_split,
+                                                                                        shuffle=shuffle)
         self.__is_dataset_set = True
 
     def fit(self,
@@ -1,5 +1,7 @@
 import math
-from typing import List
+import pandas as pd
+from typing import List, Tuple
+from sklearn.model_selection import train_test_split
 
 
 def show_grid_params(params: dict, locked_params: list, single_model_time, n_jobs: int):
@@ -137,3 +139,48 @@ def convert_to_preferred_format(sec: float) -> str:
     min = sec // 60
     sec %= 60
     return "%02d:%02d:%02d" % (hour, min, sec)
+
+
+def split_train_test(task: pd.DataFrame or list,
+                     target: pd.DataFrame or list,
+                     train_split: int or float,
+                     shuffle: bool = True) -> Tuple:
+    """
+    This method splits the task and the target into training and testing samples.
+    Shuffled samples are copies of randomly chosen rows ('train_test_split'), otherwise the first rows are
+    the training sample and the last ones are the testing sample, and samples of DataFrame are slices of rows,
+    which are not copied (so columns of memory mapped DataSet are not read to memory by the splitting)
+    :param task: The training part of the dataset
+    :param target: The target part of the dataset
+    :param train_split: Count of rows (int) or the share of rows (float) in the training sample
+    :param shuffle: Rows are chosen randomly
+    :return: The training task, the testing task, the training target and the testing target
+    """
+    if shuffle:
+        return train_test_split(task, target, train_size=train_split, random_state=13)
+    if len(task) != len(target):
+        raise Exception("The task and the target must have the same count of rows!")
+    if isinstance(train_split, float) and 0 < train_split < 1:
+        train_count = math.floor(train_split * len(task))
+    elif isinstance(train_split, int) and not isinstance(train_split, bool):
+        train_count = train_split
+    else:
+        raise Exception("The 'train_split' must be an integer count of rows or a float share from 0 to 1!")
+    if not 0 < train_count < len(task):
+        raise Exception("Both training and testing samples must have rows!")
+    return (get_rows_slice(values=task, start=0, stop=train_count),
+            get_rows_slice(values=task, start=train_count, stop=len(task)),
+            get_rows_slice(values=target, start=0, stop=train_count),
+            get_rows_slice(values=target, start=train_count, stop=len(target)))
+
+
+def get_rows_slice(values: pd.DataFrame or list, start: int, stop: int) -> pd.DataFrame or list:
+    """
+    This method returns the slice of rows (DataFrame and Series are sliced without copying)
+    :param values: Rows of the sample
+    :param start: Index of the first row
+    :param stop: Index after the last row
+    """
+    if isinstance(values, (pd.DataFrame, pd.Series)):
+        return values.iloc[start:stop]
+    return values[start:stop]
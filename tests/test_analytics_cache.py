@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import RA.DataSet.DataSet as dataset_module
+from RA.DataSet.DataSet import DataSet
+
+
+@pytest.fixture
+def calculations(monkeypatch):
+    calls = []
+    calculate = dataset_module.calculate_column_stat
+
+    def counted(**kwargs):
+        calls.append(kwargs["column_name"])
+        return calculate(**kwargs)
+    monkeypatch.setattr(dataset_module, "calculate_column_stat", counted)
+    return calls
+
+
+def make_dataset(cache_folder: str, dataframe: pd.DataFrame) -> DataSet:
+    dataset = DataSet("cached")
+    dataset.set_analytics_cache(cache_folder)
+    dataset.load_DataFrame(dataframe)
+    return dataset
+
+
+def make_dataframe() -> pd.DataFrame:
+    random_state = np.random.RandomState(0)
+    return pd.DataFrame({"x": random_state.rand(1000), "s": random_state.choice(["a", "bb"], 1000)})
+
+
+def test_unchanged_columns_are_loaded_from_cache(tmp_path, calculations):
+    dataframe = make_dataframe()
+    first = make_dataset(str(tmp_path), dataframe)
+    expected = {key: first.get_column_stat(key, extended=True) for key in ["x", "s"]}
+    assert calculations == ["x", "s"]
+    assert len(os.listdir(tmp_path)) == 2
+
+    second = make_dataset(str(tmp_path), dataframe.copy())
+    for key in ["x", "s"]:
+        column_stat = second.get_column_stat(key, extended=True)
+        assert column_stat.count == expected[key].count
+        assert column_stat.unique_count == expected[key].unique_count
+        assert column_stat.get_values_distribution() == expected[key].get_values_distribution()
+    assert calculations == ["x", "s"]
+
+
+def test_changed_column_is_calculated_again(tmp_path, calculations):
+    dataframe = make_dataframe()
+    make_dataset(str(tmp_path), dataframe).get_column_stat("x", extended=False)
+    changed = dataframe.copy()
+    changed.loc[0, "x"] = 5.0
+    column_stat = make_dataset(str(tmp_path), changed).get_column_stat("x", extended=False)
+    assert calculations == ["x", "x"]
+    assert column_stat.max() == 5.0
+
+
+def test_simple_statistics_do_not_hit_extended_request(tmp_path, calculations):
+    dataframe = make_dataframe()
+    make_dataset(str(tmp_path), dataframe).get_column_stat("x", extended=False)
+    make_dataset(str(tmp_path), dataframe).get_column_stat("x", extended=True)
+    make_dataset(str(tmp_path), dataframe).get_column_stat("x", extended=False)
+    assert calculations == ["x", "x"]
+
+
+def test_broken_cache_file_is_a_miss(tmp_path, calculations):
+    dataframe = make_dataframe()
+    make_dataset(str(tmp_path), dataframe).get_column_stat("x", extended=False)
+    for filename in os.listdir(tmp_path):
+        with open(tmp_path / filename, "wb") as cache_file:
+            cache_file.write(b"broken")
+    assert make_dataset(str(tmp_path), dataframe).get_column_stat("x", extended=False).count == 1000
+    assert calculations == ["x", "x"]
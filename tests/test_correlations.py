@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from RA.DataSet.DataSet import DataSet
+from RA.DataSet.DataSetStat import calculate_correlations
+
+
+def make_values() -> np.ndarray:
+    random_state = np.random.RandomState(0)
+    base = random_state.normal(size=(500, 1))
+    return np.hstack([base + random_state.normal(scale=scale, size=(500, 1)) for scale in [0.1, 0.5, 1, 2, 5]] +
+                     [np.exp(base), -base, random_state.normal(size=(500, 1))])
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1000])
+def test_pearson_matches_corrcoef(block_size):
+    values = make_values()
+    result = calculate_correlations(values=values, method="pearson", block_size=block_size)
+    np.testing.assert_allclose(result, np.corrcoef(values, rowvar=False), atol=1e-12)
+
+
+@pytest.mark.parametrize("block_size", [2, 1000])
+def test_spearman_matches_scipy(block_size):
+    values = make_values()
+    result = calculate_correlations(values=values, method="spearman", block_size=block_size)
+    np.testing.assert_allclose(result, stats.spearmanr(values).correlation, atol=1e-12)
+
+
+def test_dataset_matrix_and_top_correlations():
+    values = make_values()
+    keys = [f"c{i}" for i in range(values.shape[1])]
+    dataframe = pd.DataFrame(values, columns=keys)
+    dataframe["text"] = "a"
+    dataset = DataSet("correlations")
+    dataset.load_DataFrame(dataframe)
+    correlations = dataset.get_correlations(block_size=3)
+
+    expected = dataframe[keys].corr()
+    for key_a in keys:
+        for key_b in keys:
+            assert correlations.get_corr(key_a, key_b) == pytest.approx(expected.loc[key_a, key_b], abs=1e-12)
+    assert correlations.is_cell_free("text", "c0")
+
+    pairs = [(a, b, expected.loc[a, b]) for i, a in enumerate(keys) for b in keys[i + 1:]]
+    pairs.sort(key=lambda pair: -abs(pair[2]))
+    top = correlations.get_top_correlations(count=5)
+    assert [(a, b) for a, b, _ in top] == [(a, b) for a, b, _ in pairs[:5]]
+    assert [value for _, _, value in top] == pytest.approx([value for _, _, value in pairs[:5]])
+    signed = correlations.get_top_correlations(count=3, absolute=False)
+    assert all(value > 0 for _, _, value in signed)
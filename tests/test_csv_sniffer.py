@@ -0,0 +1,30 @@
+import pytest
+import RA.DataSet.csv_sniffer as csv_sniffer
+from RA.DataSet.DataSet import DataSet
+
+
+def write_cp1251_csv(tmp_path) -> str:
+    path = str(tmp_path / "cities.csv")
+    with open(path, "wb") as csv_file:
+        csv_file.write("город,население\nМосква,13\nКазань,1\n".encode("cp1251"))
+    return path
+
+
+def test_sniffed_encoding_is_kept(tmp_path):
+    dataset = DataSet("cities")
+    with pytest.warns(UserWarning, match="cp1251"):
+        dataset.load_csv_dataset(write_cp1251_csv(tmp_path))
+    assert dataset.encoding == "cp1251"
+    assert dataset.delimiter == ","
+    assert dataset.get_DataFrame().columns.tolist() == ["город", "население"]
+
+
+def test_header_is_not_sniffed_with_explicit_delimiter(tmp_path, monkeypatch):
+    def sniff_header(*args, **kwargs):
+        raise AssertionError("The header must not be sniffed")
+    monkeypatch.setattr(csv_sniffer, "sniff_header", sniff_header)
+    dataset = DataSet("cities")
+    with pytest.warns(UserWarning):
+        dataset.load_csv_dataset(write_cp1251_csv(tmp_path), delimiter=",")
+    assert dataset.encoding == "cp1251"
+    assert dataset.get_DataFrame()["город"].tolist() == ["Москва", "Казань"]
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.DataSet import DataSet
+
+
+def make_dataset() -> (DataSet, pd.DataFrame):
+    random_state = np.random.RandomState(0)
+    dataframe = pd.DataFrame({"x": random_state.rand(200) * 10, "s": random_state.choice(["a", "bb", "ccc"], 200)})
+    dataset = DataSet("rows")
+    dataset.load_DataFrame(dataframe)
+    for key in dataframe.columns:
+        dataset.get_column_stat(key, extended=False)
+    return dataset, dataframe
+
+
+def assert_deleted(dataset: DataSet, expected: pd.DataFrame) -> None:
+    expected = expected.reset_index(drop=True)
+    assert dataset.get_DataFrame().equals(expected)
+    assert len(dataset) == len(expected)
+    assert dataset.get_column_stat("x", extended=False).count == len(expected)
+    assert dataset.get_column_stat("x", extended=False).mean() == pytest.approx(expected["x"].mean())
+    assert dataset.get_column_stat("s", extended=False).unique_count == expected["s"].nunique()
+
+
+@pytest.mark.parametrize("rows", [[0, 5, 5, 199], np.array([3, 1, 2]), pd.Series([10, 20])])
+def test_delete_by_indexes(rows):
+    dataset, dataframe = make_dataset()
+    dataset.delete_rows(rows)
+    assert_deleted(dataset, dataframe.drop(index=np.unique(np.asarray(rows))))
+
+
+def test_delete_by_mask():
+    dataset, dataframe = make_dataset()
+    mask = (dataframe["x"] > 5).to_numpy()
+    dataset.delete_rows(mask)
+    assert_deleted(dataset, dataframe[~mask])
+
+
+def test_delete_by_predicate():
+    dataset, dataframe = make_dataset()
+    dataset.delete_rows(lambda frame: frame["s"] == "bb")
+    assert_deleted(dataset, dataframe[dataframe["s"] != "bb"])
+
+
+def test_delete_nothing():
+    dataset, dataframe = make_dataset()
+    dataset.delete_rows([])
+    dataset.delete_rows(np.zeros(len(dataframe), dtype=bool))
+    assert_deleted(dataset, dataframe)
+
+
+@pytest.mark.parametrize("rows, message", [([200], "less than"),
+                                           ([-1], "greater than"),
+                                           (np.ones(10, dtype=bool), "same length"),
+                                           (["a"], "indexes of rows")])
+def test_invalid_rows(rows, message):
+    dataset, dataframe = make_dataset()
+    with pytest.raises(Exception, match=message):
+        dataset.delete_rows(rows)
+    assert_deleted(dataset, dataframe)
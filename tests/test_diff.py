@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.DataSet import DataSet
+
+
+def make_dataset(dataframe: pd.DataFrame, name: str) -> DataSet:
+    dataset = DataSet(name)
+    dataset.load_DataFrame(dataframe.copy())
+    return dataset
+
+
+def make_frame() -> pd.DataFrame:
+    return pd.DataFrame({"x": [1.0, np.nan, 3.0, np.nan, 5.0],
+                         "s": ["a", None, "c", "d", np.nan]}).astype({"s": object})
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 1000000])
+def test_equals_with_nan(block_size):
+    frame = make_frame()
+    assert frame.equals(make_frame())
+    assert make_dataset(frame, "a").equals(make_dataset(make_frame(), "b"), block_size=block_size)
+
+
+@pytest.mark.parametrize("row, column, value", [(1, "x", 2.0), (0, "x", np.nan), (1, "s", "b"), (4, "s", "e")])
+def test_equals_with_changed_value(row, column, value):
+    changed = make_frame()
+    changed.loc[row, column] = value
+    assert not make_frame().equals(changed)
+    assert not make_dataset(make_frame(), "a").equals(make_dataset(changed, "b"), block_size=2)
+
+
+@pytest.mark.parametrize("row_hash", [False, True])
+def test_diff_with_nan(row_hash):
+    changed = make_frame()
+    changed.loc[1, "x"] = 2.0
+    changed.loc[3, "x"] = 4.0
+    changed.loc[3, "s"] = "z"
+    dataset = make_dataset(make_frame(), "a")
+    assert dataset.diff(make_dataset(make_frame(), "b"), row_hash=row_hash)["rows"] in ({}, [])
+    rows = dataset.diff(make_dataset(changed, "b"), row_hash=row_hash)["rows"]
+    expected = (make_frame().fillna(-1) != changed.fillna(-1))
+    if row_hash:
+        assert rows == np.flatnonzero(expected.any(axis=1).to_numpy()).tolist()
+    else:
+        assert rows == {index: [column for column in expected.columns if expected.loc[index, column]]
+                        for index in np.flatnonzero(expected.any(axis=1).to_numpy())}
+
+
+def test_diff_of_lengths_and_columns():
+    frame = make_frame()
+    other = frame.drop(columns=["s"]).iloc[:3]
+    report = make_dataset(frame, "a").diff(make_dataset(other, "b"))
+    assert report["length"] == {"a": "5", "b": "3"}
+    assert report["columns"] == ["s"]
+    assert report["rows"] == {}
+    assert not make_dataset(frame, "a").equals(make_dataset(other, "b"))
@@ -0,0 +1,27 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.DataSet import DataSet
+from RA.DataSet.jobs_count import get_jobs_count
+
+
+def test_jobs_count():
+    assert get_jobs_count(n_jobs=3) == 3
+    assert get_jobs_count(n_jobs=-1) == os.cpu_count()
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2, 1.5, None])
+def test_invalid_jobs_count(n_jobs):
+    with pytest.raises(Exception, match="n_jobs"):
+        get_jobs_count(n_jobs=n_jobs)
+
+
+@pytest.mark.parametrize("columns", [["x"], ["x", "y"]])
+def test_columns_stat_checks_jobs_count(columns):
+    dataset = DataSet("jobs")
+    dataset.load_DataFrame(pd.DataFrame({key: np.arange(10.0) for key in columns}))
+    with pytest.raises(Exception, match="n_jobs"):
+        dataset.get_columns_stat(extended=False, n_jobs=0)
+    stats = dataset.get_columns_stat(extended=False, n_jobs=-1)
+    assert [stats[key].mean() for key in columns] == [4.5] * len(columns)
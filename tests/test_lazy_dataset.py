@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from RA.DataSet.DataSet import DataSet
+
+
+def load_lazy(tmp_path, rows: int = 1000) -> (DataSet, pd.DataFrame):
+    dataframe = pd.DataFrame({"a": np.arange(rows),
+                              "b": np.arange(rows) / 4,
+                              "s": np.random.RandomState(0).choice(["x", "yy"], rows)})
+    dataframe.to_csv(tmp_path / "lazy.csv", index=False)
+    dataset = DataSet("lazy")
+    dataset.load_csv_dataset(str(tmp_path / "lazy.csv"), delimiter=",", encoding="utf-8", lazy=True)
+    return dataset, dataframe
+
+
+def test_head_and_tail_do_not_read_lazy_columns(tmp_path):
+    dataset, dataframe = load_lazy(tmp_path)
+    head = dataset.head(2)
+    tail = dataset.tail(3)
+    assert dataset._DataSet__lazy_columns == ["a", "b", "s"]
+    assert isinstance(head, str) and isinstance(tail, str)
+    assert " 1 " in head and " 2 " not in head
+    assert " 997 " in tail and " 996 " not in tail
+
+    dataset.get_DataFrame(columns=["a"])
+    assert dataset.tail(3) == tail
+    assert dataset.head(2) == head
+
+
+def test_iter_batches_streams_lazy_columns(tmp_path):
+    dataset, dataframe = load_lazy(tmp_path)
+    batches = list(dataset.iter_batches(batch_size=300, columns=["b", "a"]))
+    assert [len(batch) for batch in batches] == [300, 300, 300, 100]
+    assert all(batch.flags["C_CONTIGUOUS"] for batch in batches)
+    assert np.array_equal(np.concatenate(batches), dataframe[["b", "a"]].to_numpy())
+    assert dataset._DataSet__lazy_columns == ["a", "b", "s"]
+
+
+def test_iter_batches_mixes_read_and_lazy_columns(tmp_path):
+    dataset, dataframe = load_lazy(tmp_path)
+    dataset.get_DataFrame(columns=["a"])
+    batches = list(dataset.iter_batches(batch_size=256, columns=["s", "a"], dtype=object))
+    assert np.array_equal(np.concatenate(batches), dataframe[["s", "a"]].to_numpy(dtype=object))
+    assert dataset._DataSet__lazy_columns == ["b", "s"]
+
+
+def test_iter_rows_of_lazy_dataset(tmp_path):
+    dataset, dataframe = load_lazy(tmp_path, rows=50)
+    rows = list(dataset.iter_rows(columns=["a", "s"], block_size=7))
+    assert rows == dataframe[["a", "s"]].to_dict(orient="records")
+    named = list(dataset.iter_rows(named=True, block_size=7))
+    assert [tuple(row) for row in named] == list(dataframe.itertuples(index=False, name=None))
+    assert named[3].s == dataframe["s"][3]
+    assert dataset._DataSet__lazy_columns == ["a", "b", "s"]
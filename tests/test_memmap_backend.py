@@ -0,0 +1,41 @@
+import gc
+import os
+import pandas as pd
+import pytest
+from RA.DataSet.DataSet import DataSet
+from RA.DataSet.column_memmap import is_memmap
+
+
+def write_mixed_csv(tmp_path) -> str:
+    path = str(tmp_path / "mixed.csv")
+    texts = [str(i) for i in range(30)] + ["text"] + [str(i) for i in range(10)]
+    pd.DataFrame({"x": texts, "y": range(len(texts))}).to_csv(path, index=False)
+    return path
+
+
+def test_chunked_load_keeps_column_with_text_in_memory(tmp_path):
+    path = write_mixed_csv(tmp_path)
+    expected = DataSet("expected")
+    expected.load_csv_dataset(path, delimiter=",", encoding="utf-8", chunk_size=8)
+
+    dataset = DataSet("mapped")
+    dataset.set_memmap_backend(str(tmp_path / "memmap"))
+    dataset.load_csv_dataset(path, delimiter=",", encoding="utf-8", chunk_size=8)
+    dataframe = dataset.get_DataFrame()
+    assert dataframe.equals(expected.get_DataFrame())
+    assert not is_memmap(dataframe["x"].to_numpy())
+    assert is_memmap(dataframe["y"].to_numpy())
+    assert len(os.listdir(tmp_path / "memmap")) == 1
+
+    del dataset, dataframe
+    gc.collect()
+    assert os.listdir(tmp_path / "memmap") == []
+
+
+def test_failed_chunked_load_deletes_files(tmp_path):
+    path = write_mixed_csv(tmp_path)
+    dataset = DataSet("failed")
+    dataset.set_memmap_backend(str(tmp_path / "memmap"))
+    with pytest.raises(Exception, match="takes more"):
+        dataset.load_csv_dataset(path, delimiter=",", encoding="utf-8", chunk_size=8, memory_limit=300)
+    assert os.listdir(tmp_path / "memmap") == []
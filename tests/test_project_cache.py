@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.DataSet import DataSet
+
+
+def make_dataframe() -> pd.DataFrame:
+    random_state = np.random.RandomState(0)
+    return pd.DataFrame({"i": np.arange(1000),
+                         "f": random_state.rand(1000) * 1000,
+                         "s": random_state.choice(["a", "bb", "ccc"], 1000)})
+
+
+@pytest.mark.parametrize("file_format", ["csv", "columnar"])
+def test_statistics_are_restored_on_reload(tmp_path, file_format):
+    dataframe = make_dataframe()
+    dataset = DataSet("project")
+    dataset.load_DataFrame(dataframe)
+    dataset.set_saving_path(str(tmp_path))
+    dataset.export(including_json=True, file_format=file_format)
+
+    loaded = DataSet("loaded")
+    loaded.load_dataset_project(str(tmp_path / "project"), "project.json")
+    assert loaded.get_DataFrame().equals(dataframe)
+    assert sorted(loaded._DataSet__dataset_analytics) == ["f", "i", "s"]
+    assert loaded.get_column_stat("f", extended=False).mean() == pytest.approx(dataframe["f"].mean())
+
+
+def test_statistics_are_recalculated_after_change(tmp_path):
+    dataframe = make_dataframe()
+    dataset = DataSet("project")
+    dataset.load_DataFrame(dataframe)
+    dataset.set_saving_path(str(tmp_path))
+    dataset.export(including_json=True)
+    changed = dataframe.copy()
+    changed.loc[0, "f"] = 1e6
+    changed.to_csv(tmp_path / "project" / "project.csv", index=False)
+
+    loaded = DataSet("loaded")
+    loaded.load_dataset_project(str(tmp_path / "project"), "project.json")
+    assert sorted(loaded._DataSet__dataset_analytics) == ["i", "s"]
+    assert loaded.get_column_stat("f", extended=False).max() == 1e6
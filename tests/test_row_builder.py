@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+from RA.DataSet.DataSet import DataSet
+from RA.DataSet.row_builder import RowBuilder
+
+
+def make_rows(count: int) -> list:
+    return [{"x": float(i), "s": f"v{i % 3}"} for i in range(count)]
+
+
+def test_flush_by_blocks():
+    blocks = []
+    with RowBuilder(flush=blocks.append, block_size=4) as builder:
+        for new_row in make_rows(10):
+            builder.add_row(new_row)
+        assert [len(block) for block in blocks] == [4, 4]
+        assert len(builder) == 2
+    assert [len(block) for block in blocks] == [4, 4, 2]
+    assert pd.concat(blocks, ignore_index=True).equals(pd.DataFrame(make_rows(10)))
+
+
+def test_no_flush_after_exception():
+    blocks = []
+    with pytest.raises(ValueError):
+        with RowBuilder(flush=blocks.append, block_size=4) as builder:
+            for new_row in make_rows(6):
+                builder.add_row(new_row)
+            raise ValueError()
+    assert [len(block) for block in blocks] == [4]
+
+
+def test_empty_flush():
+    blocks = []
+    builder = RowBuilder(flush=blocks.append, columns_names=["x"])
+    builder.flush()
+    assert blocks == []
+
+
+@pytest.mark.parametrize("new_row, message", [({"x": 1.0, "s": "a", "y": 2}, "does not exist"),
+                                              ({"x": 1.0}, "is missing")])
+def test_invalid_row(new_row, message):
+    builder = RowBuilder(flush=lambda block: None, columns_names=["x", "s"])
+    with pytest.raises(Exception, match=message):
+        builder.add_row(new_row)
+    assert len(builder) == 0
+
+
+@pytest.mark.parametrize("block_size", [0, -1, 1.5])
+def test_invalid_block_size(block_size):
+    with pytest.raises(Exception, match="block_size"):
+        RowBuilder(flush=lambda block: None, block_size=block_size)
+
+
+def test_repeated_columns():
+    with pytest.raises(Exception, match="repeated"):
+        RowBuilder(flush=lambda block: None, columns_names=["x", "x"])
+
+
+def test_dataset_add_rows():
+    rows = make_rows(25)
+    dataset = DataSet("rows")
+    dataset.load_DataFrame(pd.DataFrame(rows[:5]))
+    dataset.get_column_stat("x", extended=False)
+    dataset.add_rows(rows[5:20], block_size=7)
+    with dataset.row_builder(block_size=3) as builder:
+        for new_row in rows[20:]:
+            builder.add_row(new_row)
+    expected = pd.DataFrame(rows)
+    assert dataset.get_DataFrame().equals(expected)
+    assert len(dataset) == len(expected)
+    assert dataset.get_column_stat("x", extended=False).mean() == pytest.approx(expected["x"].mean())
+
+
+def test_dataset_row_builder_checks_columns():
+    dataset = DataSet("rows")
+    dataset.load_DataFrame(pd.DataFrame(make_rows(5)))
+    with pytest.raises(Exception, match="does not exist"):
+        dataset.add_rows([{"x": 1.0, "s": "a", "y": 2}])
+    assert len(dataset) == 5
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.ColumnNumStat import ColumnNumStat
+from RA.DataSet.DataSet import DataSet
+
+
+def assert_matches(column_stat: ColumnNumStat, values: pd.Series) -> None:
+    filled = values.fillna(0)  # NaN values are counted as 0 by the statistics
+    assert column_stat.count == len(values)
+    assert column_stat.nan_count == int(values.isna().sum())
+    assert column_stat.mean() == pytest.approx(filled.mean(), rel=1e-9)
+    assert column_stat.var() == pytest.approx(filled.var(ddof=0), rel=1e-9)
+    assert column_stat.min() == filled.min()
+    assert column_stat.max() == filled.max()
+    assert column_stat.median() == filled.median()
+    assert column_stat.unique_count == values.nunique(dropna=False)
+
+
+def test_running_update_by_added_and_removed_values():
+    random_state = np.random.RandomState(0)
+    values = pd.Series(random_state.normal(1e6, 3, 5000))
+    values[::50] = np.nan
+    column_stat = ColumnNumStat(column_name="x", values=values, extended=False)
+
+    added = pd.Series(random_state.normal(1e6, 3, 700))
+    values = pd.concat([values, added], ignore_index=True)
+    column_stat.update(values=values, added=added)
+    assert_matches(column_stat=column_stat, values=values)
+
+    removed = values.iloc[100:1300]
+    values = values.drop(index=removed.index).reset_index(drop=True)
+    column_stat.update(values=values, removed=removed)
+    assert_matches(column_stat=column_stat, values=values)
+
+
+def test_removal_of_all_values():
+    values = pd.Series([1.0, 2.0, 3.0])
+    column_stat = ColumnNumStat(column_name="x", values=values, extended=False)
+    column_stat.update(values=values.iloc[:0], removed=values)
+    assert column_stat.count == 0
+    assert np.isnan(column_stat.mean())
+
+
+def test_statistics_follow_dataset_mutations():
+    random_state = np.random.RandomState(1)
+    dataframe = pd.DataFrame({"x": random_state.rand(300) * 100, "y": random_state.randint(0, 50, 300)})
+    dataset = DataSet("mutated")
+    dataset.load_DataFrame(dataframe)
+    for key in ["x", "y"]:
+        dataset.get_column_stat(key, extended=False)
+
+    dataset.add_row({"x": 1000.0, "y": -7})
+    dataset.set_to_field("x", 5, 0.5)
+    dataset.set_to_field("y", 6, 49)
+    dataset.delete_row(0)
+    dataset.add_rows([{"x": float(i), "y": i} for i in range(20)])
+    dataset.delete_rows(lambda frame: frame["y"] > 40)
+
+    result = dataset.get_DataFrame()
+    for key in ["x", "y"]:
+        assert_matches(column_stat=dataset.get_column_stat(key, extended=False), values=result[key])
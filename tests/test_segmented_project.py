@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+from RA.DataSet.DataSet import DataSet
+
+
+def test_statistics_after_append_and_reload(tmp_path):
+    dataframe = pd.DataFrame({"number": np.arange(1000),
+                              "text": np.random.RandomState(0).choice(["a", "bb", "ccc"], 1000)})
+    dataset = DataSet("segmented")
+    dataset.load_DataFrame(dataframe)
+    dataset.set_saving_path(str(tmp_path))
+    dataset.export(file_format="segmented", including_json=True)
+    new_rows = pd.DataFrame({"number": [5000, 5001], "text": ["dddd", "a"]})
+    DataSet.append_to_dataset_project(str(tmp_path / "segmented"), "segmented.json", new_rows)
+    full = pd.concat([dataframe, new_rows], ignore_index=True)
+
+    loaded = DataSet("loaded")
+    loaded.load_dataset_project(str(tmp_path / "segmented"), "segmented.json")
+    assert loaded.get_DataFrame()["number"].tolist() == full["number"].tolist()
+
+    number_stat = loaded.get_column_stat("number", extended=True)
+    assert number_stat.count == len(full)
+    assert number_stat.mean() == full["number"].mean()
+    assert number_stat.median() == full["number"].median()
+    assert number_stat.unique_count == full["number"].nunique()
+    assert number_stat.dtype == "variable"
+    assert number_stat.max() == 5001
+    assert number_stat.get_math_mode() == 0
+
+    text_stat = loaded.get_column_stat("text", extended=True)
+    assert text_stat.unique_count == 4
+    assert text_stat.dtype == "categorical"
+    assert text_stat.max() == 4
+    assert sum(text_stat.get_values_distribution().values()) == len(full)
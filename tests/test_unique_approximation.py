@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.ColumnStrStat import ColumnStrStat
+from RA.DataSet.DataSet import DataSet
+from RA.DataSet.HyperLogLog import HyperLogLog
+
+
+@pytest.mark.parametrize("unique_count", [10, 1000, 200000])
+def test_hyperloglog_is_within_error_bound(unique_count):
+    counter = HyperLogLog(error=0.01)
+    values = np.random.RandomState(0).permutation(np.repeat(np.arange(unique_count), 3))
+    counter.add([f"value_{value}" for value in values])
+    assert abs(counter.count() - unique_count) <= 3 * 0.01 * unique_count + 1
+
+
+def test_merged_counters_count_the_union():
+    left, right, union = HyperLogLog(error=0.02), HyperLogLog(error=0.02), HyperLogLog(error=0.02)
+    left.add(np.arange(0, 60000))
+    right.add(np.arange(40000, 100000))
+    union.add(np.arange(0, 100000))
+    left.merge(right)
+    assert left.count() == union.count()
+    with pytest.raises(Exception):
+        left.merge(HyperLogLog(error=0.01))
+
+
+def test_unique_count_is_exact_below_threshold():
+    values = pd.Series([f"v{i % 700}" for i in range(5000)])
+    column_stat = ColumnStrStat(column_name="s", values=values, extended=False, unique_threshold=10000)
+    assert column_stat.is_unique_exact
+    assert column_stat.unique_count == values.nunique()
+
+
+def test_unique_count_is_approximate_above_threshold():
+    values = pd.Series([f"v{i % 30000}" for i in range(90000)])
+    column_stat = ColumnStrStat(column_name="s", values=values, extended=False,
+                                unique_threshold=1000, unique_error=0.01)
+    assert not column_stat.is_unique_exact
+    assert column_stat.unique_count == pytest.approx(values.nunique(), rel=0.03)
+
+
+def test_dataset_unique_approximation():
+    dataframe = pd.DataFrame({"s": [f"v{i % 20000}" for i in range(40000)]})
+    dataset = DataSet("approximate")
+    dataset.set_unique_approximation(threshold=1000, error=0.01)
+    dataset.load_DataFrame(dataframe)
+    column_stat = dataset.get_column_stat("s", extended=False)
+    assert not column_stat.is_unique_exact
+    assert column_stat.unique_count == pytest.approx(20000, rel=0.03)
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+from RA.DataSet.ColumnNumStat import ColumnNumStat
+from RA.DataSet.ColumnNumStatExt import NumericalStatistics
+
+
+def test_exact_distribution_of_integers():
+    values = pd.Series(np.random.RandomState(0).randint(0, 20, 5000))
+    column_stat = ColumnNumStat(column_name="x", values=values, extended=True)
+    expected = values.value_counts(normalize=True)
+    distribution = column_stat.get_values_distribution()
+    assert distribution == pytest.approx(expected.to_dict())
+    assert column_stat.get_math_mode() == expected.idxmax()
+    assert column_stat.get_math_expectation() == pytest.approx(values.mean())
+    assert column_stat.get_math_sigma() == pytest.approx(values.std(ddof=0))
+
+
+def test_binned_distribution_of_many_floats():
+    values = pd.Series(np.random.RandomState(1).normal(0, 1, 20000))
+    values[::100] = np.nan
+    column_stat = ColumnNumStat(column_name="x", values=values, extended=True)
+    filled = values.fillna(0).to_numpy()
+    counts, edges = np.histogram(filled, bins=NumericalStatistics.DISTRIBUTION_BINS)
+    distribution = column_stat.get_values_distribution()
+    assert list(distribution.keys()) == pytest.approx(((edges[:-1] + edges[1:]) / 2).tolist())
+    assert list(distribution.values()) == pytest.approx((counts / len(filled)).tolist())
+    assert sum(distribution.values()) == pytest.approx(1.0)
+
+
+def test_explicit_count_of_bins():
+    values = pd.Series(np.arange(1000))
+    column_stat = ColumnNumStat(column_name="x", values=values, extended=True, bins=4)
+    assert list(column_stat.get_values_distribution().values()) == pytest.approx([0.25, 0.25, 0.25, 0.25])
+
+
+def test_few_unique_floats_are_not_binned():
+    values = pd.Series(np.random.RandomState(2).choice([0.5, 1.25, 7.0], 3000))
+    column_stat = ColumnNumStat(column_name="x", values=values, extended=True)
+    assert column_stat.get_values_distribution() == pytest.approx(values.value_counts(normalize=True).to_dict())